@@ -0,0 +1,92 @@
+"""블록별 딕셔너리 추출(extract_fields 방식)과 열 단위 추출(extract_columns)의 속도를 비교하는 벤치마크.
+
+실행:
+    poetry run python benchmarks/bench_crawl_columns.py --blocks 20000
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from n3xt_crawler_py.data_parser.crawl_field_column import CrawlFieldColumn
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+BLOCK_XPATH = "//tr[@class='row']"
+FIELDS_MAP = {
+    "name": "./td[1]/text()",
+    "link": "./td[2]/a/@href",
+    "price": ".//span[@class='price']/text()",
+    "tags": ".//li/text()",
+}
+
+
+def make_html(blocks: int) -> str:
+    rows = "".join(
+        f"<tr class='row'><td>name {i}</td><td><a href='/item/{i}'>more</a></td>"
+        f"<td><span class='price'>{i}.00</span><ul><li>a</li><li>b</li></ul></td></tr>"
+        for i in range(blocks)
+    )
+    return f"<html><body><table>{rows}</table></body></html>"
+
+
+def extract_rows(parser: CrawlParser) -> int:
+    """블록 × 필드 반복으로 블록별 딕셔너리를 만드는 방식."""
+    field_xpaths = {tag: CrawlXpath(x) for tag, x in FIELDS_MAP.items()}
+    rows = [
+        {tag: parser.extract_field(block, x) for tag, x in field_xpaths.items()}
+        for block in parser.get_blocks(CrawlXpath(BLOCK_XPATH))
+    ]
+    return len(rows)
+
+
+def extract_columns(parser: CrawlParser) -> int:
+    """필드마다 전체 블록을 순회해 열을 만드는 방식."""
+    field_xpaths = {tag: CrawlXpath(x) for tag, x in FIELDS_MAP.items()}
+    columns = parser.extract_columns(CrawlXpath(BLOCK_XPATH), field_xpaths)
+    return len(columns["name"])
+
+
+def extract_array_columns(parser: CrawlParser) -> int:
+    """열 단위 추출 후 오프셋 배열 기반 열로 변환하는 방식."""
+    field_xpaths = {tag: CrawlXpath(x) for tag, x in FIELDS_MAP.items()}
+    columns = parser.extract_columns(CrawlXpath(BLOCK_XPATH), field_xpaths)
+    arrays = {tag: CrawlFieldColumn.from_lists(rows) for tag, rows in columns.items()}
+    return len(arrays["name"])
+
+
+def run(blocks: int = 20000, repeat: int = 3) -> Dict[str, float]:
+    """세 방식의 최소 실행 시간을 측정합니다.
+
+    Returns:
+        Dict[str, float]: 방식별 실행 시간(초)과 속도 향상 배율.
+    """
+    parser = CrawlParser(make_html(blocks), CrawlParseMode.HTML)
+
+    timings = {}
+    for name, func in (
+        ("rows_s", extract_rows),
+        ("columns_s", extract_columns),
+        ("array_columns_s", extract_array_columns),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(parser)
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best
+
+    timings["speedup"] = timings["rows_s"] / timings["columns_s"]
+    return timings
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--blocks", type=int, default=20000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    result = run(args.blocks, args.repeat)
+    print(f"blocks={args.blocks} fields={len(FIELDS_MAP)}")
+    for key, value in result.items():
+        print(f"{key}: {value:.4f}")
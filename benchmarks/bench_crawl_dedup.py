@@ -0,0 +1,73 @@
+"""CrawlDedupIndex의 추가(filter_new)와 조회 속도를 측정하는 벤치마크.
+
+실행:
+    poetry run python benchmarks/bench_crawl_dedup.py --records 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict
+
+from n3xt_crawler_py.data_processor.crawl_dedup_index import CrawlDedupIndex
+
+
+def make_records(start: int, stop: int):
+    return (
+        {"title": [f"title {i}"], "link": [f"https://example.com/item/{i}"]}
+        for i in range(start, stop)
+    )
+
+
+def run(records: int = 1_000_000, lookups: int = 100_000) -> Dict[str, float]:
+    """새 레코드 추가, 중복 레코드 필터링, 단건 조회 시간을 측정합니다.
+
+    Returns:
+        Dict[str, float]: 단계별 처리 속도와 색인 파일 크기.
+    """
+    with tempfile.TemporaryDirectory() as dir_path:
+        db_path = os.path.join(dir_path, "seen.db")
+        with CrawlDedupIndex(db_path) as index:
+            started = time.perf_counter()
+            added = sum(1 for _ in index.filter_new(make_records(0, records)))
+            insert_s = time.perf_counter() - started
+
+            # 절반은 이미 본 레코드, 절반은 새 레코드
+            started = time.perf_counter()
+            fresh = sum(
+                1
+                for _ in index.filter_new(
+                    make_records(records - lookups // 2, records + lookups // 2)
+                )
+            )
+            filter_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            hits = sum(1 for r in make_records(0, lookups) if r in index)
+            contains_s = time.perf_counter() - started
+
+            assert added == records and fresh == lookups // 2 and hits == lookups
+
+        db_mib = sum(
+            os.path.getsize(os.path.join(dir_path, name)) for name in os.listdir(dir_path)
+        ) / (1024 * 1024)
+
+    return {
+        "insert_records_per_s": records / insert_s,
+        "filter_records_per_s": lookups / filter_s,
+        "contains_us": contains_s / lookups * 1e6,
+        "index_mib": db_mib,
+    }
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--records", type=int, default=1_000_000)
+    arg_parser.add_argument("--lookups", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    result = run(args.records, args.lookups)
+    print(f"records={args.records} lookups={args.lookups}")
+    for key, value in result.items():
+        print(f"{key}: {value:.2f}")
@@ -0,0 +1,102 @@
+"""필드 추출기별(XPath, 빠른 경로, CSS, 정규식) 추출 속도를 비교하는 벤치마크.
+
+같은 필드를 기존 XPath 평가와 각 추출기로 추출해 결과가 같은지 확인한 뒤,
+블록 선택을 제외한 필드 평가 시간만 비교합니다.
+CSS 선택자 측정에는 cssselect가 필요하며, 없으면 건너뜁니다.
+
+실행:
+    poetry run python benchmarks/bench_crawl_extractors.py --blocks 20000
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from n3xt_crawler_py.data_parser.crawl_field_extractor import (
+    CrawlCssSelector,
+    CrawlFieldExtractor,
+    CrawlRegexField,
+    to_field_extractor,
+)
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+BLOCK_XPATH = "//div[@class='item']"
+XPATH_FIELDS = {
+    "title": "./h2/text()",
+    "link": "./a/@href",
+    "price": "./span[@class='price']/text()",
+}
+
+
+def make_html(blocks: int) -> str:
+    items = "".join(
+        f"<div class='item'><h2>title {i}</h2><a href='/item/{i}'>more</a>"
+        f"<span class='price'>USD {i}.00</span><ul><li>a</li><li>b</li></ul></div>"
+        for i in range(blocks)
+    )
+    return f"<html><body>{items}</body></html>"
+
+
+def best_of(repeat: int, extractor: CrawlFieldExtractor, blocks: List) -> float:
+    """블록 전체에 추출기를 적용하는 시간의 최소값(초). 블록 선택 시간은 제외."""
+    compiled = extractor.compiled
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for block in blocks:
+            compiled(block)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(blocks: int = 20000, repeat: int = 5) -> Dict[str, float]:
+    """필드별로 XPath 엔진 평가와 각 추출기의 최소 실행 시간을 측정합니다.
+
+    모든 추출기는 측정 전에 XPath와 같은 결과를 내는지 확인합니다.
+
+    Returns:
+        Dict[str, float]: `<필드>.<방식>_s` 실행 시간(초)과 `<필드>.<방식>_speedup` 배율.
+    """
+    parser = CrawlParser(make_html(blocks), CrawlParseMode.HTML)
+    elements = parser.get_blocks(CrawlXpath(BLOCK_XPATH))
+
+    candidates: Dict[str, Dict[str, CrawlFieldExtractor]] = {}
+    for tag, xpath in XPATH_FIELDS.items():
+        candidates[tag] = {"fast_path": to_field_extractor(xpath)}
+    candidates["price"]["regex"] = CrawlRegexField(
+        r"USD \d+\.\d{2}", source="./span/text()"
+    )
+    try:
+        candidates["title"]["css"] = CrawlCssSelector("h2")
+        candidates["link"]["css"] = CrawlCssSelector("a", attr="href")
+        candidates["price"]["css"] = CrawlCssSelector("span.price")
+    except ImportError:
+        pass  # cssselect 미설치
+
+    timings: Dict[str, float] = {}
+    for tag, xpath in XPATH_FIELDS.items():
+        reference = CrawlXpath(xpath)
+        expected = [reference.compiled(block) for block in elements]
+        xpath_s = best_of(repeat, reference, elements)
+        timings[f"{tag}.xpath_s"] = xpath_s
+
+        for name, extractor in candidates[tag].items():
+            if isinstance(extractor, CrawlXpath):
+                continue  # 빠른 경로로 처리할 수 없는 XPath
+            assert [extractor.compiled(block) for block in elements] == expected
+            timings[f"{tag}.{name}_s"] = best_of(repeat, extractor, elements)
+            timings[f"{tag}.{name}_speedup"] = xpath_s / timings[f"{tag}.{name}_s"]
+    return timings
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--blocks", type=int, default=20000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    result = run(args.blocks, args.repeat)
+    print(f"blocks={args.blocks} fields={len(XPATH_FIELDS)}")
+    for key, value in result.items():
+        print(f"{key}: {value:.4f}")
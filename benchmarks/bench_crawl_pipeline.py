@@ -0,0 +1,304 @@
+"""요청(fetch), 재생(replay), 파싱(parse), 필드 추출(extract), 후처리(process) 단계별 처리량 벤치마크.
+
+로컬 HTTP 서버와 재생 아카이브만 사용하므로 네트워크 없이 반복 측정할 수 있으며,
+결과는 JSON으로 저장해 이전 결과와 비교(회귀 검사)할 수 있습니다.
+
+실행:
+    poetry run python benchmarks/bench_crawl_pipeline.py --sizes 100 1000 10000 --output bench.json
+    poetry run python benchmarks/bench_crawl_pipeline.py --compare bench.json --tolerance 0.2
+
+예제 사이트 응답 기록 (네트워크 필요, TOR 예제는 Tor 실행 필요) 후 벤치마크에 포함:
+    poetry run python benchmarks/bench_crawl_pipeline.py --record-examples data/examples.rpl
+    poetry run python benchmarks/bench_crawl_pipeline.py --archive data/examples.rpl
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import lxml
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.data_processor.crawl_data_process_manager import (
+    CrawlDataProcessManager,
+    ICrawlDataProcessor,
+)
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import (
+    CrawlReplayArchive,
+    CrawlReplayMode,
+)
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+
+BLOCK_XPATH = "//div[@class='item']"
+FIELDS_MAP = {
+    "title": "./h2/text()",
+    "link": "./a/@href",
+    "price": ".//span[@class='price']/text()",
+    "tags": ".//li/text()",
+}
+
+# 예제 스크립트(examples/)의 대상: URL -> (요청 모드, 파싱 모드, 블록 XPath, 필드 맵)
+EXAMPLE_SITES: Dict[str, Tuple[CrawlRequestMode, CrawlParseMode, str, Dict[str, str]]] = {
+    "https://example.com": (
+        CrawlRequestMode.DEFAULT,
+        CrawlParseMode.HTML,
+        "/html/body/div/p",
+        {"text": ".//text()"},
+    ),
+    "https://www.ransomware.live/rss.xml": (
+        CrawlRequestMode.TOR,
+        CrawlParseMode.XML,
+        "//item",
+        {"title": ".//title/text()"},
+    ),
+}
+
+
+def make_html(blocks: int) -> bytes:
+    items = "".join(
+        f"<div class='item'><h2>title {i}</h2><a href='/item/{i}'>more</a>"
+        f"<span class='price'>{i}.00</span><ul><li>a</li><li>b</li></ul></div>"
+        for i in range(blocks)
+    )
+    return f"<html><body>{items}</body></html>".encode("utf-8")
+
+
+class PriceProcessor(ICrawlDataProcessor):
+    def run(self, data: Dict) -> Tuple[str, float]:
+        return "price", float(data["price"][0]) if data["price"] else 0.0
+
+    def get_unique_id(self) -> str:
+        return "price"
+
+
+class TitleProcessor(ICrawlDataProcessor):
+    def run(self, data: Dict) -> Tuple[str, str]:
+        return "title", " ".join(data["title"]).strip().lower()
+
+    def get_unique_id(self) -> str:
+        return "title"
+
+
+def start_server(pages: Dict[str, bytes]) -> ThreadingHTTPServer:
+    """경로별 고정 본문을 반환하는 로컬 HTTP 서버를 시작."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 보내므로 Nagle + 지연 ACK로 작은 응답이 40ms씩 늦어지는 것을 방지
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = pages.get(self.path, b"")
+            self.send_response(200 if self.path in pages else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """repeat번 실행한 최소 시간(초)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_document(
+    url: str,
+    archive: CrawlReplayArchive,
+    parse_mode: CrawlParseMode,
+    block_xpath: str,
+    fields_map: Dict[str, str],
+    repeat: int,
+) -> Dict[str, float]:
+    """재생 아카이브의 문서 하나로 replay/parse/extract/process 단계를 측정."""
+    body = archive.get(url).get_bytes()
+    records = CrawlClient(
+        url, CrawlRequestMode.DEFAULT, parse_mode, replay=archive
+    ).extract_fields(block_xpath, fields_map)
+
+    processors = [
+        p for p in (TitleProcessor(), PriceProcessor()) if p.get_unique_id() in fields_map
+    ]
+    manager = CrawlDataProcessManager()
+    for processor in processors:
+        manager.add(processor)
+
+    result = {
+        "bytes": float(len(body)),
+        "blocks": float(len(records)),
+        "replay_s": best_of(
+            repeat, lambda: CrawlRequester(CrawlUrl(url), replay=archive)
+        ),
+        "parse_s": best_of(repeat, lambda: CrawlParser(body, parse_mode, "utf-8")),
+        "extract_s": best_of(
+            repeat,
+            lambda: CrawlClient(
+                url, CrawlRequestMode.DEFAULT, parse_mode, replay=archive
+            ).extract_fields(block_xpath, fields_map),
+        ),
+    }
+    if records and processors:
+        result["process_s"] = best_of(
+            repeat, lambda: sum(1 for _ in manager.run_batch(records))
+        )
+    return result
+
+
+def run(
+    sizes: List[int] = (100, 1000, 10000),
+    repeat: int = 3,
+    fetches: int = 50,
+    archive_path: Optional[str] = None,
+) -> Dict[str, float]:
+    """문서 크기(블록 수)별로 단계별 시간을 측정합니다.
+
+    Returns:
+        Dict[str, float]: `<단계>.<크기>` 형식의 키와 측정값.
+            *_s는 최소 실행 시간(초), *_per_s는 초당 처리량.
+    """
+    pages = {f"/list{size}.html": make_html(size) for size in sizes}
+    results: Dict[str, float] = {}
+
+    server = start_server(pages)
+    try:
+        with tempfile.TemporaryDirectory() as dir_path:
+            archive_file = os.path.join(dir_path, "bench.rpl")
+            host, port = server.server_address[:2]
+            urls = {size: f"http://{host}:{port}/list{size}.html" for size in sizes}
+
+            session_pool = CrawlSessionPool()
+            with CrawlReplayArchive(archive_file, CrawlReplayMode.RECORD) as recorder:
+                for size, url in urls.items():
+                    CrawlRequester(CrawlUrl(url), replay=recorder)
+
+                    def fetch_all(url=url):
+                        for _ in range(fetches):
+                            CrawlRequester(CrawlUrl(url), session_pool=session_pool)
+
+                    fetch_s = best_of(repeat, fetch_all)
+                    results[f"fetch.{size}.req_per_s"] = fetches / fetch_s
+                    results[f"fetch.{size}.mib_per_s"] = (
+                        fetches * len(pages[f"/list{size}.html"]) / fetch_s / 2**20
+                    )
+
+            with CrawlReplayArchive(archive_file) as archive:
+                for size, url in urls.items():
+                    measured = bench_document(
+                        url, archive, CrawlParseMode.HTML, BLOCK_XPATH, FIELDS_MAP, repeat
+                    )
+                    for key in ("replay_s", "parse_s", "extract_s", "process_s"):
+                        results[f"{key[:-2]}.{size}.s"] = measured[key]
+                    results[f"extract.{size}.blocks_per_s"] = (
+                        measured["blocks"] / measured["extract_s"]
+                    )
+                    results[f"process.{size}.records_per_s"] = (
+                        measured["blocks"] / measured["process_s"]
+                    )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if archive_path is not None:
+        with CrawlReplayArchive(archive_path) as archive:
+            for url in archive.get_urls():
+                if url not in EXAMPLE_SITES:
+                    continue
+                _, parse_mode, block_xpath, fields_map = EXAMPLE_SITES[url]
+                measured = bench_document(
+                    url, archive, parse_mode, block_xpath, fields_map, repeat
+                )
+                name = url.split("//", 1)[-1]
+                for key in ("replay_s", "parse_s", "extract_s"):
+                    results[f"{key[:-2]}.{name}.s"] = measured[key]
+
+    return results
+
+
+def record_examples(archive_path: str) -> None:
+    """예제 사이트 응답을 재생 아카이브에 기록 (실패한 사이트는 건너뜀)."""
+    with CrawlReplayArchive(archive_path, CrawlReplayMode.RECORD) as archive:
+        for url, (req_mode, *_) in EXAMPLE_SITES.items():
+            try:
+                CrawlRequester(CrawlUrl(url), req_mode, replay=archive)
+                print(f"recorded: {url}")
+            except Exception as e:
+                print(f"skipped: {url} ({e})")
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> List[str]:
+    """기준 결과보다 tolerance 이상 나빠진 항목 목록 (시간은 클수록, 처리량은 작을수록 나쁨)."""
+    regressions = []
+    for key, value in results.items():
+        base = baseline.get(key)
+        if not base or not value:
+            continue
+        ratio = value / base if key.endswith("_per_s") else base / value
+        if ratio < 1 - tolerance:
+            regressions.append(f"{key}: {base:.4g} -> {value:.4g} ({ratio:.2f}x)")
+    return regressions
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--fetches", type=int, default=50)
+    arg_parser.add_argument("--archive", help="예제 사이트를 기록한 재생 아카이브")
+    arg_parser.add_argument("--record-examples", metavar="ARCHIVE")
+    arg_parser.add_argument("--output", help="결과 JSON 저장 경로")
+    arg_parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    arg_parser.add_argument("--tolerance", type=float, default=0.2)
+    args = arg_parser.parse_args()
+
+    if args.record_examples:
+        record_examples(args.record_examples)
+        sys.exit(0)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "lxml": lxml.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+        },
+        "results": run(args.sizes, args.repeat, args.fetches, args.archive),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
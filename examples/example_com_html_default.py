@@ -7,7 +7,7 @@ from n3xt_crawler_py.data_processor.crawl_data_process_manager import (
 from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
 from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
 from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
-from n3xt_crawler_py.utils.crawl_save import save_dict_list_as_file
+from n3xt_crawler_py.utils.crawl_writer import CrawlJsonlEncoder, CrawlRecordWriter
 
 
 # 데이터 후처리기 정의: 'title' 항목만 추출
@@ -53,8 +53,10 @@ for raw_data in extracted:
     processed_data = processor_manager.run_all(raw_data)  # {"text": "..."}
     example_com.append(processed_data)
 
-# 결과 데이터를 파일로 저장
-file_name = save_dict_list_as_file(example_com, "data/example")
+# 결과를 JSONL 파일로 저장 (종료 시 원자적으로 완성되며, 같은 초에 저장해도 이름이 겹치지 않음)
+with CrawlRecordWriter("data/example", CrawlJsonlEncoder()) as writer:
+    writer.write_many(example_com)
 
-# 완료 메시지 출력
-print(f"'{file_name}' saved")
+# 저장 완료 메시지 출력
+for file_name in writer.get_paths():
+    print(f"'{file_name}' saved")
@@ -7,8 +7,9 @@ from n3xt_crawler_py.data_processor.crawl_data_process_manager import (
 )
 from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
 from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
 from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
-from n3xt_crawler_py.utils.crawl_save import save_dict_list_as_file
+from n3xt_crawler_py.utils.crawl_writer import CrawlJsonlEncoder, CrawlRecordWriter
 
 
 # 데이터 후처리기 정의: RSS title 필드만 추출
@@ -32,9 +33,12 @@ class RsTitleProcessor(ICrawlDataProcessor):
         return self.__unique_id
 
 
-# 크롤링 클라이언트 생성
+# 크롤링 클라이언트 생성 (주기적으로 재수집하므로 변경 없는 피드는 캐시에서 제공)
 client = CrawlClient(
-    "https://www.ransomware.live/rss.xml", CrawlRequestMode.TOR, CrawlParseMode.XML
+    "https://www.ransomware.live/rss.xml",
+    CrawlRequestMode.TOR,
+    CrawlParseMode.XML,
+    cache=CrawlResponseCache("data/cache/ransome", ttl=300),
 )
 
 # 필드 추출
@@ -49,14 +53,11 @@ extracted = client.extract_fields(
 process_manager = CrawlDataProcessManager()
 process_manager.add(RsTitleProcessor(unique_id="title"))
 
-# 파싱된 데이터에 후처리기 적용
-ransomeware_live = []
-for raw_data in extracted:
-    processed_data = process_manager.run_all(raw_data)  # title 필드 가공
-    ransomeware_live.append(processed_data)
-
-# 결과 저장
-file_name = save_dict_list_as_file(ransomeware_live, "data/ransome")
+# 후처리 결과를 JSONL 파일로 바로 기록 (결과 목록을 메모리에 모으지 않음)
+# 파일은 종료 시 원자적으로 완성되며, 같은 초에 저장해도 이름이 겹치지 않음
+with CrawlRecordWriter("data/ransome", CrawlJsonlEncoder()) as writer:
+    writer.write_many(process_manager.run_batch(extracted))  # title 필드 가공
 
 # 저장 완료 메시지 출력
-print(f"'{file_name}' saved")
+for file_name in writer.get_paths():
+    print(f"'{file_name}' saved")
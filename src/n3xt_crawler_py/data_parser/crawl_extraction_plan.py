@@ -0,0 +1,182 @@
+import time
+from typing import Dict, List, Set, Tuple
+
+from lxml import etree
+
+from n3xt_crawler_py.data_parser.crawl_field_extractor import (
+    CrawlFieldExtractor,
+    CrawlFieldSpec,
+    to_field_extractor,
+)
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParser
+from n3xt_crawler_py.utils import crawl_metrics
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+
+class CrawlExtractionPlan:
+    """한 문서에서 여러 종류의 레코드(목록, 페이지네이션, 메타데이터 등)를 함께 추출하는 계획.
+
+    이름별로 블록 XPath와 필드 맵을 등록한 뒤 run()을 호출하면, 이미 파싱된 트리 하나에서
+    모든 추출을 수행하고 결과를 이름별로 함께 반환합니다.
+    같은 블록 XPath는 한 번만 평가하며, 같은 블록에 대한 같은 필드 XPath도
+    (다른 이름의 추출에서 쓰이더라도) 한 번만 평가합니다.
+
+    예:
+        plan = (
+            CrawlExtractionPlan()
+            .add("items", "//div[@class='item']", {"title": "./h2/text()"})
+            .add("pages", "//nav//a", {"href": "./@href"})
+        )
+        results = plan.run(parser)  # {"items": [...], "pages": [...]}
+    """
+
+    def __init__(self):
+        """CrawlExtractionPlan 생성자. 빈 계획을 만듭니다."""
+        self.__specs: Dict[str, Tuple[CrawlXpath, Dict[str, CrawlFieldExtractor]]] = {}
+
+    def add(
+        self, name: str, block_xpath: str, fields_map: Dict[str, CrawlFieldSpec]
+    ) -> "CrawlExtractionPlan":
+        """추출 항목을 계획에 추가합니다.
+
+        Args:
+            name (str): 결과에서 사용할 추출 이름.
+            block_xpath (str): 반복되는 데이터 블록을 선택할 XPath.
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 블록 기준 필드 XPath 또는 추출기}.
+
+        Returns:
+            CrawlExtractionPlan: 연쇄 호출을 위한 자기 자신.
+
+        Raises:
+            ValueError: 이름이 중복되었거나 XPath 구문이 잘못된 경우.
+        """
+        cls = self.__class__.__name__
+        if name in self.__specs:
+            raise ValueError(f"[{cls}] Duplicate extraction name: '{name}'")
+
+        try:
+            block = CrawlXpath(block_xpath)
+        except Exception as e:
+            raise ValueError(
+                f"[{cls}] Invalid block XPath '{block_xpath}' for '{name}': {e}"
+            ) from e
+
+        fields: Dict[str, CrawlFieldExtractor] = {}
+        for tag, field_xpath in fields_map.items():
+            try:
+                fields[tag] = to_field_extractor(field_xpath)
+            except Exception as e:
+                raise ValueError(
+                    f"[{cls}] Invalid field XPath '{field_xpath}' for '{name}.{tag}': {e}"
+                ) from e
+
+        self.__specs[name] = (block, fields)
+        return self
+
+    def get_names(self) -> List[str]:
+        """등록된 추출 이름을 등록 순서대로 반환.
+
+        Returns:
+            List[str]: 추출 이름 목록.
+        """
+        return list(self.__specs)
+
+    def get_evaluation_count(self) -> Tuple[int, int]:
+        """중복을 제거한 뒤 평가할 블록 XPath 수와 (블록 XPath, 필드 XPath) 쌍의 수.
+
+        Returns:
+            Tuple[int, int]: (블록 XPath 수, 필드 XPath 수).
+        """
+        groups = self.__group_fields()
+        return len(groups), sum(len(fields) for _, fields in groups.values())
+
+    def __group_fields(
+        self,
+    ) -> Dict[str, Tuple[CrawlXpath, Dict[str, CrawlFieldExtractor]]]:
+        """블록 XPath별로 필요한 필드 추출기를 중복 없이 모음.
+
+        Returns:
+            Dict[str, Tuple[CrawlXpath, Dict[str, CrawlFieldExtractor]]]:
+                {블록 XPath 문자열: (블록 XPath, {필드 표현 문자열: 필드 추출기})}.
+        """
+        groups: Dict[str, Tuple[CrawlXpath, Dict[str, CrawlFieldExtractor]]] = {}
+        for block, fields in self.__specs.values():
+            _, unique_fields = groups.setdefault(block.str, (block, {}))
+            for field_xpath in fields.values():
+                unique_fields.setdefault(field_xpath.str, field_xpath)
+        return groups
+
+    def run(self, parser: CrawlParser) -> Dict[str, List[Dict[str, List[str]]]]:
+        """파싱된 문서 하나에서 계획의 모든 추출을 수행합니다.
+
+        Args:
+            parser (CrawlParser): 문서를 파싱한 파서.
+
+        Returns:
+            Dict[str, List[Dict[str, List[str]]]]: {추출 이름: 블록별 필드 데이터 목록}.
+                각 목록은 같은 항목으로 CrawlClient.extract_fields()를 호출한 결과와 같습니다.
+
+        Raises:
+            ValueError: XPath 평가에 실패한 경우.
+        """
+        metrics = crawl_metrics.get_active()
+        groups = self.__group_fields()
+
+        # 서로 다른 블록 XPath가 같은 요소를 선택해도 필드는 한 번만 평가하도록
+        # {필드 XPath 문자열: {블록 요소: 값}}으로 기억
+        memo: Dict[str, Dict[etree._Element, List[str]]] = {}
+        blocks_by_xpath: Dict[str, List[etree._Element]] = {}
+        columns_by_xpath: Dict[str, Dict[str, List[List[str]]]] = {}
+
+        for block_str, (block_xpath, fields) in groups.items():
+            blocks = parser.get_blocks(block_xpath)
+            blocks_by_xpath[block_str] = blocks
+
+            started = time.perf_counter() if metrics is not None else 0.0
+            columns: Dict[str, List[List[str]]] = {}
+            for field_str, field_xpath in fields.items():
+                compiled = field_xpath.compiled
+                cache = memo.setdefault(field_str, {})
+                column: List[List[str]] = []
+                try:
+                    for block in blocks:
+                        values = cache.get(block)
+                        if values is None:
+                            values = cache[block] = compiled(block)
+                        column.append(values)
+                except etree.XPathEvalError as e:
+                    cls = self.__class__.__name__
+                    raise ValueError(
+                        f"[{cls}] Invalid field XPath: '{field_str}' - {e}"
+                    ) from e
+                columns[field_str] = column
+            columns_by_xpath[block_str] = columns
+
+            if metrics is not None:
+                metrics.observe(
+                    "crawl_xpath_seconds", time.perf_counter() - started, kind="plan"
+                )
+
+        # 공유된 값 리스트는 처음 한 번만 그대로 넘기고, 이후에는 복사해 결과끼리 독립시킴
+        handed_out: Set[int] = set()
+        results: Dict[str, List[Dict[str, List[str]]]] = {}
+        for name, (block_xpath, fields) in self.__specs.items():
+            columns = columns_by_xpath[block_xpath.str]
+            records: List[Dict[str, List[str]]] = []
+            for i in range(len(blocks_by_xpath[block_xpath.str])):
+                record: Dict[str, List[str]] = {}
+                for tag, field_xpath in fields.items():
+                    values = columns[field_xpath.str][i]
+                    if not isinstance(values, list):
+                        record[tag] = values  # count() 등 스칼라 결과
+                    elif id(values) in handed_out:
+                        record[tag] = list(values)
+                    else:
+                        handed_out.add(id(values))
+                        record[tag] = values
+                records.append(record)
+            results[name] = records
+        return results
+
+    def __len__(self) -> int:
+        return len(self.__specs)
@@ -0,0 +1,105 @@
+from array import array
+from typing import Any, Iterator, List, Sequence
+
+
+class CrawlFieldColumn:
+    """한 필드의 블록별 값을 평탄한 값 목록과 오프셋 배열로 보관하는 열 저장소.
+
+    블록 i의 값은 values[offsets[i]:offsets[i + 1]] 입니다.
+    블록마다 리스트를 만들지 않으므로 행이 많은 페이지에서 객체 수가 크게 줄고,
+    값 목록과 오프셋을 그대로 numpy/pandas 등에 넘겨 벡터 연산에 사용할 수 있습니다.
+
+    Attributes:
+        __OFFSET_TYPECODE (str): 오프셋 배열의 array 타입 코드 (부호 있는 64비트 정수).
+    """
+
+    __OFFSET_TYPECODE = "q"
+
+    def __init__(self, values: List[str], offsets: array):
+        """CrawlFieldColumn 생성자.
+
+        Args:
+            values (List[str]): 모든 블록의 값을 블록 순서대로 이어 붙인 목록.
+            offsets (array): 블록 경계 오프셋 (길이 = 블록 수 + 1, 첫 값은 0).
+
+        Raises:
+            ValueError: 오프셋이 값 목록과 맞지 않는 경우.
+        """
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(values):
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Offsets must start at 0 and end at len(values)={len(values)}"
+            )
+
+        self.__values: List[str] = values
+        self.__offsets: array = offsets
+
+    @classmethod
+    def from_lists(cls, rows: Sequence[Any]) -> "CrawlFieldColumn":
+        """블록별 값 리스트로 열을 생성합니다.
+
+        `count()`, `string()` 같은 XPath의 스칼라 결과(float, str, bool)는
+        값 하나짜리 리스트로 보관합니다.
+
+        Args:
+            rows (Sequence[Any]): 블록 순서대로 정렬된 값 리스트 또는 스칼라 값.
+
+        Returns:
+            CrawlFieldColumn: 생성된 열.
+        """
+        values: List[str] = []
+        offsets = array(cls.__OFFSET_TYPECODE, [0])
+        for row in rows:
+            if isinstance(row, list):
+                values.extend(row)
+            else:
+                values.append(row)  # 스칼라 결과 (문자열을 글자 단위로 펼치지 않음)
+            offsets.append(len(values))
+        return cls(values, offsets)
+
+    def get_values(self) -> List[str]:
+        """모든 블록의 값을 이어 붙인 목록 반환.
+
+        Returns:
+            List[str]: 평탄한 값 목록.
+        """
+        return self.__values
+
+    def get_offsets(self) -> array:
+        """블록 경계 오프셋 배열 반환.
+
+        Returns:
+            array: 길이가 블록 수 + 1인 오프셋 배열.
+        """
+        return self.__offsets
+
+    def to_lists(self) -> List[List[str]]:
+        """블록별 값 리스트로 변환합니다.
+
+        Returns:
+            List[List[str]]: extract_columns(array_backed=False)와 같은 형태.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"[{self.__class__.__name__}] Block index out of range")
+        return self.__values[self.__offsets[index] : self.__offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[List[str]]:
+        values, offsets = self.__values, self.__offsets
+        for i in range(len(offsets) - 1):
+            yield values[offsets[i] : offsets[i + 1]]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CrawlFieldColumn):
+            return NotImplemented
+        return self.__values == other.__values and self.__offsets == other.__offsets
+
+    def __repr__(self) -> str:
+        return f"CrawlFieldColumn(blocks={len(self)}, values={len(self.__values)})"
@@ -0,0 +1,303 @@
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Union
+
+from lxml import etree
+
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath, _compile_xpath
+
+try:
+    from cssselect import GenericTranslator, SelectorError
+except ImportError:  # cssselect는 선택 의존성 (pip install cssselect)
+    GenericTranslator = None
+    SelectorError = ValueError
+
+
+@lru_cache(maxsize=1024)
+def _translate_css(selector: str) -> str:
+    """CSS 선택자를 블록 기준 자손 XPath로 변환하고 프로세스 전역으로 메모이즈.
+
+    Args:
+        selector (str): CSS 선택자 (쉼표로 구분한 여러 선택자 가능).
+
+    Returns:
+        str: `(descendant::a | descendant::b)` 형태의 XPath.
+
+    Raises:
+        SelectorError: 선택자 구문 오류가 있는 경우 (캐시되지 않음).
+    """
+    return f"({GenericTranslator().css_to_xpath(selector, prefix='descendant::')})"
+
+
+def _own_text(element: etree._Element) -> List[str]:
+    """`./text()`와 같은 결과: 요소의 텍스트와 자식들의 tail."""
+    text = element.text
+    values = [text] if text is not None else []
+    if len(element):
+        values.extend([child.tail for child in element if child.tail is not None])
+    return values
+
+
+class CrawlFastField:
+    """XPath 엔진을 거치지 않고 lxml 요소 API로 직접 읽는 단순 필드 추출기.
+
+    블록 자신이나 직계 자식의 텍스트/속성만 읽는 아래 형태의 XPath와 같은 결과를 내며,
+    문자열 XPath는 to_field_extractor()가 이 형태를 인식해 자동으로 사용합니다.
+    `./text()`, `./name/text()`, `./@attr`, `./name/@attr` (`./`는 생략 가능)
+
+    XPath와 달리 결과는 부모 참조가 없는 일반 문자열입니다.
+
+    Attributes:
+        __NAME (str): 태그/속성 이름 패턴 (네임스페이스 접두사는 지원하지 않음).
+        __XPATH_RE (re.Pattern): 빠른 경로로 처리할 수 있는 XPath 패턴.
+        str (str): 같은 결과를 내는 XPath 표현 문자열.
+        compiled (Callable[[etree._Element], List[str]]): 요소를 인자로 호출해 값을 추출.
+    """
+
+    __NAME = r"[A-Za-z_][\w.\-]*"
+    __XPATH_RE = re.compile(
+        rf"^(?:\./)?(?:(?P<tag>{__NAME})/)?(?:@(?P<attr>{__NAME})|text\(\))$"
+    )
+
+    def __init__(self, tag: Optional[str] = None, attr: Optional[str] = None):
+        """CrawlFastField 생성자.
+
+        Args:
+            tag (Optional[str]): 읽을 직계 자식의 태그 이름. None이면 블록 자신.
+            attr (Optional[str]): 읽을 속성 이름. None이면 직접 포함한 텍스트.
+
+        Raises:
+            ValueError: 태그나 속성 이름이 단순 이름이 아닌 경우.
+        """
+        for name in (tag, attr):
+            if name is not None and not re.fullmatch(self.__NAME, name):
+                cls = self.__class__.__name__
+                raise ValueError(f"[{cls}] Invalid name for fast path: '{name}'")
+
+        self.__tag: Optional[str] = tag
+        self.__attr: Optional[str] = attr
+        path = f"./{tag}/" if tag is not None else "./"
+        self.str: str = path + (f"@{attr}" if attr is not None else "text()")
+        self.compiled: Callable[[etree._Element], List[str]] = self.__create_reader()
+
+    @classmethod
+    def from_xpath(cls, xpath: str) -> Optional["CrawlFastField"]:
+        """빠른 경로로 처리할 수 있는 XPath이면 추출기를 생성합니다.
+
+        Args:
+            xpath (str): 필드 XPath.
+
+        Returns:
+            Optional[CrawlFastField]: 추출기. 처리할 수 없는 XPath이면 None.
+        """
+        matched = cls.__XPATH_RE.match(xpath.strip())
+        if matched is None:
+            return None
+        return cls(matched.group("tag"), matched.group("attr"))
+
+    def __create_reader(self) -> Callable[[etree._Element], List[str]]:
+        """태그/속성 조합에 맞는 읽기 함수를 생성.
+
+        Returns:
+            Callable[[etree._Element], List[str]]: 요소를 받아 값 목록을 반환하는 함수.
+        """
+        tag, attr = self.__tag, self.__attr
+        if tag is None and attr is None:
+            return _own_text
+
+        if tag is None:
+
+            def read_own_attr(element: etree._Element) -> List[str]:
+                value = element.get(attr)
+                return [value] if value is not None else []
+
+            return read_own_attr
+
+        if attr is None:
+
+            def read_child_text(element: etree._Element) -> List[str]:
+                values: List[str] = []
+                for child in element.iterchildren(tag):
+                    text = child.text
+                    if text is not None:
+                        values.append(text)
+                    if len(child):
+                        values.extend([c.tail for c in child if c.tail is not None])
+                return values
+
+            return read_child_text
+
+        def read_child_attr(element: etree._Element) -> List[str]:
+            values: List[str] = []
+            for child in element.iterchildren(tag):
+                value = child.get(attr)
+                if value is not None:
+                    values.append(value)
+            return values
+
+        return read_child_attr
+
+    def __reduce__(self):
+        return self.__class__, (self.__tag, self.__attr)
+
+    def __repr__(self) -> str:
+        return f"CrawlFastField({self.str!r})"
+
+
+class CrawlCssSelector:
+    """CSS 선택자로 블록 내부 요소를 찾아 텍스트나 속성을 추출하는 필드 추출기.
+
+    선택자는 생성 시 한 번만 XPath로 변환/컴파일되므로 평가 비용은 XPath와 같습니다.
+    선택 의존성인 cssselect가 필요합니다 (`pip install cssselect`).
+
+    Attributes:
+        selector (str): CSS 선택자.
+        attr (Optional[str]): 읽을 속성 이름. None이면 선택한 요소가 직접 포함한 텍스트.
+        str (str): 변환된 XPath 표현 문자열.
+        compiled (etree.XPath): 컴파일된 XPath 객체. 요소를 인자로 호출해 평가합니다.
+    """
+
+    def __init__(self, selector: str, attr: Optional[str] = None):
+        """CrawlCssSelector 생성자.
+
+        Args:
+            selector (str): 블록 기준 CSS 선택자 (예: `.title`, `a.more`).
+            attr (Optional[str]): 읽을 속성 이름 (예: `href`).
+
+        Raises:
+            ImportError: cssselect가 설치되어 있지 않은 경우.
+            ValueError: 선택자 구문이 잘못된 경우.
+        """
+        cls = self.__class__.__name__
+        if GenericTranslator is None:
+            raise ImportError(
+                f"[{cls}] cssselect is required for CSS selectors: pip install cssselect"
+            )
+
+        try:
+            xpath = _translate_css(selector)
+        except SelectorError as e:
+            raise ValueError(f"[{cls}] Invalid CSS selector: '{selector}' - {e}") from e
+
+        self.selector: str = selector
+        self.attr: Optional[str] = attr
+        self.str: str = xpath + (f"/@{attr}" if attr is not None else "/text()")
+        try:
+            self.compiled: etree.XPath = _compile_xpath(self.str)
+        except etree.XPathSyntaxError as e:
+            raise ValueError(f"[{cls}] Invalid attribute name: '{attr}' - {e}") from e
+
+    def __reduce__(self):
+        return self.__class__, (self.selector, self.attr)
+
+    def __repr__(self) -> str:
+        return f"CrawlCssSelector({self.selector!r}, attr={self.attr!r})"
+
+
+class CrawlRegexField:
+    """블록 내부 텍스트 노드에 컴파일된 정규식을 적용해 일치한 값을 추출하는 필드 추출기.
+
+    텍스트 노드마다 finditer()로 모든 일치를 찾으며, 그룹이 일치하지 않은 경우는 건너뜁니다.
+
+    Attributes:
+        pattern (str): 정규식 패턴.
+        group (Union[int, str]): 반환할 그룹 번호 또는 이름.
+        flags (int): re 플래그.
+        source (str): 정규식을 적용할 텍스트 노드를 고르는 블록 기준 XPath.
+        str (str): 추출기를 나타내는 문자열 (중복 판단과 오류 메시지에 사용).
+        compiled (Callable[[etree._Element], List[str]]): 요소를 인자로 호출해 값을 추출.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        group: Union[int, str] = 0,
+        flags: int = 0,
+        source: str = ".//text()",
+    ):
+        """CrawlRegexField 생성자.
+
+        Args:
+            pattern (str): 정규식 패턴 (예: `r"(\\d+)\\.\\d{2}"`).
+            group (Union[int, str]): 반환할 그룹 번호 또는 이름. 0이면 일치 전체.
+            flags (int): re 플래그 (예: re.IGNORECASE).
+            source (str): 정규식을 적용할 텍스트를 고르는 XPath. 기본값은 블록 안의 모든 텍스트.
+
+        Raises:
+            ValueError: 정규식이나 XPath 구문이 잘못되었거나 그룹이 없는 경우.
+        """
+        cls = self.__class__.__name__
+        try:
+            regex = re.compile(pattern, flags)
+        except re.error as e:
+            raise ValueError(f"[{cls}] Invalid regex: '{pattern}' - {e}") from e
+        if isinstance(group, str) and group not in regex.groupindex:
+            raise ValueError(f"[{cls}] Unknown group '{group}' in regex: '{pattern}'")
+        if isinstance(group, int) and not 0 <= group <= regex.groups:
+            raise ValueError(f"[{cls}] Unknown group {group} in regex: '{pattern}'")
+
+        self.pattern: str = pattern
+        self.group: Union[int, str] = group
+        self.flags: int = flags
+        self.source: str = source
+        self.str: str = f"re({pattern!r}, group={group!r}, flags={flags}) on {source}"
+        self.compiled: Callable[[etree._Element], List[str]] = self.__create_reader(
+            regex, to_field_extractor(source)
+        )
+
+    def __create_reader(
+        self, regex: re.Pattern, source: "CrawlFieldExtractor"
+    ) -> Callable[[etree._Element], List[str]]:
+        """텍스트 노드를 고른 뒤 정규식을 적용하는 함수를 생성.
+
+        Args:
+            regex (re.Pattern): 컴파일된 정규식.
+            source (CrawlFieldExtractor): 텍스트 노드를 고르는 추출기.
+
+        Returns:
+            Callable[[etree._Element], List[str]]: 요소를 받아 일치 값 목록을 반환하는 함수.
+        """
+        group, texts = self.group, source.compiled
+
+        def read(element: etree._Element) -> List[str]:
+            values: List[str] = []
+            for text in texts(element):
+                for matched in regex.finditer(str(text)):
+                    value = matched.group(group)
+                    if value is not None:
+                        values.append(value)
+            return values
+
+        return read
+
+    def __reduce__(self):
+        return self.__class__, (self.pattern, self.group, self.flags, self.source)
+
+    def __repr__(self) -> str:
+        return f"CrawlRegexField({self.str!r})"
+
+
+# 필드 맵의 값으로 쓸 수 있는 추출기: 모두 str(표현 문자열)과 compiled(요소 -> 값 목록)를 제공
+CrawlFieldExtractor = Union[CrawlXpath, CrawlFastField, CrawlCssSelector, CrawlRegexField]
+CrawlFieldSpec = Union[str, CrawlFieldExtractor]
+
+
+def to_field_extractor(spec: CrawlFieldSpec) -> CrawlFieldExtractor:
+    """필드 맵의 값을 추출기로 변환합니다.
+
+    문자열은 XPath로 간주하며, 블록 자신이나 직계 자식의 텍스트/속성만 읽는 단순 XPath는
+    XPath 엔진을 거치지 않는 CrawlFastField로 변환합니다. 추출기는 그대로 반환합니다.
+
+    Args:
+        spec (CrawlFieldSpec): XPath 문자열 또는 추출기.
+
+    Returns:
+        CrawlFieldExtractor: 추출기.
+
+    Raises:
+        ValueError: XPath 구문이 잘못된 경우.
+    """
+    if not isinstance(spec, str):
+        return spec
+    return CrawlFastField.from_xpath(spec) or CrawlXpath(spec)
+
@@ -0,0 +1,101 @@
+import time
+from typing import Optional
+
+from lxml import etree
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.utils import crawl_metrics
+from n3xt_crawler_py.web_crawler.crawl_download import ICrawlChunkSink
+
+
+class CrawlIncrementalParser(ICrawlChunkSink):
+    """다운로드 중인 본문 조각을 lxml 피드 파서에 바로 넣어 파싱과 다운로드를 겹치는 파서.
+
+    CrawlRequester의 chunk_sink로 넘기면 마지막 바이트를 받는 즉시 트리가 완성되므로,
+    본문 전체를 받은 뒤 다시 파싱하는 시간이 없어집니다.
+    파싱 오류는 다운로드를 중단시키지 않고 기록만 하며, 이때 get_parser()는 None을 반환합니다.
+    """
+
+    def __init__(self, mode: CrawlParseMode):
+        """CrawlIncrementalParser 생성자.
+
+        Args:
+            mode (CrawlParseMode): 문서 파싱 모드 (HTML 또는 XML).
+
+        Raises:
+            ValueError: 지원하지 않는 파싱 모드인 경우.
+        """
+        if mode not in (CrawlParseMode.XML, CrawlParseMode.HTML):
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Unsupported parse mode: '{mode.name}'")
+
+        self.__mode: CrawlParseMode = mode
+        self.__feed_parser: Optional[etree._FeedParser] = None
+        self.__root: Optional[etree._Element] = None
+        self.__error: Optional[Exception] = None
+        self.__parse_time: float = 0.0
+
+    def __create_feed_parser(self, encoding: Optional[str]) -> etree._FeedParser:
+        parser_cls = (
+            etree.XMLParser if self.__mode == CrawlParseMode.XML else etree.HTMLParser
+        )
+        try:
+            return parser_cls(encoding=encoding)
+        except LookupError:
+            # 알 수 없는 인코딩 힌트는 무시하고 문서 선언을 따름
+            return parser_cls()
+
+    def start(self, encoding: Optional[str]) -> None:
+        """새 문서 파싱을 시작합니다 (재시도 시 이전 상태를 버림)."""
+        self.__feed_parser = self.__create_feed_parser(encoding)
+        self.__root = None
+        self.__error = None
+        self.__parse_time = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """본문 조각을 파서에 넣습니다."""
+        if self.__feed_parser is None or self.__error is not None:
+            return
+        started = time.perf_counter()
+        try:
+            self.__feed_parser.feed(chunk)
+        except etree.XMLSyntaxError as e:
+            self.__error = e
+        self.__parse_time += time.perf_counter() - started
+
+    def finish(self) -> None:
+        """문서를 닫고 트리를 완성합니다."""
+        if self.__feed_parser is None or self.__error is not None:
+            return
+        started = time.perf_counter()
+        try:
+            self.__root = self.__feed_parser.close()
+        except etree.XMLSyntaxError as e:
+            self.__error = e
+        self.__parse_time += time.perf_counter() - started
+        self.__feed_parser = None
+
+        metrics = crawl_metrics.get_active()
+        if metrics is not None and self.__root is not None:
+            metrics.observe(
+                "crawl_parse_seconds", self.__parse_time, mode=self.__mode.name
+            )
+
+    def get_parser(self) -> Optional[CrawlParser]:
+        """완성된 트리로 만든 파서를 반환합니다.
+
+        Returns:
+            Optional[CrawlParser]: 파서. 본문을 끝까지 받지 못했거나
+                (캐시/재생 응답 포함) 파싱에 실패했으면 None.
+        """
+        if self.__root is None:
+            return None
+        return CrawlParser.from_root(self.__root, self.__mode)
+
+    def get_error(self) -> Optional[Exception]:
+        """마지막 파싱 오류를 반환합니다.
+
+        Returns:
+            Optional[Exception]: 파싱 오류. 없으면 None.
+        """
+        return self.__error
@@ -1,7 +1,10 @@
+import time
 from enum import Enum, auto
-from typing import List
+from typing import Dict, List, Optional, Union
 from lxml import etree
 
+from n3xt_crawler_py.data_parser.crawl_field_extractor import CrawlFieldExtractor
+from n3xt_crawler_py.utils import crawl_metrics
 from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
 
 
@@ -15,12 +18,20 @@ class CrawlParseMode(Enum):
 class CrawlParser:
     """HTML 또는 XML 문서를 파싱하고 XPath로 데이터를 추출하는 클래스."""
 
-    def __init__(self, content: str, mode: CrawlParseMode):
+    def __init__(
+        self,
+        content: Union[str, bytes],
+        mode: CrawlParseMode,
+        encoding: Optional[str] = None,
+    ):
         """CrawlParser 초기화.
 
         Args:
-            content (str): 파싱할 원시 문서 (HTML/XML 문자열).
+            content (Union[str, bytes]): 파싱할 원시 문서 (HTML/XML 문자열 또는 바이트).
+                바이트를 넘기면 디코딩 없이 lxml이 직접 파싱합니다.
             mode (CrawlParseMode): 문서 파싱 모드 (HTML 또는 XML).
+            encoding (Optional[str]): 바이트 입력의 인코딩 힌트 (예: HTTP charset).
+                None이면 문서 선언(XML 선언, meta 태그)을 따릅니다.
 
         Raises:
             ValueError: 지원하지 않는 파싱 모드인 경우.
@@ -31,13 +42,58 @@ class CrawlParser:
             cls = self.__class__.__name__
             raise ValueError(f"[{cls}] Unsupported parse mode: '{mode.name}'")
 
-        self.__root = self.__parse_root(content)
+        metrics = crawl_metrics.get_active()
+        if metrics is None:
+            self.__root = self.__parse_root(content, encoding)
+            return
 
-    def __parse_root(self, content: str):
+        started = time.perf_counter()
+        self.__root = self.__parse_root(content, encoding)
+        metrics.observe(
+            "crawl_parse_seconds", time.perf_counter() - started, mode=mode.name
+        )
+
+    @classmethod
+    def from_root(cls, root: etree._Element, mode: CrawlParseMode) -> "CrawlParser":
+        """이미 파싱된 루트 요소로 파서를 생성합니다.
+
+        CrawlIncrementalParser처럼 다른 곳에서 트리를 만든 경우 다시 파싱하지 않고 사용합니다.
+
+        Args:
+            root (etree._Element): 문서의 루트 요소.
+            mode (CrawlParseMode): 문서 파싱 모드 (HTML 또는 XML).
+
+        Returns:
+            CrawlParser: 생성된 파서.
+        """
+        parser = cls.__new__(cls)
+        parser.__mode = mode
+        parser.__root = root
+        return parser
+
+    def __create_parser(self, encoding: Optional[str]) -> etree._FeedParser:
+        """인코딩 힌트가 적용된 lxml 파서 생성.
+
+        Args:
+            encoding (Optional[str]): 인코딩 힌트. 알 수 없는 인코딩이면 무시.
+
+        Returns:
+            etree._FeedParser: XMLParser 또는 HTMLParser.
+        """
+        parser_cls = (
+            etree.XMLParser if self.__mode == CrawlParseMode.XML else etree.HTMLParser
+        )
+        try:
+            return parser_cls(encoding=encoding)
+        except LookupError:
+            return parser_cls()
+
+    def __parse_root(self, content: Union[str, bytes], encoding: Optional[str]):
         """내부 문서 파서.
 
         Args:
-            content (str): HTML 또는 XML 콘텐츠 문자열.
+            content (Union[str, bytes]): HTML 또는 XML 콘텐츠.
+            encoding (Optional[str]): 바이트 입력의 인코딩 힌트.
 
         Returns:
             etree._Element: 루트 엘리먼트.
@@ -45,11 +101,15 @@ class CrawlParser:
         Raises:
             ValueError: 콘텐츠가 잘못된 형식일 경우.
         """
+        if isinstance(content, str) and self.__mode == CrawlParseMode.XML:
+            # lxml은 인코딩 선언이 있는 유니코드 XML 문자열을 거부하므로 UTF-8로 변환
+            content, encoding = content.encode("utf-8"), "utf-8"
+
         try:
             if self.__mode == CrawlParseMode.XML:
-                return etree.fromstring(content)
+                return etree.fromstring(content, self.__create_parser(encoding))
             elif self.__mode == CrawlParseMode.HTML:
-                return etree.HTML(content)
+                return etree.HTML(content, self.__create_parser(encoding))
             else:
                 cls = self.__class__.__name__
                 raise RuntimeError(f"[{cls}] Unreachable parse mode: '{self.__mode}'")
@@ -69,20 +129,27 @@ class CrawlParser:
         Raises:
             ValueError: 유효하지 않은 XPath 표현식일 경우.
         """
+        metrics = crawl_metrics.get_active()
+        started = time.perf_counter() if metrics is not None else 0.0
         try:
-            return self.__root.xpath(xpath.str)
+            blocks = xpath.compiled(self.__root)
         except etree.XPathEvalError as e:
             cls = self.__class__.__name__
             raise ValueError(f"[{cls}] Invalid block XPath: '{xpath.str}' - {e}") from e
+        if metrics is not None:
+            metrics.observe(
+                "crawl_xpath_seconds", time.perf_counter() - started, kind="block"
+            )
+        return blocks
 
     def extract_field(
-        self, block: etree._Element, field_xpath: CrawlXpath
+        self, block: etree._Element, field_xpath: CrawlFieldExtractor
     ) -> List[str]:
         """지정된 XPath를 사용해 블록 내에서 필드 값을 추출합니다.
 
         Args:
             block (etree._Element): 추출 대상 블록 요소.
-            field_xpath (CrawlXpath): 필드에 해당하는 XPath.
+            field_xpath (CrawlFieldExtractor): 필드에 해당하는 XPath 또는 추출기.
 
         Returns:
             List[str]: 추출된 텍스트 또는 속성 목록.
@@ -90,10 +157,57 @@ class CrawlParser:
         Raises:
             ValueError: XPath 표현식이 잘못된 경우.
         """
+        metrics = crawl_metrics.get_active()
+        started = time.perf_counter() if metrics is not None else 0.0
         try:
-            return block.xpath(field_xpath.str)
+            values = field_xpath.compiled(block)
         except etree.XPathEvalError as e:
             cls = self.__class__.__name__
             raise ValueError(
                 f"[{cls}] Invalid field XPath: '{field_xpath.str}' - {e}"
             ) from e
+        if metrics is not None:
+            metrics.observe(
+                "crawl_xpath_seconds", time.perf_counter() - started, kind="field"
+            )
+        return values
+
+    def extract_columns(
+        self, block_xpath: CrawlXpath, fields_map: Dict[str, CrawlFieldExtractor]
+    ) -> Dict[str, List[List[str]]]:
+        """블록별 필드 값을 열(column) 단위로 추출합니다.
+
+        블록 목록을 한 번만 구한 뒤, 필드마다 컴파일된 추출기를 각 블록에 한 번씩 호출해
+        블록 순서대로 열을 채웁니다. 평가 횟수는 extract_fields()와 같은 블록 수 × 필드 수이며,
+        블록별 딕셔너리를 만들지 않는 것만 다릅니다.
+
+        Args:
+            block_xpath (CrawlXpath): 반복 블록을 찾기 위한 XPath.
+            fields_map (Dict[str, CrawlFieldExtractor]): {필드이름: 블록 기준 필드 XPath 또는 추출기}.
+
+        Returns:
+            Dict[str, List[List[str]]]: {필드이름: 블록 인덱스 순서의 값 리스트}.
+                columns[tag][i] == extract_field(blocks[i], fields_map[tag]).
+
+        Raises:
+            ValueError: XPath 표현식이 잘못된 경우.
+        """
+        blocks = self.get_blocks(block_xpath)
+
+        metrics = crawl_metrics.get_active()
+        started = time.perf_counter() if metrics is not None else 0.0
+        columns: Dict[str, List[List[str]]] = {}
+        for tag, field_xpath in fields_map.items():
+            compiled = field_xpath.compiled
+            try:
+                columns[tag] = [compiled(block) for block in blocks]
+            except etree.XPathEvalError as e:
+                cls = self.__class__.__name__
+                raise ValueError(
+                    f"[{cls}] Invalid field XPath: '{field_xpath.str}' - {e}"
+                ) from e
+        if metrics is not None:
+            metrics.observe(
+                "crawl_xpath_seconds", time.perf_counter() - started, kind="columns"
+            )
+        return columns
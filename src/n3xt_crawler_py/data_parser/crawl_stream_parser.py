@@ -0,0 +1,224 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from n3xt_crawler_py.data_parser.crawl_field_extractor import CrawlFieldExtractor
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
+
+
+class CrawlStreamParser:
+    """문서를 조각(chunk) 단위로 받아 블록을 하나씩 내보내는 스트리밍 파서.
+
+    lxml의 pull parser로 문서를 점진적으로 파싱하고, 블록 패턴에 일치하는 요소가
+    닫히는 즉시 반환합니다. 처리가 끝난 블록과 블록 밖의 요소는 바로 비우므로
+    문서 크기와 관계없이 메모리 사용량이 거의 일정하게 유지됩니다.
+
+    블록 패턴은 스트리밍으로 판정할 수 있는 단순 경로만 지원합니다.
+    예: `//item`, `/rss/channel/item`, `//div/article`, `//*`
+    필드 XPath는 블록 내부 기준(`./`, `.//`)이어야 하며, 블록 밖을 참조할 수 없습니다.
+
+    Attributes:
+        __STEP_RE (re.Pattern): 블록 패턴의 한 단계(`/name` 또는 `//name`)를 찾는 정규식.
+    """
+
+    __STEP_RE = re.compile(r"(//?)([A-Za-z_][\w.\-]*|\*)")
+
+    def __init__(
+        self,
+        block_xpath: str,
+        mode: CrawlParseMode,
+        encoding: Optional[str] = None,
+    ):
+        """CrawlStreamParser 생성자.
+
+        Args:
+            block_xpath (str): 반복 블록을 지정하는 단순 경로 패턴.
+            mode (CrawlParseMode): 문서 파싱 모드 (HTML 또는 XML).
+            encoding (Optional[str]): 바이트 입력의 인코딩. None이면 문서 선언을 따름.
+
+        Raises:
+            ValueError: 지원하지 않는 파싱 모드이거나 블록 패턴을 스트리밍할 수 없는 경우.
+        """
+        if mode not in (CrawlParseMode.XML, CrawlParseMode.HTML):
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Unsupported parse mode: '{mode.name}'")
+
+        self.__mode: CrawlParseMode = mode
+        self.__encoding: Optional[str] = encoding
+        self.__steps: List[Tuple[bool, str]] = self.__parse_block_xpath(block_xpath)
+
+    def __parse_block_xpath(self, block_xpath: str) -> List[Tuple[bool, str]]:
+        """블록 패턴을 (자손 축 여부, 태그 이름) 단계 목록으로 변환.
+
+        Args:
+            block_xpath (str): 블록 패턴.
+
+        Returns:
+            List[Tuple[bool, str]]: 단계 목록. 자손 축(`//`)이면 True.
+
+        Raises:
+            ValueError: 단순 경로가 아닌 경우 (술어, 함수, 축 지정 등).
+        """
+        steps = []
+        pos = 0
+        for match in self.__STEP_RE.finditer(block_xpath):
+            if match.start() != pos:
+                break
+            steps.append((match.group(1) == "//", match.group(2)))
+            pos = match.end()
+
+        if not steps or pos != len(block_xpath):
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Block XPath is not streamable: '{block_xpath}' "
+                "(only simple paths like '//item' or '/rss/channel/item' are supported)"
+            )
+        return steps
+
+    def __create_parser(self) -> etree._FeedParser:
+        parser_cls = (
+            etree.XMLPullParser
+            if self.__mode == CrawlParseMode.XML
+            else etree.HTMLPullParser
+        )
+        try:
+            return parser_cls(events=("start", "end"), encoding=self.__encoding)
+        except LookupError:
+            # 알 수 없는 인코딩 힌트는 무시하고 문서 선언을 따름
+            return parser_cls(events=("start", "end"))
+
+    def __is_block(self, element: etree._Element) -> bool:
+        """요소가 블록 패턴에 일치하는지 조상 경로로 판정.
+
+        Args:
+            element (etree._Element): 검사할 요소 (조상은 아직 열려 있는 상태).
+
+        Returns:
+            bool: 일치하면 True.
+        """
+        chain = []
+        node = element
+        while node is not None:
+            chain.append(node.tag)
+            node = node.getparent()
+        return self.__match(chain, 0, len(self.__steps) - 1)
+
+    def __match(self, chain: List[str], pos: int, step_idx: int) -> bool:
+        """chain[pos]가 steps[step_idx]에 대응하는지 재귀적으로 판정.
+
+        Args:
+            chain (List[str]): 요소에서 루트까지의 태그 목록.
+            pos (int): chain에서 현재 위치.
+            step_idx (int): steps에서 현재 단계.
+
+        Returns:
+            bool: 일치하면 True.
+        """
+        descendant, name = self.__steps[step_idx]
+        if name != "*" and chain[pos] != name:
+            return False
+
+        if step_idx == 0:
+            # 절대 경로의 첫 단계는 루트여야 함
+            return descendant or pos == len(chain) - 1
+
+        if not descendant:
+            return pos + 1 < len(chain) and self.__match(chain, pos + 1, step_idx - 1)
+
+        return any(
+            self.__match(chain, ancestor, step_idx - 1)
+            for ancestor in range(pos + 1, len(chain))
+        )
+
+    @staticmethod
+    def __release(element: etree._Element) -> None:
+        """처리가 끝난 요소의 내용을 비우고 앞선 형제 요소를 트리에서 제거."""
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is None:
+            return
+        while element.getprevious() is not None:
+            del parent[0]
+
+    def iter_blocks(
+        self, chunks: Iterable[Union[bytes, str]]
+    ) -> Iterator[etree._Element]:
+        """문서 조각을 순서대로 파싱하며 완성된 블록을 하나씩 반환합니다.
+
+        반환된 블록은 다음 블록을 요청하는 시점에 비워지므로,
+        필요한 값은 반복 안에서 추출해야 합니다.
+
+        Args:
+            chunks (Iterable[Union[bytes, str]]): 문서 조각 (파일 읽기, 응답 스트림 등).
+
+        Yields:
+            etree._Element: 블록 패턴에 일치하는 요소.
+
+        Raises:
+            ValueError: 문서 형식이 잘못된 경우.
+        """
+        parser = self.__create_parser()
+        # 열려 있는 요소마다 블록 여부를 기록하는 스택
+        open_blocks: List[bool] = []
+        depth_in_block = 0
+
+        def drain() -> Iterator[etree._Element]:
+            nonlocal depth_in_block
+            for event, element in parser.read_events():
+                if event == "start":
+                    is_block = self.__is_block(element)
+                    open_blocks.append(is_block)
+                    depth_in_block += is_block
+                    continue
+
+                was_block = open_blocks.pop()
+                if was_block:
+                    depth_in_block -= 1
+                    yield element
+                # 중첩 블록은 바깥 블록이 끝날 때까지 유지
+                if depth_in_block == 0:
+                    self.__release(element)
+
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                yield from drain()
+            parser.close()
+            yield from drain()
+        except etree.XMLSyntaxError as e:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Invalid {self.__mode.name} content: {e}") from e
+
+    def iter_fields(
+        self,
+        chunks: Iterable[Union[bytes, str]],
+        fields_map: Dict[str, CrawlFieldExtractor],
+    ) -> Iterator[Dict[str, List[str]]]:
+        """블록마다 필드를 추출해 하나씩 반환합니다.
+
+        Args:
+            chunks (Iterable[Union[bytes, str]]): 문서 조각.
+            fields_map (Dict[str, CrawlFieldExtractor]): {필드이름: 블록 기준 필드 XPath 또는 추출기}.
+
+        Yields:
+            Dict[str, List[str]]: 블록 하나의 필드 데이터.
+
+        Raises:
+            ValueError: 문서 형식 또는 필드 XPath 평가에 실패한 경우.
+        """
+        for block in self.iter_blocks(chunks):
+            extracted: Dict[str, List[str]] = {}
+            for tag, field_xpath in fields_map.items():
+                try:
+                    # 블록이 곧 비워지므로 스마트 문자열의 부모 참조를 끊어 둠
+                    extracted[tag] = [
+                        str(v) if isinstance(v, str) else v
+                        for v in field_xpath.compiled(block)
+                    ]
+                except etree.XPathEvalError as e:
+                    cls = self.__class__.__name__
+                    raise ValueError(
+                        f"[{cls}] Invalid field XPath: '{field_xpath.str}' - {e}"
+                    ) from e
+            yield extracted
@@ -1,5 +1,11 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple, List
+from collections import deque
+from concurrent.futures import Executor, Future
+from itertools import islice
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, List
+
+from n3xt_crawler_py.utils import crawl_metrics
 
 
 class ICrawlDataProcessor(ABC):
@@ -21,6 +27,20 @@ class ICrawlDataProcessor(ABC):
         """
         pass
 
+    def run_many(self, data_list: List[Any]) -> List[Tuple[Any, Any]]:
+        """여러 입력 데이터를 한 번에 처리합니다. (선택 구현)
+
+        기본 구현은 run()을 데이터마다 호출합니다.
+        벡터화할 수 있는 프로세서는 이 메서드를 재정의해 묶음 전체를 한 번에 처리할 수 있습니다.
+
+        Args:
+            data_list (List[Any]): 원시 입력 데이터 묶음.
+
+        Returns:
+            List[Tuple[Any, Any]]: 입력 순서와 같은 (키, 처리된 값) 목록.
+        """
+        return [self.run(data) for data in data_list]
+
     @abstractmethod
     def get_unique_id(self) -> Any:
         """프로세서를 구별할 수 있는 고유 이름을 반환합니다.
@@ -30,13 +50,140 @@ class ICrawlDataProcessor(ABC):
         """
         pass
 
+    def get_output_key(self) -> Any:
+        """run()이 반환하는 결과 키를 선언합니다. (선택 구현)
+
+        의존성 그래프(run_for)에서 어떤 프로세서가 어떤 키를 만드는지 판단하는 데 사용합니다.
+        기본값은 get_unique_id()입니다.
+
+        Returns:
+            Any: 결과 키.
+        """
+        return self.get_unique_id()
+
+    def get_input_keys(self) -> List[Any]:
+        """이 프로세서가 입력으로 사용하는 다른 프로세서의 결과 키 목록을 선언합니다. (선택 구현)
+
+        Returns:
+            List[Any]: 입력 결과 키 목록. 기본값은 빈 목록(원시 데이터만 사용).
+        """
+        return []
+
+    def run_with_inputs(self, data: Any, inputs: Dict[Any, Any]) -> Tuple[Any, Any]:
+        """선언한 입력 결과와 함께 데이터를 처리합니다. (선택 구현)
+
+        get_input_keys()를 선언한 프로세서는 이 메서드를 재정의해 입력 결과를 사용합니다.
+        기본 구현은 run(data)를 호출합니다.
+
+        Args:
+            data (Any): 원시 입력 데이터.
+            inputs (Dict[Any, Any]): {입력 결과 키: 값}.
+
+        Returns:
+            Tuple[Any, Any]: (결과를 저장할 키, 처리된 값)
+        """
+        return self.run(data)
+
+
+def _observe_processor(
+    metrics: crawl_metrics.CrawlMetrics,
+    processor: ICrawlDataProcessor,
+    elapsed: float,
+    records: int,
+) -> None:
+    """프로세서 실행 시간과 처리한 데이터 수를 기록."""
+    proc_id = processor.get_unique_id()
+    metrics.observe("crawl_processor_seconds", elapsed, processor=proc_id)
+    metrics.increment("crawl_processor_records_total", records, processor=proc_id)
+
+
+def _run_chunk(
+    processors: List[ICrawlDataProcessor], chunk: List[Any]
+) -> List[Dict[Any, Any]]:
+    """데이터 묶음에 모든 프로세서를 적용하고 데이터별 결과를 병합.
+
+    프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둡니다.
+
+    Args:
+        processors (List[ICrawlDataProcessor]): 실행할 프로세서 목록.
+        chunk (List[Any]): 입력 데이터 묶음.
+
+    Returns:
+        List[Dict[Any, Any]]: 입력 순서와 같은 데이터별 처리 결과.
+
+    Raises:
+        ValueError: run_many()가 입력과 다른 개수의 결과를 반환한 경우.
+        KeyError: 서로 다른 프로세서가 동일한 키를 반환한 경우.
+    """
+    cls = CrawlDataProcessManager.__name__
+    results: List[Dict[Any, Any]] = [{} for _ in chunk]
+    metrics = crawl_metrics.get_active()
+
+    for processor in processors:
+        started = time.perf_counter() if metrics is not None else 0.0
+        pairs = processor.run_many(chunk)
+        if metrics is not None:
+            elapsed = time.perf_counter() - started
+            _observe_processor(metrics, processor, elapsed, len(chunk))
+        if len(pairs) != len(chunk):
+            raise ValueError(
+                f"[{cls}] Processor '{processor.get_unique_id()}' returned "
+                f"{len(pairs)} results for {len(chunk)} records."
+            )
+        for result, (key, value) in zip(results, pairs):
+            if key in result:
+                raise KeyError(f"[{cls}] Duplicate key returned by processor: '{key}'")
+            result[key] = value
+
+    return results
+
+
+def _run_node(
+    processor: ICrawlDataProcessor, data: Any, inputs: Dict[Any, Any]
+) -> Tuple[Any, Any]:
+    """의존성 그래프의 프로세서 하나를 실행하고 선언한 결과 키와 일치하는지 확인.
+
+    프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둡니다.
+
+    Args:
+        processor (ICrawlDataProcessor): 실행할 프로세서.
+        data (Any): 원시 입력 데이터.
+        inputs (Dict[Any, Any]): {입력 결과 키: 값}.
+
+    Returns:
+        Tuple[Any, Any]: (결과 키, 처리된 값)
+
+    Raises:
+        KeyError: 선언한 결과 키와 다른 키를 반환한 경우.
+    """
+    metrics = crawl_metrics.get_active()
+    started = time.perf_counter() if metrics is not None else 0.0
+    key, value = processor.run_with_inputs(data, inputs)
+    if metrics is not None:
+        _observe_processor(metrics, processor, time.perf_counter() - started, 1)
+    if key != processor.get_output_key():
+        cls = CrawlDataProcessManager.__name__
+        raise KeyError(
+            f"[{cls}] Processor '{processor.get_unique_id()}' returned key '{key}' "
+            f"but declared '{processor.get_output_key()}'"
+        )
+    return key, value
+
 
 class CrawlDataProcessManager:
-    """복수의 데이터 프로세서를 실행하고 결과를 병합하는 매니저 클래스."""
+    """복수의 데이터 프로세서를 실행하고 결과를 병합하는 매니저 클래스.
+
+    Attributes:
+        __PENDING_CHUNKS_PER_BATCH (int): run_batch()에서 실행기에 미리 제출해 둘 최대 묶음 수.
+    """
+
+    __PENDING_CHUNKS_PER_BATCH = 8
 
     def __init__(self):
         """프로세서 목록 초기화."""
         self.__processor_set: List[ICrawlDataProcessor] = []
+        # 요청 결과 키 집합 -> 단계별 실행 계획 (프로세서 등록 시 초기화)
+        self.__plans: Dict[FrozenSet[Any], List[List[ICrawlDataProcessor]]] = {}
 
     def add(self, processor: ICrawlDataProcessor) -> None:
         """프로세서를 매니저에 등록합니다.
@@ -57,6 +204,7 @@ class CrawlDataProcessManager:
             raise ValueError(f"[{cls}] Processor with name '{proc_id}' already exists.")
 
         self.__processor_set.append(processor)
+        self.__plans.clear()
 
     def run_all(self, data: Any) -> Dict[Any, Any]:
         """등록된 모든 프로세서를 실행하고 결과를 병합해 반환합니다.
@@ -80,12 +228,216 @@ class CrawlDataProcessManager:
             )
 
         result: Dict[Any, Any] = {}
+        metrics = crawl_metrics.get_active()
 
         for processor in self.__processor_set:
+            started = time.perf_counter() if metrics is not None else 0.0
             key, value = processor.run(data)
+            if metrics is not None:
+                elapsed = time.perf_counter() - started
+                _observe_processor(metrics, processor, elapsed, 1)
             if key in result:
                 cls = self.__class__.__name__
                 raise KeyError(f"[{cls}] Duplicate key returned by processor: '{key}'")
             result[key] = value
 
         return result
+
+    def run_batch(
+        self,
+        records: Iterable[Any],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[Any, Any]]:
+        """여러 데이터를 묶음 단위로 처리해 결과를 입력 순서대로 하나씩 반환합니다.
+
+        데이터를 chunk_size개씩 묶어 각 프로세서의 run_many()에 넘깁니다.
+        executor를 지정하면 묶음들을 스레드 풀 또는 프로세스 풀에서 병렬로 처리하며,
+        메모리가 늘지 않도록 제출해 둔 묶음 수를 제한합니다.
+        프로세스 풀을 사용할 경우 프로세서와 데이터는 pickle 가능해야 합니다.
+
+        Args:
+            records (Iterable[Any]): 입력 데이터 (리스트, 제너레이터 등).
+            executor (Optional[Executor]): 묶음을 실행할 실행기. None이면 현재 스레드에서 실행.
+            chunk_size (int): 한 번에 처리할 데이터 수.
+
+        Returns:
+            Iterator[Dict[Any, Any]]: 데이터별 처리 결과 딕셔너리 (입력 순서 유지).
+
+        Raises:
+            RuntimeError: 등록된 프로세서가 없는 경우.
+            ValueError: chunk_size가 1보다 작은 경우.
+            KeyError: 서로 다른 프로세서가 동일한 키를 반환한 경우 (반복 중 발생).
+        """
+        cls = self.__class__.__name__
+        if not self.__processor_set:
+            raise RuntimeError(
+                f"[{cls}] No processors registered. Add at least one before running."
+            )
+        if chunk_size < 1:
+            raise ValueError(f"[{cls}] chunk_size must be >= 1: {chunk_size}")
+
+        return self.__iter_batch(records, executor, chunk_size)
+
+    def __iter_batch(
+        self,
+        records: Iterable[Any],
+        executor: Optional[Executor],
+        chunk_size: int,
+    ) -> Iterator[Dict[Any, Any]]:
+        """run_batch()의 제너레이터 본체."""
+        processors = list(self.__processor_set)
+        iterator = iter(records)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+
+        if executor is None:
+            for chunk in chunks:
+                yield from _run_chunk(processors, chunk)
+            return
+
+        pending: Deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_run_chunk, processors, chunk))
+                if len(pending) >= self.__PENDING_CHUNKS_PER_BATCH:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def run_for(
+        self,
+        data: Any,
+        output_keys: Iterable[Any],
+        executor: Optional[Executor] = None,
+    ) -> Dict[Any, Any]:
+        """요청한 결과 키를 만드는 데 필요한 프로세서만 의존성 순서대로 실행합니다.
+
+        프로세서가 선언한 get_input_keys() / get_output_key()로 의존성 그래프를 만들고,
+        요청한 키에 필요하지 않은 프로세서는 실행하지 않습니다.
+        여러 프로세서가 공유하는 중간 결과는 데이터마다 한 번만 계산됩니다.
+        executor를 지정하면 서로 의존하지 않는 같은 단계의 프로세서를 병렬로 실행합니다.
+
+        Args:
+            data (Any): 입력 데이터.
+            output_keys (Iterable[Any]): 반환받을 결과 키 목록.
+            executor (Optional[Executor]): 같은 단계의 프로세서를 실행할 실행기.
+
+        Returns:
+            Dict[Any, Any]: {요청한 결과 키: 값} (중간 결과는 포함하지 않음).
+
+        Raises:
+            RuntimeError: 등록된 프로세서가 없는 경우.
+            KeyError: 결과 키를 만드는 프로세서가 없거나, 결과 키가 중복 선언된 경우,
+                또는 프로세서가 선언과 다른 키를 반환한 경우.
+            ValueError: 의존성에 순환이 있는 경우.
+        """
+        if not self.__processor_set:
+            cls = self.__class__.__name__
+            raise RuntimeError(
+                f"[{cls}] No processors registered. Add at least one before running."
+            )
+
+        output_keys = list(output_keys)
+        plan_key = frozenset(output_keys)
+        plan = self.__plans.get(plan_key)
+        if plan is None:
+            plan = self.__build_plan(output_keys)
+            self.__plans[plan_key] = plan
+
+        results: Dict[Any, Any] = {}
+        for stage in plan:
+            jobs = [
+                (processor, {key: results[key] for key in processor.get_input_keys()})
+                for processor in stage
+            ]
+            if executor is None or len(jobs) == 1:
+                pairs = [_run_node(processor, data, inputs) for processor, inputs in jobs]
+            else:
+                futures = [
+                    executor.submit(_run_node, processor, data, inputs)
+                    for processor, inputs in jobs
+                ]
+                pairs = [future.result() for future in futures]
+            results.update(pairs)
+
+        return {key: results[key] for key in output_keys}
+
+    def __build_plan(self, output_keys: List[Any]) -> List[List[ICrawlDataProcessor]]:
+        """요청한 결과 키에 필요한 프로세서를 단계별로 묶은 실행 계획을 생성.
+
+        각 프로세서의 단계는 (입력 프로세서 단계의 최댓값 + 1)이며,
+        같은 단계의 프로세서는 서로 의존하지 않으므로 동시에 실행할 수 있습니다.
+
+        Args:
+            output_keys (List[Any]): 요청한 결과 키 목록.
+
+        Returns:
+            List[List[ICrawlDataProcessor]]: 단계 순서의 프로세서 목록 (단계 안은 등록 순서).
+
+        Raises:
+            KeyError: 결과 키를 만드는 프로세서가 없거나 결과 키가 중복 선언된 경우.
+            ValueError: 의존성에 순환이 있는 경우.
+        """
+        cls = self.__class__.__name__
+        producers: Dict[Any, ICrawlDataProcessor] = {}
+        for processor in self.__processor_set:
+            key = processor.get_output_key()
+            if key in producers:
+                raise KeyError(f"[{cls}] Duplicate key declared by processors: '{key}'")
+            producers[key] = processor
+
+        stages: Dict[Any, int] = {}
+        for key in output_keys:
+            self.__assign_stage(key, producers, stages, [])
+
+        plan: List[List[ICrawlDataProcessor]] = [
+            [] for _ in range(max(stages.values(), default=-1) + 1)
+        ]
+        for processor in self.__processor_set:
+            key = processor.get_output_key()
+            if key in stages:
+                plan[stages[key]].append(processor)
+        return plan
+
+    def __assign_stage(
+        self,
+        key: Any,
+        producers: Dict[Any, ICrawlDataProcessor],
+        stages: Dict[Any, int],
+        path: List[Any],
+    ) -> int:
+        """결과 키를 만드는 프로세서의 실행 단계를 깊이 우선으로 계산.
+
+        Args:
+            key (Any): 결과 키.
+            producers (Dict[Any, ICrawlDataProcessor]): {결과 키: 프로세서}.
+            stages (Dict[Any, int]): 계산이 끝난 {결과 키: 단계} (메모이즈).
+            path (List[Any]): 현재 탐색 중인 키 경로 (순환 검사용).
+
+        Returns:
+            int: 실행 단계 (입력이 없으면 0).
+
+        Raises:
+            KeyError: 결과 키를 만드는 프로세서가 없는 경우.
+            ValueError: 의존성에 순환이 있는 경우.
+        """
+        cls = self.__class__.__name__
+        if key in stages:
+            return stages[key]
+        if key in path:
+            cycle = " -> ".join(repr(k) for k in path[path.index(key) :] + [key])
+            raise ValueError(f"[{cls}] Dependency cycle detected: {cycle}")
+        if key not in producers:
+            raise KeyError(f"[{cls}] No processor produces key: '{key}'")
+
+        path.append(key)
+        stage = 0
+        for input_key in producers[key].get_input_keys():
+            stage = max(stage, self.__assign_stage(input_key, producers, stages, path) + 1)
+        path.pop()
+
+        stages[key] = stage
+        return stage
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+
+class CrawlDedupIndex:
+    """이미 본 레코드의 해시를 SQLite에 저장해 새 레코드만 걸러내는 영구 중복 제거 색인.
+
+    레코드(또는 지정한 키 필드)를 정규화한 JSON의 BLAKE2b 해시(16바이트)만 저장하므로
+    레코드 크기와 관계없이 항목당 수십 바이트만 사용합니다. 해시는 WITHOUT ROWID 테이블의
+    기본 키 B-트리에 저장되어 수백만 항목에서도 조회가 로그 시간이며,
+    메모리 사용량은 SQLite 페이지 캐시(cache_kib)로 제한됩니다.
+
+    Attributes:
+        __DIGEST_SIZE (int): 해시 길이(바이트).
+        __QUERY_BATCH (int): 한 번의 IN 조회에 넣을 최대 해시 수 (SQLite 변수 수 제한 이하).
+    """
+
+    __DIGEST_SIZE = 16
+    __QUERY_BATCH = 500
+
+    def __init__(
+        self,
+        db_path: str,
+        key_fields: Optional[Sequence[str]] = None,
+        cache_kib: int = 8 * 1024,
+    ):
+        """CrawlDedupIndex 생성자. 색인 파일이 없으면 새로 만듭니다.
+
+        Args:
+            db_path (str): SQLite 파일 경로 (":memory:"이면 메모리 색인).
+            key_fields (Optional[Sequence[str]]): 중복 판단에 사용할 필드.
+                None이면 레코드 전체를 사용합니다.
+            cache_kib (int): SQLite 페이지 캐시 크기(KiB).
+
+        Raises:
+            ValueError: key_fields가 빈 목록이거나 cache_kib가 1보다 작은 경우.
+        """
+        cls = self.__class__.__name__
+        if key_fields is not None and not key_fields:
+            raise ValueError(f"[{cls}] key_fields must not be empty.")
+        if cache_kib < 1:
+            raise ValueError(f"[{cls}] cache_kib must be >= 1: {cache_kib}")
+
+        self.__key_fields: Optional[List[str]] = (
+            list(key_fields) if key_fields is not None else None
+        )
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        self.__conn.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (hash BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.__conn.commit()
+
+    def get_key(self, record: Dict[str, Any]) -> bytes:
+        """레코드의 중복 판단용 해시를 계산합니다.
+
+        키 순서와 관계없이 같은 내용이면 같은 해시가 되도록 정렬된 JSON으로 정규화합니다.
+
+        Args:
+            record (Dict[str, Any]): 레코드.
+
+        Returns:
+            bytes: 16바이트 BLAKE2b 해시.
+
+        Raises:
+            KeyError: key_fields에 지정한 필드가 레코드에 없는 경우.
+        """
+        if self.__key_fields is not None:
+            record = {field: record[field] for field in self.__key_fields}
+        normalized = json.dumps(
+            record,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.blake2b(
+            normalized.encode("utf-8"), digest_size=self.__DIGEST_SIZE
+        ).digest()
+
+    def __find_existing_locked(self, keys: List[bytes]) -> Set[bytes]:
+        """색인에 이미 있는 해시를 조회 (잠금을 보유한 상태에서 호출)."""
+        existing: Set[bytes] = set()
+        for i in range(0, len(keys), self.__QUERY_BATCH):
+            part = keys[i : i + self.__QUERY_BATCH]
+            placeholders = ",".join("?" * len(part))
+            existing.update(
+                row[0]
+                for row in self.__conn.execute(
+                    f"SELECT hash FROM seen WHERE hash IN ({placeholders})", part
+                )
+            )
+        return existing
+
+    def __insert(self, keys: List[bytes]) -> None:
+        """해시를 색인에 추가하고 커밋."""
+        if not keys:
+            return
+        with self.__lock:
+            self.__conn.executemany(
+                "INSERT OR IGNORE INTO seen (hash) VALUES (?)", ((k,) for k in keys)
+            )
+            self.__conn.commit()
+
+    def add(self, record: Dict[str, Any]) -> bool:
+        """레코드를 색인에 추가합니다.
+
+        Args:
+            record (Dict[str, Any]): 레코드.
+
+        Returns:
+            bool: 새 레코드이면 True, 이미 본 레코드이면 False.
+        """
+        key = self.get_key(record)
+        with self.__lock:
+            cursor = self.__conn.execute(
+                "INSERT OR IGNORE INTO seen (hash) VALUES (?)", (key,)
+            )
+            self.__conn.commit()
+            return cursor.rowcount == 1
+
+    def filter_new(
+        self, records: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """처음 보는 레코드만 반환하고 색인에 추가합니다.
+
+        레코드를 batch_size개씩 묶어 한 번에 조회/추가하며, 같은 묶음 안의 중복도 제거합니다.
+        반환한 레코드만 색인에 추가하므로 소비 도중 중단해도 받지 못한 레코드는 다음에 다시 반환됩니다.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): 레코드 (CrawlClient 결과, run_batch() 결과 등).
+            batch_size (int): 한 번에 조회할 레코드 수.
+
+        Yields:
+            Dict[str, Any]: 새 레코드 (입력 순서 유지).
+
+        Raises:
+            ValueError: batch_size가 1보다 작은 경우.
+        """
+        if batch_size < 1:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] batch_size must be >= 1: {batch_size}")
+
+        iterator = iter(records)
+        for batch in iter(lambda: list(islice(iterator, batch_size)), []):
+            keys = [self.get_key(record) for record in batch]
+            with self.__lock:
+                seen = self.__find_existing_locked(keys)
+
+            emitted: List[bytes] = []
+            try:
+                for key, record in zip(keys, batch):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    emitted.append(key)
+                    yield record
+            finally:
+                self.__insert(emitted)
+
+    def __contains__(self, record: Dict[str, Any]) -> bool:
+        key = self.get_key(record)
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT 1 FROM seen WHERE hash = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self.__lock:
+            self.__conn.close()
+
+    def __enter__(self) -> "CrawlDedupIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
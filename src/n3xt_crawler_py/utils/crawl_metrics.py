@@ -0,0 +1,221 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+LabelItems = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class CrawlMetricEvent:
+    """훅에 전달되는 측정 이벤트.
+
+    Attributes:
+        kind (str): "counter" 또는 "timer".
+        name (str): 지표 이름 (예: "crawl_request_seconds").
+        value (float): 증가량 또는 측정 시간(초).
+        labels (Dict[str, str]): 레이블.
+    """
+
+    kind: str
+    name: str
+    value: float
+    labels: Dict[str, str]
+
+
+class CrawlMetrics:
+    """요청/파싱/처리 단계별 카운터와 타이머를 모으는 지표 저장소.
+
+    - 카운터: 누적 값 (요청 수, 다운로드 바이트, 재시도 횟수 등)
+    - 타이머: 횟수, 합계, 최댓값 (단계별 소요 시간)
+    - 훅: 측정할 때마다 CrawlMetricEvent를 받는 콜백 (로그, 추적 시스템 연동용)
+    여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__counters: Dict[Tuple[str, LabelItems], float] = {}
+        # [횟수, 합계, 최댓값]
+        self.__timers: Dict[Tuple[str, LabelItems], List[float]] = {}
+        self.__hooks: List[Callable[[CrawlMetricEvent], None]] = []
+
+    def add_hook(self, hook: Callable[[CrawlMetricEvent], None]) -> None:
+        """측정 이벤트를 받을 훅을 등록합니다.
+
+        훅은 측정한 스레드에서 동기적으로 호출되므로 가벼워야 합니다.
+
+        Args:
+            hook (Callable[[CrawlMetricEvent], None]): 이벤트 콜백.
+        """
+        with self.__lock:
+            self.__hooks = [*self.__hooks, hook]
+
+    def __emit(self, kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        for hook in self.__hooks:
+            hook(CrawlMetricEvent(kind, name, value, labels))
+
+    def increment(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """카운터를 증가시킵니다.
+
+        Args:
+            name (str): 지표 이름.
+            value (float): 증가량.
+            **labels (Any): 레이블 (문자열로 변환).
+        """
+        labels = {k: str(v) for k, v in labels.items()}
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0.0) + value
+        if self.__hooks:
+            self.__emit("counter", name, value, labels)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """타이머에 측정 시간을 기록합니다.
+
+        Args:
+            name (str): 지표 이름.
+            seconds (float): 소요 시간(초).
+            **labels (Any): 레이블 (문자열로 변환).
+        """
+        labels = {k: str(v) for k, v in labels.items()}
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            timer = self.__timers.get(key)
+            if timer is None:
+                self.__timers[key] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+        if self.__hooks:
+            self.__emit("timer", name, seconds, labels)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """with 블록의 소요 시간을 기록하는 컨텍스트 매니저.
+
+        Args:
+            name (str): 지표 이름.
+            **labels (Any): 레이블.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def __series(name: str, labels: LabelItems) -> str:
+        """Prometheus 시계열 표기 (`name{label="value"}`)."""
+        if not labels:
+            return name
+        pairs = []
+        for key, value in labels:
+            value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            pairs.append(f'{key}="{value}"')
+        return f"{name}{{{','.join(pairs)}}}"
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """현재 값을 복사해 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {"counters": {시계열: 값},
+                "timers": {시계열: {"count", "sum", "max"}}}.
+                시계열 이름은 Prometheus 표기(`name{label="value"}`)입니다.
+        """
+        with self.__lock:
+            counters = dict(self.__counters)
+            timers = {key: list(value) for key, value in self.__timers.items()}
+        return {
+            "counters": {
+                self.__series(name, labels): value
+                for (name, labels), value in sorted(counters.items())
+            },
+            "timers": {
+                self.__series(name, labels): {
+                    "count": int(count),
+                    "sum": total,
+                    "max": maximum,
+                }
+                for (name, labels), (count, total, maximum) in sorted(timers.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환합니다.
+
+        카운터는 counter, 타이머는 summary(`_count`, `_sum`)와 최댓값 gauge(`_max`)로 출력합니다.
+
+        Returns:
+            str: 노출 형식 문자열.
+        """
+        with self.__lock:
+            counters = sorted(self.__counters.items())
+            timers = sorted(self.__timers.items())
+
+        lines: List[str] = []
+        declared = set()
+
+        def declare(metric: str, kind: str) -> None:
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} {kind}")
+
+        for (name, labels), value in counters:
+            declare(name, "counter")
+            lines.append(f"{self.__series(name, labels)} {self.__format(value)}")
+        for (name, labels), (count, total, _) in timers:
+            declare(name, "summary")
+            lines.append(f"{self.__series(name + '_count', labels)} {int(count)}")
+            lines.append(f"{self.__series(name + '_sum', labels)} {self.__format(total)}")
+        for (name, labels), (_, _, maximum) in timers:
+            declare(name + "_max", "gauge")
+            lines.append(f"{self.__series(name + '_max', labels)} {self.__format(maximum)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    @staticmethod
+    def __format(value: float) -> str:
+        if math.isfinite(value) and value == int(value):
+            return str(int(value))
+        return repr(float(value))
+
+    def reset(self) -> None:
+        """모든 카운터와 타이머를 비웁니다 (훅은 유지)."""
+        with self.__lock:
+            self.__counters.clear()
+            self.__timers.clear()
+
+
+# 계측 지점은 get_active()가 None이면 아무것도 하지 않으므로, 비활성 상태의 비용은 전역 조회 한 번
+_active: Optional[CrawlMetrics] = None
+
+
+def enable(metrics: Optional[CrawlMetrics] = None) -> CrawlMetrics:
+    """지표 수집을 켭니다.
+
+    Args:
+        metrics (Optional[CrawlMetrics]): 사용할 저장소. None이면 새로 만듭니다.
+
+    Returns:
+        CrawlMetrics: 활성화된 저장소.
+    """
+    global _active
+    _active = metrics if metrics is not None else CrawlMetrics()
+    return _active
+
+
+def disable() -> None:
+    """지표 수집을 끕니다."""
+    global _active
+    _active = None
+
+
+def get_active() -> Optional[CrawlMetrics]:
+    """활성화된 지표 저장소 반환.
+
+    Returns:
+        Optional[CrawlMetrics]: 수집 중이면 저장소, 아니면 None.
+    """
+    return _active
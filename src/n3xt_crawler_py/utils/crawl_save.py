@@ -1,25 +1,50 @@
 import os
 import datetime
+import warnings
 from typing import List, Dict, Optional
 
 
 def save_dict_list_as_file(data_dict_list: List[Dict], dir_path: str) -> Optional[str]:
+    """딕셔너리 목록을 `컬럼: 값` 형식의 텍스트 파일로 저장합니다.
+
+    더 이상 권장하지 않습니다. 스트리밍 기록과 다시 읽기가 가능한
+    n3xt_crawler_py.utils.crawl_writer.CrawlRecordWriter를 사용하세요.
+
+    Args:
+        data_dict_list (List[Dict]): 저장할 딕셔너리 목록.
+        dir_path (str): 저장 디렉터리.
+
+    Returns:
+        Optional[str]: 저장한 파일의 절대 경로. 목록이 비어 있으면 None.
+
+    Raises:
+        OSError: 파일 쓰기에 실패한 경우.
+    """
+    warnings.warn(
+        "save_dict_list_as_file is deprecated; use CrawlRecordWriter instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if not data_dict_list:
         return None
 
     os.makedirs(dir_path, exist_ok=True)
 
-    filename = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".txt"
-    filepath = os.path.join(dir_path, filename)
+    # 같은 초에 여러 번 저장해도 덮어쓰지 않도록 마이크로초와 순번을 붙이고 배타적으로 생성
+    stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+    seq = 0
+    while True:
+        filepath = os.path.join(dir_path, f"{stamp}_{seq}.txt")
+        try:
+            file = open(filepath, "x", encoding="utf-8")
+            break
+        except FileExistsError:
+            seq += 1
 
-    try:
-        with open(filepath, "w", encoding="utf-8") as file:
-            for data_dict in data_dict_list:
-                for column, content in data_dict.items():
-                    file.write(f"{column}: {content}\n")
-                file.write("\n")  # 각 딕셔너리 구분
+    with file:
+        for data_dict in data_dict_list:
+            for column, content in data_dict.items():
+                file.write(f"{column}: {content}\n")
+            file.write("\n")  # 각 딕셔너리 구분
 
-        return os.path.abspath(filepath)
-    except Exception as e:
-        print(f"[save_dict_list_as_file] Error: {e}")
-        return None
+    return os.path.abspath(filepath)
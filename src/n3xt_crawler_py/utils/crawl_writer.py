@@ -0,0 +1,525 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성 (pip install zstandard)
+    zstandard = None
+
+
+class CrawlCompression(Enum):
+    """기록 파일의 스트리밍 압축 방식. 값은 파일 이름에 덧붙는 확장자입니다.
+
+    ZSTD는 선택 의존성인 zstandard가 필요합니다 (`pip install zstandard`).
+    """
+
+    NONE = ""
+    GZIP = ".gz"
+    ZSTD = ".zst"
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _open_compressed_writer(
+    file: BinaryIO, compression: CrawlCompression, level: Optional[int], name: str
+) -> BinaryIO:
+    """파일에 압축해 기록하는 스트림 생성 (close()해도 원본 파일은 닫지 않음).
+
+    Args:
+        file (BinaryIO): 바이너리 쓰기 모드로 연 파일.
+        compression (CrawlCompression): 압축 방식.
+        level (Optional[int]): 압축 수준. None이면 방식별 기본값 (gzip 6, zstd 3).
+        name (str): gzip 헤더에 기록할 원본 파일 이름 (압축 확장자 제외).
+            지정하지 않으면 GzipFile이 `.part` 임시 파일 이름을 기록합니다.
+
+    Returns:
+        BinaryIO: 압축 스트림. NONE이면 파일 그대로.
+
+    Raises:
+        ImportError: ZSTD인데 zstandard가 설치되어 있지 않은 경우.
+    """
+    if compression == CrawlCompression.GZIP:
+        return gzip.GzipFile(
+            filename=name,
+            fileobj=file,
+            mode="wb",
+            compresslevel=6 if level is None else level,
+        )
+    if compression == CrawlCompression.ZSTD:
+        if zstandard is None:
+            raise ImportError("zstandard is required for ZSTD: pip install zstandard")
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(file, closefd=False)
+    return file
+
+
+def _open_decompressed_reader(file: BinaryIO) -> BinaryIO:
+    """파일 앞부분의 매직 바이트로 압축 방식을 판별해 압축을 푸는 스트림 생성.
+
+    Args:
+        file (BinaryIO): 바이너리 읽기 모드로 연 파일 (seek 가능).
+
+    Returns:
+        BinaryIO: 압축을 푼 내용을 읽는 스트림. 압축되지 않은 파일이면 파일 그대로.
+
+    Raises:
+        ImportError: zstd 파일인데 zstandard가 설치되어 있지 않은 경우.
+    """
+    magic = file.read(len(_ZSTD_MAGIC))
+    file.seek(0)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=file, mode="rb")
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ImportError("zstandard is required for ZSTD: pip install zstandard")
+        # 줄 단위 순회(JSONL, CSV)를 위해 버퍼를 씌움
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(file))
+    return file
+
+
+class ICrawlRecordEncoder(ABC):
+    """레코드(딕셔너리)를 파일 형식에 맞게 직렬화/역직렬화하는 인터페이스."""
+
+    @abstractmethod
+    def get_extension(self) -> str:
+        """파일 확장자 반환 (예: ".jsonl")."""
+        pass
+
+    def get_header(self) -> bytes:
+        """새 파일의 시작 부분에 쓸 헤더 반환. 기본값은 빈 바이트.
+
+        Returns:
+            bytes: 파일 헤더.
+        """
+        return b""
+
+    @abstractmethod
+    def encode_many(self, records: List[Dict[str, Any]]) -> bytes:
+        """레코드 목록을 한 번에 직렬화합니다.
+
+        Args:
+            records (List[Dict[str, Any]]): 직렬화할 레코드.
+
+        Returns:
+            bytes: 파일에 이어 쓸 바이트.
+        """
+        pass
+
+    @abstractmethod
+    def iter_decode(self, file: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """파일에서 레코드를 하나씩 읽어 반환합니다.
+
+        Args:
+            file (BinaryIO): 바이너리 모드로 연 파일.
+
+        Yields:
+            Dict[str, Any]: 레코드.
+        """
+        pass
+
+
+class CrawlJsonlEncoder(ICrawlRecordEncoder):
+    """한 줄에 JSON 객체 하나를 쓰는 JSON Lines 형식."""
+
+    def get_extension(self) -> str:
+        return ".jsonl"
+
+    def encode_many(self, records: List[Dict[str, Any]]) -> bytes:
+        return "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        ).encode("utf-8")
+
+    def iter_decode(self, file: BinaryIO) -> Iterator[Dict[str, Any]]:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class CrawlCsvEncoder(ICrawlRecordEncoder):
+    """CSV 형식. 파일마다 헤더 행을 쓰며, 문자열이 아닌 값은 JSON으로 기록합니다.
+
+    읽어 들인 레코드의 값은 모두 문자열입니다.
+    """
+
+    def __init__(self, fieldnames: List[str]):
+        """CrawlCsvEncoder 생성자.
+
+        Args:
+            fieldnames (List[str]): 열 이름 (순서대로 기록).
+
+        Raises:
+            ValueError: 열 이름이 비어 있는 경우.
+        """
+        if not fieldnames:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] fieldnames must not be empty.")
+        self.__fieldnames: List[str] = list(fieldnames)
+
+    def get_extension(self) -> str:
+        return ".csv"
+
+    def get_header(self) -> bytes:
+        return self.__write_rows([dict(zip(self.__fieldnames, self.__fieldnames))])
+
+    def encode_many(self, records: List[Dict[str, Any]]) -> bytes:
+        return self.__write_rows(
+            [
+                {
+                    key: (
+                        value
+                        if isinstance(value, str)
+                        else json.dumps(value, ensure_ascii=False)
+                    )
+                    for key, value in record.items()
+                }
+                for record in records
+            ]
+        )
+
+    def __write_rows(self, rows: List[Dict[str, str]]) -> bytes:
+        """csv 모듈로 행을 직렬화 (알 수 없는 열 이름은 ValueError)."""
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, self.__fieldnames, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def iter_decode(self, file: BinaryIO) -> Iterator[Dict[str, Any]]:
+        text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        try:
+            yield from csv.DictReader(text)
+        finally:
+            text.detach()
+
+
+class CrawlBinaryEncoder(ICrawlRecordEncoder):
+    """길이 접두(length-prefixed) 바이너리 형식.
+
+    파일은 매직 헤더로 시작하고, 각 레코드는 4바이트 빅엔디언 길이와
+    공백 없는(compact) JSON(UTF-8) 본문으로 구성됩니다. 줄바꿈 이스케이프가 필요 없고,
+    길이만 읽고 레코드를 건너뛸 수 있습니다.
+
+    Attributes:
+        __MAGIC (bytes): 파일 헤더.
+        __LENGTH (struct.Struct): 레코드 길이 접두 형식.
+    """
+
+    __MAGIC = b"N3XTREC1"
+    __LENGTH = struct.Struct(">I")
+
+    def get_extension(self) -> str:
+        return ".rec"
+
+    def get_header(self) -> bytes:
+        return self.__MAGIC
+
+    def encode_many(self, records: List[Dict[str, Any]]) -> bytes:
+        parts: List[bytes] = []
+        for record in records:
+            payload = json.dumps(
+                record, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            parts.append(self.__LENGTH.pack(len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+    def iter_decode(self, file: BinaryIO) -> Iterator[Dict[str, Any]]:
+        cls = self.__class__.__name__
+        if file.read(len(self.__MAGIC)) != self.__MAGIC:
+            raise ValueError(f"[{cls}] Not a record file (bad magic header).")
+
+        while True:
+            prefix = file.read(self.__LENGTH.size)
+            if not prefix:
+                return
+            if len(prefix) != self.__LENGTH.size:
+                raise ValueError(f"[{cls}] Truncated record length prefix.")
+            (length,) = self.__LENGTH.unpack(prefix)
+            payload = file.read(length)
+            if len(payload) != length:
+                raise ValueError(f"[{cls}] Truncated record body.")
+            yield json.loads(payload)
+
+
+class CrawlRecordWriter:
+    """레코드를 파일에 이어 쓰는 스트리밍 기록기.
+
+    - 레코드는 메모리 버퍼에 모았다가 buffer_bytes를 넘으면 한 번에 기록합니다.
+    - 파일 크기(max_bytes) 또는 경과 시간(max_seconds)을 넘으면 새 파일로 교체합니다.
+    - 쓰는 중인 파일은 `.part` 확장자를 가지며, 교체/종료 시 최종 이름으로 원자적으로 rename됩니다.
+      따라서 최종 이름의 파일은 항상 완성된 파일입니다.
+    - 파일 이름은 `<prefix>_<마이크로초 시각>_<pid>_<순번><확장자>`이며 기존 파일과 겹치지 않습니다.
+    - 레코드를 하나도 쓰지 않으면 파일을 만들지 않습니다.
+    - compression을 지정하면 파일 전체를 하나의 gzip/zstd 스트림으로 압축하며 기록하고,
+      확장자에 `.gz`/`.zst`를 덧붙입니다. iter_records()는 압축 여부를 자동으로 판별합니다.
+
+    Attributes:
+        __PART_SUFFIX (str): 쓰는 중인 파일의 확장자.
+        __ENCODE_BATCH (int): 교체 제한이 없을 때 한 번에 직렬화할 레코드 수.
+    """
+
+    __PART_SUFFIX = ".part"
+    __ENCODE_BATCH = 256
+
+    def __init__(
+        self,
+        dir_path: str,
+        encoder: ICrawlRecordEncoder,
+        prefix: str = "records",
+        max_bytes: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        buffer_bytes: int = 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+        compression: CrawlCompression = CrawlCompression.NONE,
+        compression_level: Optional[int] = None,
+    ):
+        """CrawlRecordWriter 생성자.
+
+        Args:
+            dir_path (str): 파일을 저장할 디렉터리.
+            encoder (ICrawlRecordEncoder): 파일 형식.
+            prefix (str): 파일 이름 접두사.
+            max_bytes (Optional[int]): 파일 하나의 최대 크기(압축 전 바이트). None이면 제한 없음.
+            max_seconds (Optional[float]): 파일 하나를 쓰는 최대 시간(초). None이면 제한 없음.
+            buffer_bytes (int): 파일에 기록하기 전 모아 둘 버퍼 크기(바이트).
+            clock (Callable[[], float]): 현재 시각(epoch 초) 함수 (테스트용).
+            compression (CrawlCompression): 스트리밍 압축 방식.
+            compression_level (Optional[int]): 압축 수준. None이면 방식별 기본값.
+
+        Raises:
+            ValueError: 제한 값이 0 이하이거나 buffer_bytes가 음수인 경우.
+            ImportError: ZSTD 압축인데 zstandard가 설치되어 있지 않은 경우.
+        """
+        cls = self.__class__.__name__
+        if (max_bytes is not None and max_bytes <= 0) or (
+            max_seconds is not None and max_seconds <= 0
+        ):
+            raise ValueError(f"[{cls}] max_bytes and max_seconds must be positive.")
+        if buffer_bytes < 0:
+            raise ValueError(f"[{cls}] buffer_bytes must not be negative.")
+        if compression == CrawlCompression.ZSTD and zstandard is None:
+            raise ImportError(
+                f"[{cls}] zstandard is required for ZSTD compression: pip install zstandard"
+            )
+
+        self.__dir_path: str = dir_path
+        self.__encoder: ICrawlRecordEncoder = encoder
+        self.__prefix: str = prefix
+        self.__max_bytes: Optional[int] = max_bytes
+        self.__max_seconds: Optional[float] = max_seconds
+        self.__buffer_bytes: int = buffer_bytes
+        self.__clock: Callable[[], float] = clock
+        self.__compression: CrawlCompression = compression
+        self.__compression_level: Optional[int] = compression_level
+
+        self.__seq: int = 0
+        self.__raw_file: Optional[BinaryIO] = None
+        self.__file: Optional[BinaryIO] = None
+        self.__path: Optional[str] = None
+        self.__opened_at: float = 0.0
+        self.__file_bytes: int = 0
+        self.__buffer: List[bytes] = []
+        self.__pending_bytes: int = 0
+        self.__paths: List[str] = []
+        self.__closed: bool = False
+
+        os.makedirs(dir_path, exist_ok=True)
+
+    def __next_path(self) -> str:
+        """기존 파일(.part 포함)과 겹치지 않는 새 파일 경로 생성."""
+        stamp = datetime.datetime.fromtimestamp(self.__clock()).strftime(
+            "%Y%m%d-%H%M%S-%f"
+        )
+        while True:
+            self.__seq += 1
+            name = f"{self.__prefix}_{stamp}_{os.getpid()}_{self.__seq:04d}"
+            extension = self.__encoder.get_extension() + self.__compression.value
+            path = os.path.join(self.__dir_path, name + extension)
+            if not os.path.exists(path) and not os.path.exists(path + self.__PART_SUFFIX):
+                return path
+
+    def __open(self) -> None:
+        """새 `.part` 파일을 열고 헤더를 기록."""
+        while True:
+            path = self.__next_path()
+            try:
+                # 다른 기록기와 이름이 겹치지 않도록 배타적으로 생성
+                self.__raw_file = open(path + self.__PART_SUFFIX, "xb")
+                break
+            except FileExistsError:
+                continue
+
+        # 압축을 풀었을 때의 이름 (예: records_..._0001.jsonl)
+        name = os.path.basename(path)
+        self.__file = _open_compressed_writer(
+            self.__raw_file,
+            self.__compression,
+            self.__compression_level,
+            name[: len(name) - len(self.__compression.value)],
+        )
+        self.__path = path
+        self.__opened_at = self.__clock()
+        header = self.__encoder.get_header()
+        self.__file.write(header)
+        self.__file_bytes = len(header)
+
+    def __flush_buffer(self) -> None:
+        """버퍼에 모인 바이트를 현재 파일에 기록."""
+        if not self.__buffer:
+            return
+        self.__file.write(b"".join(self.__buffer))
+        self.__file_bytes += self.__pending_bytes
+        self.__buffer.clear()
+        self.__pending_bytes = 0
+
+    def __finalize(self) -> None:
+        """현재 파일을 닫고 최종 이름으로 rename."""
+        if self.__file is None:
+            return
+        self.__flush_buffer()
+        if self.__file is not self.__raw_file:
+            self.__file.close()  # 압축 스트림의 끝(트레일러)을 기록
+        self.__raw_file.flush()
+        os.fsync(self.__raw_file.fileno())
+        self.__raw_file.close()
+        os.replace(self.__path + self.__PART_SUFFIX, self.__path)
+        self.__paths.append(os.path.abspath(self.__path))
+        self.__raw_file = None
+        self.__file = None
+        self.__path = None
+
+    def __should_rotate(self) -> bool:
+        """현재 파일이 크기 또는 시간 제한을 넘었는지 검사."""
+        if self.__max_bytes is not None and (
+            self.__file_bytes + self.__pending_bytes >= self.__max_bytes
+        ):
+            return True
+        return (
+            self.__max_seconds is not None
+            and self.__clock() - self.__opened_at >= self.__max_seconds
+        )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """레코드 하나를 기록합니다.
+
+        Args:
+            record (Dict[str, Any]): 기록할 레코드.
+
+        Raises:
+            RuntimeError: 이미 닫힌 기록기인 경우.
+        """
+        self.write_many([record])
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """여러 레코드를 기록합니다. 제너레이터를 넘기면 일정한 메모리로 기록됩니다.
+
+        교체 제한이 없으면 레코드를 묶어 한 번에 직렬화합니다.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): 기록할 레코드.
+
+        Returns:
+            int: 기록한 레코드 수.
+
+        Raises:
+            RuntimeError: 이미 닫힌 기록기인 경우.
+            ValueError: 레코드를 직렬화할 수 없는 경우.
+        """
+        if self.__closed:
+            cls = self.__class__.__name__
+            raise RuntimeError(f"[{cls}] Writer is already closed.")
+
+        rotating = self.__max_bytes is not None or self.__max_seconds is not None
+        batch: List[Dict[str, Any]] = []
+        count = 0
+        for record in records:
+            batch.append(record)
+            # 교체가 필요하면 레코드 단위로, 아니면 묶음 단위로 직렬화
+            if rotating or len(batch) >= self.__ENCODE_BATCH:
+                self.__append(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self.__append(batch)
+            count += len(batch)
+        return count
+
+    def __append(self, records: List[Dict[str, Any]]) -> None:
+        """직렬화한 레코드를 버퍼에 추가하고 필요하면 파일 교체/기록."""
+        data = self.__encoder.encode_many(records)
+
+        if self.__file is not None and self.__should_rotate():
+            self.__finalize()
+        if self.__file is None:
+            self.__open()
+
+        self.__buffer.append(data)
+        self.__pending_bytes += len(data)
+        if self.__pending_bytes >= self.__buffer_bytes:
+            self.__flush_buffer()
+
+    def flush(self) -> None:
+        """버퍼의 내용을 현재 `.part` 파일에 기록합니다.
+
+        압축 중이면 압축 스트림도 비우므로, 자주 호출하면 압축률이 떨어집니다.
+        """
+        if self.__file is not None:
+            self.__flush_buffer()
+            self.__file.flush()
+            self.__raw_file.flush()
+
+    def close(self) -> List[str]:
+        """현재 파일을 완성하고 기록기를 닫습니다.
+
+        Returns:
+            List[str]: 지금까지 완성된 파일의 절대 경로 목록.
+        """
+        if not self.__closed:
+            self.__finalize()
+            self.__closed = True
+        return self.get_paths()
+
+    def get_paths(self) -> List[str]:
+        """완성된(rename된) 파일의 절대 경로 목록 반환.
+
+        Returns:
+            List[str]: 생성 순서의 파일 경로.
+        """
+        return list(self.__paths)
+
+    def __enter__(self) -> "CrawlRecordWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def iter_records(path: str, encoder: ICrawlRecordEncoder) -> Iterator[Dict[str, Any]]:
+    """CrawlRecordWriter로 기록한 파일에서 레코드를 하나씩 읽습니다.
+
+    gzip/zstd로 압축된 파일은 자동으로 판별해 압축을 풀며 읽습니다.
+
+    Args:
+        path (str): 파일 경로.
+        encoder (ICrawlRecordEncoder): 기록할 때 사용한 형식.
+
+    Yields:
+        Dict[str, Any]: 레코드.
+
+    Raises:
+        OSError: 파일을 열 수 없는 경우.
+        ValueError: 파일 형식이 잘못된 경우.
+        ImportError: zstd 파일인데 zstandard가 설치되어 있지 않은 경우.
+    """
+    with open(path, "rb") as f:
+        with _open_decompressed_reader(f) as stream:
+            yield from encoder.iter_decode(stream)
@@ -0,0 +1,155 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Set
+
+from n3xt_crawler_py.web_crawler.crawl_host_scheduler import CrawlHostScheduler
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import ICrawlRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+
+
+@dataclass(frozen=True)
+class CrawlFetchResult:
+    """배치 요청에서 URL 하나에 대한 결과를 담는 불변 데이터 클래스.
+
+    Attributes:
+        url (CrawlUrl): 요청한 URL.
+        response (Optional[CrawlResponse]): 성공 시 응답 객체.
+        error (Optional[Exception]): 실패 시 발생한 예외.
+    """
+
+    url: CrawlUrl
+    response: Optional[CrawlResponse] = None
+    error: Optional[Exception] = None
+
+    def is_success(self) -> bool:
+        """요청 성공 여부 반환.
+
+        Returns:
+            bool: 응답을 받았으면 True.
+        """
+        return self.error is None and self.response is not None
+
+
+class AsyncCrawlRequester:
+    """여러 URL을 동시성 제한 하에 비동기로 요청하는 클래스.
+
+    각 요청은 CrawlRequester를 워커 스레드에서 실행하므로
+    요청 모드(DEFAULT, TOR)와 재시도 동작이 동기 요청과 동일하게 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        mode: CrawlRequestMode = CrawlRequestMode.DEFAULT,
+        concurrency: int = 10,
+        session_pool: Optional[CrawlSessionPool] = None,
+        retry_policy: Optional[ICrawlRetryPolicy] = None,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        max_per_host: Optional[int] = None,
+        cache: Optional[CrawlResponseCache] = None,
+    ):
+        """AsyncCrawlRequester 생성자.
+
+        Args:
+            mode (CrawlRequestMode): 요청 방식 (DEFAULT 또는 TOR).
+            concurrency (int): 동시에 진행할 최대 요청 수.
+            session_pool (Optional[CrawlSessionPool]): 요청 간 공유할 세션 풀.
+            retry_policy (Optional[ICrawlRetryPolicy]): 요청별 재시도 정책.
+            rate_limiter (Optional[CrawlRateLimiter]): 호스트별 요청 속도 제한기.
+                첫 요청의 디스패치에 적용되며, 재시도는 retry_policy의 대기를 따릅니다.
+            max_per_host (Optional[int]): 호스트별 최대 동시 요청 수.
+            cache (Optional[CrawlResponseCache]): 디스크 응답 캐시.
+
+        Raises:
+            ValueError: concurrency 또는 max_per_host가 1보다 작은 경우.
+        """
+        if concurrency < 1 or (max_per_host is not None and max_per_host < 1):
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Concurrency limits must be >= 1: "
+                f"concurrency={concurrency}, max_per_host={max_per_host}"
+            )
+
+        self.__mode: CrawlRequestMode = mode
+        self.__concurrency: int = concurrency
+        self.__session_pool: Optional[CrawlSessionPool] = session_pool
+        self.__retry_policy: Optional[ICrawlRetryPolicy] = retry_policy
+        self.__rate_limiter: Optional[CrawlRateLimiter] = rate_limiter
+        self.__max_per_host: Optional[int] = max_per_host
+        self.__cache: Optional[CrawlResponseCache] = cache
+
+    def __request(self, url: CrawlUrl) -> CrawlFetchResult:
+        """워커 스레드에서 실행되는 단일 동기 요청.
+
+        Args:
+            url (CrawlUrl): 요청할 URL.
+
+        Returns:
+            CrawlFetchResult: 요청 결과 (실패 시 예외 포함).
+        """
+        try:
+            response = CrawlRequester(
+                url,
+                self.__mode,
+                self.__session_pool,
+                self.__retry_policy,
+                cache=self.__cache,
+            ).get_response()
+            return CrawlFetchResult(url, response=response)
+        except Exception as e:
+            return CrawlFetchResult(url, error=e)
+
+    async def fetch_all(
+        self, urls: Iterable[CrawlUrl]
+    ) -> AsyncIterator[CrawlFetchResult]:
+        """URL 목록을 동시에 요청하고 완료되는 순서대로 결과를 반환합니다.
+
+        요청 순서는 CrawlHostScheduler가 호스트별로 번갈아 정하므로
+        속도 제한에 걸린 호스트가 다른 호스트의 요청을 막지 않습니다.
+        한 URL의 실패가 배치 전체를 중단시키지 않도록
+        예외는 CrawlFetchResult.error에 담겨 전달됩니다.
+
+        Args:
+            urls (Iterable[CrawlUrl]): 요청할 URL 목록.
+
+        Yields:
+            CrawlFetchResult: 완료된 요청의 결과.
+        """
+        loop = asyncio.get_running_loop()
+        scheduler = CrawlHostScheduler(self.__rate_limiter, self.__max_per_host)
+        scheduler.add_all(urls)
+
+        executor = ThreadPoolExecutor(max_workers=self.__concurrency)
+        in_flight: Set[asyncio.Future] = set()
+        try:
+            while len(scheduler) or in_flight:
+                wait = 0.0
+                while len(in_flight) < self.__concurrency:
+                    url, wait = scheduler.next_ready()
+                    if url is None:
+                        break
+                    in_flight.add(loop.run_in_executor(executor, self.__request, url))
+
+                if not in_flight:
+                    # 모든 호스트가 속도 제한에 걸린 상태
+                    await asyncio.sleep(wait)
+                    continue
+
+                done, in_flight = await asyncio.wait(
+                    in_flight,
+                    timeout=wait or None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in done:
+                    result: CrawlFetchResult = future.result()
+                    scheduler.done(result.url)
+                    yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,245 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from n3xt_crawler_py.data_parser.crawl_field_extractor import (
+    CrawlFieldSpec,
+    to_field_extractor,
+)
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_download import (
+    CrawlAcceptEncoding,
+    CrawlDownloadLimits,
+)
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import CrawlReplayArchive
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import ICrawlRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import ICrawlTorProxyProvider
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+
+def _extract_records(
+    body: bytes,
+    encoding: Optional[str],
+    parse_mode: CrawlParseMode,
+    block_xpath: str,
+    fields_map: Dict[str, CrawlFieldSpec],
+) -> List[Dict[str, List[str]]]:
+    """워커 프로세스에서 문서를 파싱하고 블록별 필드를 추출.
+
+    프로세스 간에 전달할 수 있도록 인자는 모두 직렬화 가능한 값이며,
+    XPath는 워커 프로세스의 전역 캐시에서 컴파일됩니다.
+
+    Args:
+        body (bytes): 응답 본문.
+        encoding (Optional[str]): 인코딩 힌트.
+        parse_mode (CrawlParseMode): 파싱 모드.
+        block_xpath (str): 블록 XPath.
+        fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 필드 XPath 또는 추출기}.
+
+    Returns:
+        List[Dict[str, List[str]]]: 블록별 필드 데이터 (일반 문자열로 변환됨).
+    """
+    parser = CrawlParser(body, parse_mode, encoding)
+    field_xpaths = {tag: to_field_extractor(spec) for tag, spec in fields_map.items()}
+
+    records: List[Dict[str, List[str]]] = []
+    for block in parser.get_blocks(CrawlXpath(block_xpath)):
+        records.append(
+            {
+                # 스마트 문자열은 트리 참조를 가지므로 일반 문자열로 변환해 반환
+                tag: [
+                    str(v) if isinstance(v, str) else v
+                    for v in parser.extract_field(block, field_xpath)
+                ]
+                for tag, field_xpath in field_xpaths.items()
+            }
+        )
+    return records
+
+
+@dataclass(frozen=True)
+class CrawlBatchResult:
+    """배치 추출에서 URL 하나에 대한 결과를 담는 불변 데이터 클래스.
+
+    Attributes:
+        url (str): 요청한 URL.
+        records (Optional[List[Dict[str, List[str]]]]): 성공 시 블록별 필드 데이터.
+        error (Optional[Exception]): 요청 또는 파싱 실패 시 발생한 예외.
+    """
+
+    url: str
+    records: Optional[List[Dict[str, List[str]]]] = None
+    error: Optional[Exception] = None
+
+    def is_success(self) -> bool:
+        """추출 성공 여부 반환.
+
+        Returns:
+            bool: 블록 데이터를 얻었으면 True.
+        """
+        return self.error is None and self.records is not None
+
+
+class CrawlBatchClient:
+    """여러 URL에 같은 추출 규칙을 적용하는 배치 크롤링 클라이언트.
+
+    요청은 스레드 풀에서 동시에 수행하고, CPU를 사용하는 파싱과 필드 추출은
+    프로세스 풀에서 실행하므로 GIL에 묶이지 않고 모든 코어를 사용합니다.
+    결과는 URL별로 완료되는 순서대로 반환됩니다.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        req_mode: CrawlRequestMode,
+        parse_mode: CrawlParseMode,
+        fetch_concurrency: int = 10,
+        parse_workers: Optional[int] = None,
+        session_pool: Optional[CrawlSessionPool] = None,
+        retry_policy: Optional[ICrawlRetryPolicy] = None,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        cache: Optional[CrawlResponseCache] = None,
+        tor_proxy: Optional[ICrawlTorProxyProvider] = None,
+        replay: Optional[CrawlReplayArchive] = None,
+        limits: Optional[CrawlDownloadLimits] = None,
+        accept_encoding: Optional[CrawlAcceptEncoding] = None,
+    ):
+        """CrawlBatchClient 생성자.
+
+        Args:
+            urls (Iterable[str]): 요청할 URL 목록.
+            req_mode (CrawlRequestMode): 요청 방식 (DEFAULT 또는 TOR).
+            parse_mode (CrawlParseMode): 파싱 모드 (HTML 또는 XML).
+            fetch_concurrency (int): 동시에 진행할 최대 요청 수.
+            parse_workers (Optional[int]): 파싱 프로세스 수. None이면 CPU 코어 수.
+            session_pool (Optional[CrawlSessionPool]): 요청 간 공유할 세션 풀.
+            retry_policy (Optional[ICrawlRetryPolicy]): 요청 재시도 정책.
+            rate_limiter (Optional[CrawlRateLimiter]): 호스트별 속도 제한기.
+            cache (Optional[CrawlResponseCache]): 디스크 응답 캐시.
+            tor_proxy (Optional[ICrawlTorProxyProvider]): TOR 모드에서 사용할 프록시 제공자.
+            replay (Optional[CrawlReplayArchive]): 응답 기록/재생 아카이브.
+            limits (Optional[CrawlDownloadLimits]): 다운로드 제한 시간과 최대 본문 크기.
+            accept_encoding (Optional[CrawlAcceptEncoding]): 협상할 전송 압축 방식.
+                None이면 사용 가능한 모든 방식을 사용합니다.
+
+        Raises:
+            ValueError: URL 형식이 잘못되었거나 동시성 값이 1보다 작은 경우.
+        """
+        if fetch_concurrency < 1 or (parse_workers is not None and parse_workers < 1):
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Concurrency limits must be >= 1: "
+                f"fetch_concurrency={fetch_concurrency}, parse_workers={parse_workers}"
+            )
+
+        self.__urls: List[CrawlUrl] = [CrawlUrl(url) for url in urls]
+        self.__req_mode: CrawlRequestMode = req_mode
+        self.__parse_mode: CrawlParseMode = parse_mode
+        self.__fetch_concurrency: int = fetch_concurrency
+        self.__parse_workers: Optional[int] = parse_workers
+        self.__session_pool: Optional[CrawlSessionPool] = session_pool
+        self.__retry_policy: Optional[ICrawlRetryPolicy] = retry_policy
+        self.__rate_limiter: Optional[CrawlRateLimiter] = rate_limiter
+        self.__cache: Optional[CrawlResponseCache] = cache
+        self.__tor_proxy: Optional[ICrawlTorProxyProvider] = tor_proxy
+        self.__replay: Optional[CrawlReplayArchive] = replay
+        self.__limits: Optional[CrawlDownloadLimits] = limits
+        self.__accept_encoding: Optional[CrawlAcceptEncoding] = accept_encoding
+
+    def __fetch(self, url: CrawlUrl) -> CrawlResponse:
+        """워커 스레드에서 실행되는 단일 요청."""
+        return CrawlRequester(
+            url,
+            self.__req_mode,
+            self.__session_pool,
+            self.__retry_policy,
+            self.__rate_limiter,
+            self.__cache,
+            self.__tor_proxy,
+            self.__replay,
+            self.__limits,
+            accept_encoding=self.__accept_encoding,
+        ).get_response()
+
+    def extract_fields(
+        self,
+        block_xpath: str,
+        fields_map: Dict[str, CrawlFieldSpec],
+        parse_executor: Optional[Executor] = None,
+    ) -> Iterator[CrawlBatchResult]:
+        """모든 URL에서 블록별 필드를 추출하고 URL 단위로 완료 순서대로 반환합니다.
+
+        한 URL의 실패가 배치 전체를 중단시키지 않도록
+        예외는 CrawlBatchResult.error에 담겨 전달됩니다.
+
+        Args:
+            block_xpath (str): 반복되는 데이터 블록을 선택할 XPath.
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 필드 XPath 또는 추출기}.
+                추출기는 pickle되어 워커로 전달되며, 필드 결과는 프로세스 간에 전달되므로 문자열/숫자여야 합니다.
+            parse_executor (Optional[Executor]): 파싱에 사용할 실행기.
+                None이면 parse_workers 크기의 ProcessPoolExecutor를 만들어 사용합니다.
+
+        Yields:
+            CrawlBatchResult: URL 하나의 추출 결과.
+
+        Raises:
+            ValueError: XPath 구문이 잘못된 경우 (요청 전에 검증).
+        """
+        CrawlXpath(block_xpath)
+        for spec in fields_map.values():
+            to_field_extractor(spec)
+
+        owns_parse_executor = parse_executor is None
+        if parse_executor is None:
+            parse_executor = ProcessPoolExecutor(max_workers=self.__parse_workers)
+        fetch_executor = ThreadPoolExecutor(max_workers=self.__fetch_concurrency)
+
+        fetches: Dict[Future, CrawlUrl] = {
+            fetch_executor.submit(self.__fetch, url): url for url in self.__urls
+        }
+        parses: Dict[Future, CrawlUrl] = {}
+        try:
+            while fetches or parses:
+                pending: Set[Future] = set(fetches) | set(parses)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future in fetches:
+                        url = fetches.pop(future)
+                        try:
+                            response = future.result()
+                        except Exception as e:
+                            yield CrawlBatchResult(url.get_url(), error=e)
+                            continue
+                        parse_future = parse_executor.submit(
+                            _extract_records,
+                            response.get_bytes(),
+                            response.get_encoding(),
+                            self.__parse_mode,
+                            block_xpath,
+                            fields_map,
+                        )
+                        parses[parse_future] = url
+                    else:
+                        url = parses.pop(future)
+                        try:
+                            yield CrawlBatchResult(url.get_url(), records=future.result())
+                        except Exception as e:
+                            yield CrawlBatchResult(url.get_url(), error=e)
+        finally:
+            fetch_executor.shutdown(wait=False, cancel_futures=True)
+            if owns_parse_executor:
+                parse_executor.shutdown(wait=False, cancel_futures=True)
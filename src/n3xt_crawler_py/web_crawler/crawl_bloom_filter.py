@@ -0,0 +1,85 @@
+import hashlib
+import math
+from typing import List
+
+
+class CrawlBloomFilter:
+    """고정 크기 비트 배열로 원소의 포함 여부를 확률적으로 판단하는 블룸 필터.
+
+    "없음"은 항상 정확하고, "있음"은 error_rate 이하의 확률로 틀릴 수 있습니다.
+    원소 하나당 약 -ln(error_rate) / ln(2)^2 비트만 사용합니다 (0.1%일 때 약 1.8바이트).
+
+    Attributes:
+        __DIGEST_SIZE (int): 이중 해싱에 사용할 BLAKE2b 해시 길이(바이트).
+    """
+
+    __DIGEST_SIZE = 16
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """CrawlBloomFilter 생성자.
+
+        Args:
+            capacity (int): 예상 원소 수. 넘으면 오탐률이 error_rate보다 커집니다.
+            error_rate (float): 목표 오탐률 (0 < error_rate < 1).
+
+        Raises:
+            ValueError: capacity가 1보다 작거나 error_rate가 범위를 벗어난 경우.
+        """
+        if capacity < 1 or not 0.0 < error_rate < 1.0:
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Invalid bloom filter parameters: "
+                f"capacity={capacity}, error_rate={error_rate}"
+            )
+
+        bit_count = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.__bit_count: int = max(8, bit_count)
+        self.__hash_count: int = max(1, round(self.__bit_count / capacity * math.log(2)))
+        self.__bits: bytearray = bytearray((self.__bit_count + 7) // 8)
+        self.__count: int = 0
+
+    def __positions(self, item: str) -> List[int]:
+        """원소의 비트 위치 목록 계산 (Kirsch-Mitzenmacher 이중 해싱)."""
+        digest = hashlib.blake2b(
+            item.encode("utf-8"), digest_size=self.__DIGEST_SIZE
+        ).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.__bit_count
+        return [(h1 + i * h2) % m for i in range(self.__hash_count)]
+
+    def add(self, item: str) -> bool:
+        """원소를 추가합니다.
+
+        Args:
+            item (str): 추가할 원소.
+
+        Returns:
+            bool: 새 원소로 판단되면 True (하나 이상의 비트가 새로 켜짐).
+        """
+        added = False
+        bits = self.__bits
+        for pos in self.__positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.__count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.__bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self.__positions(item))
+
+    def __len__(self) -> int:
+        """추가된 것으로 판단된 원소 수 (오탐만큼 실제보다 작을 수 있음)."""
+        return self.__count
+
+    def get_size_bytes(self) -> int:
+        """비트 배열 크기 반환.
+
+        Returns:
+            int: 바이트 수.
+        """
+        return len(self.__bits)
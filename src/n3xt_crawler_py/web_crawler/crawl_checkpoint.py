@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+
+
+class CrawlCheckpoint:
+    """크롤링 진행 상태를 추가 전용 저널 파일에 기록하고 재시작 시 복원하는 체크포인트.
+
+    상태가 바뀔 때마다 JSON 한 줄만 파일 끝에 덧붙이므로 기록 비용이 페이지 수와 무관하게 일정합니다.
+    다시 열면 저널을 재생해 대기 중인 URL과 완료된 URL을 복원하고, 비정상 종료로 잘린 마지막 줄은 버립니다.
+
+    저널 형식 (한 줄에 하나):
+        {"op": "add", "url": "...", "depth": 1} : 요청 대상으로 추가됨
+        {"op": "done", "url": "..."}            : 처리 완료 (결과 기록까지 끝남)
+
+    auto_commit=False이면 완료 표시는 commit()을 호출할 때까지 메모리에 보관됩니다.
+    결과 기록기를 flush()한 뒤 commit()하면 "완료로 기록된 페이지의 결과는 반드시 디스크에 있음"이 보장됩니다.
+    """
+
+    def __init__(self, path: str, auto_commit: bool = True, fsync: bool = False):
+        """CrawlCheckpoint 생성자. 저널 파일이 있으면 상태를 복원합니다.
+
+        Args:
+            path (str): 저널 파일 경로.
+            auto_commit (bool): True이면 mark_done() 즉시 저널에 기록합니다.
+            fsync (bool): True이면 기록할 때마다 os.fsync()로 디스크 반영을 기다립니다
+                (OS 충돌까지 대비, 느림). False이면 프로세스 종료에만 안전합니다.
+        """
+        self.__path: str = path
+        self.__auto_commit: bool = auto_commit
+        self.__fsync: bool = fsync
+        self.__lock = threading.Lock()
+        # url -> depth, 삽입 순서가 곧 요청 순서
+        self.__pending: Dict[str, int] = {}
+        self.__done: Set[str] = set()
+        # 커밋 전 완료 표시: url -> depth
+        self.__staged: Dict[str, int] = {}
+        self.__file: Optional[TextIO] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        line_count = self.__replay()
+        if line_count > len(self.__pending) + len(self.__done):
+            self.compact()
+        self.__file = open(path, "a", encoding="utf-8")
+
+    def __replay(self) -> int:
+        """저널을 읽어 상태를 복원하고 읽은 줄 수를 반환 (잘린 마지막 줄은 파일에서 제거)."""
+        if not os.path.exists(self.__path):
+            return 0
+
+        line_count = 0
+        valid_size = 0
+        with open(self.__path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(raw)
+                    op, url = entry["op"], entry["url"]
+                except (ValueError, KeyError, TypeError):
+                    break
+                if op == "add":
+                    if url not in self.__done:
+                        self.__pending[url] = int(entry.get("depth", 0))
+                elif op == "done":
+                    self.__pending.pop(url, None)
+                    self.__done.add(url)
+                line_count += 1
+                valid_size += len(raw)
+
+        if valid_size != os.path.getsize(self.__path):
+            with open(self.__path, "r+b") as f:
+                f.truncate(valid_size)
+        return line_count
+
+    def __append_locked(self, entries: List[Dict]) -> None:
+        """저널에 항목을 덧붙임 (잠금을 보유한 상태에서 호출)."""
+        self.__file.write(
+            "".join(
+                json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for entry in entries
+            )
+        )
+        self.__file.flush()
+        if self.__fsync:
+            os.fsync(self.__file.fileno())
+
+    def add(self, url: str, depth: int = 0) -> bool:
+        """요청 대상 URL을 기록합니다.
+
+        Args:
+            url (str): 정규화된 URL.
+            depth (int): 링크 깊이.
+
+        Returns:
+            bool: 새로 기록되었으면 True. 이미 대기 중이거나 완료된 URL이면 False.
+        """
+        with self.__lock:
+            if url in self.__pending or url in self.__done:
+                return False
+            self.__pending[url] = depth
+            self.__append_locked([{"op": "add", "url": url, "depth": depth}])
+            return True
+
+    def mark_done(self, url: str) -> None:
+        """URL 처리 완료를 표시합니다 (auto_commit=False이면 commit() 시 기록).
+
+        Args:
+            url (str): 완료된 URL.
+        """
+        with self.__lock:
+            if url in self.__done:
+                return
+            self.__staged[url] = self.__pending.pop(url, 0)
+            self.__done.add(url)
+            if self.__auto_commit:
+                self.__commit_locked()
+
+    def __commit_locked(self) -> None:
+        if self.__staged:
+            self.__append_locked([{"op": "done", "url": url} for url in self.__staged])
+            self.__staged.clear()
+
+    def commit(self) -> None:
+        """보류 중인 완료 표시를 저널에 기록합니다."""
+        with self.__lock:
+            self.__commit_locked()
+
+    def is_done(self, url: str) -> bool:
+        """완료된 URL인지 확인합니다.
+
+        Args:
+            url (str): 정규화된 URL.
+
+        Returns:
+            bool: 완료되었으면 True.
+        """
+        with self.__lock:
+            return url in self.__done
+
+    def get_pending(self) -> List[Tuple[str, int]]:
+        """아직 완료되지 않은 URL을 기록 순서대로 반환합니다.
+
+        Returns:
+            List[Tuple[str, int]]: (URL, 깊이) 목록.
+        """
+        with self.__lock:
+            return list(self.__pending.items())
+
+    def get_done(self) -> Set[str]:
+        """완료된 URL 집합 반환.
+
+        Returns:
+            Set[str]: 완료된 URL의 복사본.
+        """
+        with self.__lock:
+            return set(self.__done)
+
+    def compact(self) -> None:
+        """현재 상태만 담은 새 저널로 교체해 파일 크기를 줄입니다 (원자적 rename).
+
+        아직 커밋되지 않은 완료 항목은 대기 상태로 기록됩니다.
+        """
+        with self.__lock:
+            entries = [
+                {"op": "done", "url": url}
+                for url in self.__done
+                if url not in self.__staged
+            ]
+            entries.extend(
+                {"op": "add", "url": url, "depth": depth}
+                for url, depth in [*self.__pending.items(), *self.__staged.items()]
+            )
+
+            tmp_path = self.__path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self.__file is not None:
+                self.__file.close()
+            os.replace(tmp_path, self.__path)
+            if self.__file is not None:
+                self.__file = open(self.__path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        """저널 파일을 닫습니다.
+
+        auto_commit=False에서 commit()하지 않은 완료 표시는 기록되지 않으므로
+        다음 실행에서 해당 URL을 다시 처리합니다.
+        """
+        with self.__lock:
+            if self.__file is not None and not self.__file.closed:
+                self.__file.close()
+
+    def __len__(self) -> int:
+        """대기 중인 URL 수."""
+        with self.__lock:
+            return len(self.__pending)
+
+    def __enter__(self) -> "CrawlCheckpoint":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,19 +1,56 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Union
 
+from n3xt_crawler_py.data_parser.crawl_extraction_plan import CrawlExtractionPlan
+from n3xt_crawler_py.data_parser.crawl_field_column import CrawlFieldColumn
+from n3xt_crawler_py.data_parser.crawl_field_extractor import (
+    CrawlFieldExtractor,
+    CrawlFieldSpec,
+    to_field_extractor,
+)
+from n3xt_crawler_py.data_parser.crawl_incremental_parser import CrawlIncrementalParser
 from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.data_parser.crawl_stream_parser import CrawlStreamParser
+from n3xt_crawler_py.web_crawler.crawl_download import (
+    CrawlAcceptEncoding,
+    CrawlDownloadLimits,
+)
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import CrawlReplayArchive
 from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import ICrawlRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import ICrawlTorProxyProvider
 from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
 from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
 
 
 class CrawlClient:
-    """웹 페이지에서 데이터를 추출하기 위한 고수준 크롤링 클라이언트."""
+    """웹 페이지에서 데이터를 추출하기 위한 고수준 크롤링 클라이언트.
+
+    문서 트리는 extract_fields()가 처음 호출될 때 만들어지므로,
+    iter_extract_fields()만 사용하면 전체 트리를 메모리에 올리지 않습니다.
+
+    Attributes:
+        __STREAM_CHUNK_SIZE (int): 스트리밍 파싱 시 파서에 넘기는 조각 크기.
+    """
+
+    __STREAM_CHUNK_SIZE = 64 * 1024
 
     def __init__(
         self,
         url: str,
         req_mode: CrawlRequestMode,
         parse_mode: CrawlParseMode,
+        session_pool: Optional[CrawlSessionPool] = None,
+        retry_policy: Optional[ICrawlRetryPolicy] = None,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        cache: Optional[CrawlResponseCache] = None,
+        tor_proxy: Optional[ICrawlTorProxyProvider] = None,
+        replay: Optional[CrawlReplayArchive] = None,
+        limits: Optional[CrawlDownloadLimits] = None,
+        incremental_parse: bool = False,
+        accept_encoding: Optional[CrawlAcceptEncoding] = None,
     ):
         """CrawlClient 생성자.
 
@@ -21,27 +58,103 @@ class CrawlClient:
             url (str): 요청할 웹 페이지의 URL.
             req_mode (CrawlRequestMode): 요청 방식 (예: DEFAULT, DYNAMIC 등).
             parse_mode (CrawlParseMode): 파싱 모드 (HTML 또는 XML).
+            session_pool (Optional[CrawlSessionPool]): 여러 클라이언트가 공유할 세션 풀.
+            retry_policy (Optional[ICrawlRetryPolicy]): 요청 재시도 정책.
+            rate_limiter (Optional[CrawlRateLimiter]): 클라이언트 간 공유할 호스트별 속도 제한기.
+            cache (Optional[CrawlResponseCache]): 반복 크롤링용 디스크 응답 캐시.
+            tor_proxy (Optional[ICrawlTorProxyProvider]): TOR 모드에서 사용할 프록시 제공자.
+            replay (Optional[CrawlReplayArchive]): 응답 기록/재생 아카이브.
+            limits (Optional[CrawlDownloadLimits]): 다운로드 제한 시간과 최대 본문 크기.
+            incremental_parse (bool): True이면 다운로드 중에 본문을 바로 파싱해
+                extract_fields() 등에서 다시 파싱하지 않습니다 (캐시/재생 응답은 기존처럼 파싱).
+            accept_encoding (Optional[CrawlAcceptEncoding]): 협상할 전송 압축 방식.
+                None이면 사용 가능한 모든 방식을 사용합니다.
 
         Raises:
-            ValueError: 응답이 비어 있거나 파싱에 실패한 경우 내부적으로 발생할 수 있음.
+            RuntimeError: 요청에 실패한 경우.
         """
+        self.__parse_mode: CrawlParseMode = parse_mode
+        self.__parser: Optional[CrawlParser] = None
+        sink = CrawlIncrementalParser(parse_mode) if incremental_parse else None
         try:
-            self.__response = CrawlRequester(CrawlUrl(url), req_mode).get_response()
-            self.__parser = CrawlParser(self.__response.get_content(), parse_mode)
+            self.__response = CrawlRequester(
+                CrawlUrl(url),
+                req_mode,
+                session_pool,
+                retry_policy,
+                rate_limiter,
+                cache,
+                tor_proxy,
+                replay,
+                limits,
+                sink,
+                accept_encoding,
+            ).get_response()
         except Exception as e:
             cls = self.__class__.__name__
             raise RuntimeError(f"[{cls}] Failed to initialize: {e}") from e
+        if sink is not None:
+            self.__parser = sink.get_parser()
+
+    def __get_parser(self) -> CrawlParser:
+        """문서 트리를 처음 필요할 때 한 번만 생성.
+
+        Returns:
+            CrawlParser: 응답 본문으로 만든 파서.
+
+        Raises:
+            ValueError: 응답 본문 파싱에 실패한 경우.
+        """
+        if self.__parser is None:
+            try:
+                self.__parser = CrawlParser(
+                    self.__response.get_bytes(),
+                    self.__parse_mode,
+                    self.__response.get_encoding(),
+                )
+            except Exception as e:
+                cls = self.__class__.__name__
+                raise ValueError(f"[{cls}] Failed to parse response: {e}") from e
+        return self.__parser
+
+    def __compile_fields(
+        self, fields_map: Dict[str, CrawlFieldSpec]
+    ) -> Dict[str, CrawlFieldExtractor]:
+        """필드 XPath를 블록마다 다시 만들지 않도록 한 번만 컴파일.
+
+        단순 텍스트/속성 XPath는 XPath 엔진을 거치지 않는 빠른 경로로 변환됩니다.
+
+        Args:
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 필드 XPath 또는 추출기}.
+
+        Returns:
+            Dict[str, CrawlFieldExtractor]: {필드이름: 컴파일된 추출기}.
+
+        Raises:
+            ValueError: 필드 XPath 구문이 잘못된 경우.
+        """
+        field_xpaths: Dict[str, CrawlFieldExtractor] = {}
+        for tag, field_xpath in fields_map.items():
+            try:
+                field_xpaths[tag] = to_field_extractor(field_xpath)
+            except Exception as e:
+                cls = self.__class__.__name__
+                raise ValueError(
+                    f"[{cls}] Failed to extract field '{tag}' with XPath '{field_xpath}': {e}"
+                ) from e
+        return field_xpaths
 
     def extract_fields(
         self,
         block_xpath: str,
-        fields_map: Dict[str, str],
+        fields_map: Dict[str, CrawlFieldSpec],
     ) -> List[Dict[str, List[str]]]:
         """지정된 XPath를 기준으로 데이터 블록을 추출하고, 각 필드를 매핑하여 추출합니다.
 
         Args:
             block_xpath (str): 반복되는 데이터 블록을 선택할 XPath.
-            fields_map (Dict[str, str]): {필드이름: 필드 XPath} 구조의 딕셔너리.
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 필드 XPath 또는 추출기} 구조의 딕셔너리.
+                CrawlCssSelector, CrawlRegexField 등의 추출기를 XPath와 섞어 쓸 수 있습니다.
 
         Returns:
             List[Dict[str, List[str]]]: 추출된 블록별 필드 데이터 목록.
@@ -50,26 +163,121 @@ class CrawlClient:
         Raises:
             ValueError: 잘못된 XPath 또는 파싱 오류 발생 시 내부적으로 발생.
         """
+        parser = self.__get_parser()
         try:
-            blocks = self.__parser.get_blocks(CrawlXpath(block_xpath))
+            blocks = parser.get_blocks(CrawlXpath(block_xpath))
         except Exception as e:
             cls = self.__class__.__name__
             raise ValueError(f"[{cls}] Invalid block XPath '{block_xpath}': {e}") from e
 
+        field_xpaths = self.__compile_fields(fields_map)
         results: List[Dict[str, List[str]]] = []
 
         for block in blocks:
             extracted: Dict[str, List[str]] = {}
-            for tag, field_xpath in fields_map.items():
+            for tag, field_xpath in field_xpaths.items():
                 try:
-                    extracted[tag] = self.__parser.extract_field(
-                        block, CrawlXpath(field_xpath)
-                    )
+                    extracted[tag] = parser.extract_field(block, field_xpath)
                 except Exception as e:
                     cls = self.__class__.__name__
                     raise ValueError(
-                        f"[{cls}] Failed to extract field '{tag}' with XPath '{field_xpath}': {e}"
+                        f"[{cls}] Failed to extract field '{tag}' with XPath '{field_xpath.str}': {e}"
                     ) from e
             results.append(extracted)
 
         return results
+
+    def extract_plan(
+        self, plan: CrawlExtractionPlan
+    ) -> Dict[str, List[Dict[str, List[str]]]]:
+        """여러 추출 항목을 이미 받은 응답과 파싱된 트리 하나로 함께 수행합니다.
+
+        목록, 페이지네이션, 메타데이터처럼 종류가 다른 레코드를 한 페이지에서 뽑을 때
+        클라이언트를 다시 만들거나 extract_fields()를 여러 번 호출하지 않아도 됩니다.
+
+        Args:
+            plan (CrawlExtractionPlan): 이름별 블록 XPath와 필드 맵을 담은 추출 계획.
+
+        Returns:
+            Dict[str, List[Dict[str, List[str]]]]: {추출 이름: 블록별 필드 데이터 목록}.
+
+        Raises:
+            ValueError: XPath 평가 또는 파싱 오류 발생 시 내부적으로 발생.
+        """
+        parser = self.__get_parser()
+        try:
+            return plan.run(parser)
+        except Exception as e:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Failed to run extraction plan: {e}") from e
+
+    def extract_columns(
+        self,
+        block_xpath: str,
+        fields_map: Dict[str, CrawlFieldSpec],
+        array_backed: bool = False,
+    ) -> Dict[str, Union[List[List[str]], CrawlFieldColumn]]:
+        """extract_fields()의 열(column) 단위 버전. 필드마다 블록 순서로 정렬된 값을 반환합니다.
+
+        필드마다 추출기를 블록 하나씩 순서대로 평가해 열을 채웁니다 (평가 횟수는
+        extract_fields()와 같음). 블록별 딕셔너리를 만들지 않고, 열 단위로 바로 후처리할 수 있습니다.
+
+        Args:
+            block_xpath (str): 반복되는 데이터 블록을 선택할 XPath.
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 필드 XPath 또는 추출기} 구조의 딕셔너리.
+                CrawlCssSelector, CrawlRegexField 등의 추출기를 XPath와 섞어 쓸 수 있습니다.
+            array_backed (bool): True이면 각 열을 평탄한 값 목록과 오프셋 배열로 보관하는
+                CrawlFieldColumn으로 반환.
+
+        Returns:
+            Dict[str, Union[List[List[str]], CrawlFieldColumn]]: {필드이름: 열}.
+                예: {"title": [["A"], ["B"]], "url": [["http://..."], ["http://..."]]}
+
+        Raises:
+            ValueError: 잘못된 XPath 또는 파싱 오류 발생 시 내부적으로 발생.
+        """
+        parser = self.__get_parser()
+        try:
+            block = CrawlXpath(block_xpath)
+        except Exception as e:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Invalid block XPath '{block_xpath}': {e}") from e
+
+        columns = parser.extract_columns(block, self.__compile_fields(fields_map))
+        if not array_backed:
+            return columns
+        return {tag: CrawlFieldColumn.from_lists(rows) for tag, rows in columns.items()}
+
+    def iter_extract_fields(
+        self,
+        block_xpath: str,
+        fields_map: Dict[str, CrawlFieldSpec],
+    ) -> Iterator[Dict[str, List[str]]]:
+        """extract_fields()의 스트리밍 버전. 블록을 하나씩 파싱해 바로 반환합니다.
+
+        처리한 요소는 즉시 비워지므로 문서 크기와 관계없이 트리 메모리가 거의 일정합니다.
+        단, 응답 본문은 생성 시 이미 모두 받아 둔 상태이므로 원본 바이트(문서 크기만큼)는
+        메모리에 그대로 남습니다. 본문까지 일정한 메모리로 처리하려면 파일 등에서 읽은 조각을
+        CrawlStreamParser.iter_fields()에 직접 넘기세요.
+        블록 XPath는 `//item`, `/rss/channel/item` 같은 단순 경로만 지원합니다.
+
+        Args:
+            block_xpath (str): 반복되는 데이터 블록을 선택할 단순 경로.
+            fields_map (Dict[str, CrawlFieldSpec]): {필드이름: 블록 기준 필드 XPath 또는 추출기}.
+
+        Yields:
+            Dict[str, List[str]]: 블록 하나의 필드 데이터.
+
+        Raises:
+            ValueError: 블록 경로를 스트리밍할 수 없거나 파싱/추출에 실패한 경우.
+        """
+        stream_parser = CrawlStreamParser(
+            block_xpath, self.__parse_mode, self.__response.get_encoding()
+        )
+        field_xpaths = self.__compile_fields(fields_map)
+
+        content = self.__response.get_bytes()
+        size = self.__STREAM_CHUNK_SIZE
+        chunks = (content[i : i + size] for i in range(0, len(content), size))
+
+        yield from stream_parser.iter_fields(chunks, field_xpaths)
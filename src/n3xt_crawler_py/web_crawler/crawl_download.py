@@ -0,0 +1,286 @@
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+
+
+class CrawlBodyTooLargeError(RuntimeError):
+    """응답 본문이 최대 크기를 넘어 다운로드를 중단한 경우 발생하는 예외.
+
+    다시 요청해도 같은 결과이므로 재시도하지 않습니다.
+    """
+
+
+class CrawlDownloadTimeoutError(RuntimeError):
+    """응답 본문 다운로드가 전체 제한 시간을 넘은 경우 발생하는 예외 (재시도 대상)."""
+
+
+@dataclass(frozen=True)
+class CrawlDownloadLimits:
+    """응답 다운로드의 시간과 크기 제한.
+
+    끝나지 않거나 매우 큰 응답(특히 TOR 모드의 .onion 사이트)이 작업자를 무한히 붙잡거나
+    메모리를 고갈시키지 않도록, 본문은 조각 단위로 받으며 매 조각마다 제한을 검사합니다.
+
+    Attributes:
+        connect_timeout (float): 연결 제한 시간(초).
+        read_timeout (float): 데이터 사이의 최대 대기 시간(초).
+        total_timeout (Optional[float]): 요청 시작부터 본문을 모두 받기까지의 제한 시간(초).
+            None이면 제한하지 않습니다.
+        max_bytes (Optional[int]): 디코딩(gzip 해제)된 본문의 최대 크기(바이트).
+            None이면 제한하지 않습니다.
+        chunk_size (int): 한 번에 읽을 최대 바이트 수.
+    """
+
+    connect_timeout: float = 30.0
+    read_timeout: float = 60.0
+    total_timeout: Optional[float] = 300.0
+    max_bytes: Optional[int] = 64 * 1024 * 1024
+    chunk_size: int = 64 * 1024
+
+    def __post_init__(self):
+        """제한 값 검증.
+
+        Raises:
+            ValueError: 제한 시간이나 크기가 0 이하인 경우.
+        """
+        cls = self.__class__.__name__
+        for name in ("connect_timeout", "read_timeout", "total_timeout"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"[{cls}] {name} must be > 0: {value}")
+        for name in ("max_bytes", "chunk_size"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"[{cls}] {name} must be >= 1: {value}")
+
+    def get_timeout(self) -> Tuple[float, float]:
+        """requests에 넘길 (연결, 읽기) 제한 시간.
+
+        Returns:
+            Tuple[float, float]: (connect_timeout, read_timeout).
+        """
+        return self.connect_timeout, self.read_timeout
+
+
+class CrawlAcceptEncoding:
+    """요청의 Accept-Encoding 헤더로 협상할 전송 압축 방식.
+
+    gzip/deflate는 항상 사용할 수 있고, br과 zstd는 urllib3가 디코더를 찾은 경우
+    (`pip install "n3xt_crawler_py[compression]"`)에만 사용할 수 있습니다.
+    대역폭이 병목인 TOR 크롤링에서는 압축률이 높은 방식을 먼저 나열하는 것이 유리합니다.
+
+    Attributes:
+        __IDENTITY (str): 압축하지 않음을 나타내는 값.
+    """
+
+    __IDENTITY = "identity"
+
+    def __init__(self, encodings: Optional[Sequence[str]] = None):
+        """CrawlAcceptEncoding 생성자.
+
+        Args:
+            encodings (Optional[Sequence[str]]): 선호 순서의 압축 방식 (예: ["zstd", "br", "gzip"]).
+                None이면 이 환경에서 디코딩할 수 있는 모든 방식, 빈 목록이면 압축하지 않습니다.
+
+        Raises:
+            ValueError: 디코딩할 수 없는 방식이 포함된 경우.
+        """
+        supported = self.get_supported()
+        if encodings is None:
+            encodings = sorted(supported, key=self.__rank)
+
+        normalized: List[str] = []
+        for encoding in encodings:
+            encoding = encoding.strip().lower()
+            if encoding not in supported:
+                cls = self.__class__.__name__
+                raise ValueError(
+                    f"[{cls}] Unsupported encoding '{encoding}' "
+                    f"(available: {', '.join(supported)})"
+                )
+            if encoding not in normalized:
+                normalized.append(encoding)
+        self.__encodings: Tuple[str, ...] = tuple(normalized)
+
+    @staticmethod
+    def __rank(encoding: str) -> int:
+        """기본 선호 순서 (압축률이 높은 방식 우선)."""
+        order = ("zstd", "br", "gzip", "deflate")
+        return order.index(encoding) if encoding in order else len(order)
+
+    @staticmethod
+    def get_supported() -> Tuple[str, ...]:
+        """이 환경에서 응답을 디코딩할 수 있는 압축 방식 목록.
+
+        Returns:
+            Tuple[str, ...]: 예: ("gzip", "deflate") 또는 ("gzip", "deflate", "br", "zstd").
+        """
+        return tuple(e.strip() for e in ACCEPT_ENCODING.split(",") if e.strip())
+
+    def get_encodings(self) -> Tuple[str, ...]:
+        """협상할 압축 방식 목록 반환.
+
+        Returns:
+            Tuple[str, ...]: 선호 순서의 압축 방식 (비어 있으면 압축하지 않음).
+        """
+        return self.__encodings
+
+    def get_header(self) -> str:
+        """Accept-Encoding 헤더 값 반환.
+
+        Returns:
+            str: 예: "br, gzip, deflate". 압축 방식이 없으면 "identity".
+        """
+        return ", ".join(self.__encodings) or self.__IDENTITY
+
+    def __repr__(self) -> str:
+        return f"CrawlAcceptEncoding({self.get_header()!r})"
+
+
+class ICrawlChunkSink(ABC):
+    """다운로드 중인 응답 본문 조각을 받는 인터페이스.
+
+    파싱을 다운로드와 겹쳐 수행하는 점진적 파서 등에 사용합니다.
+    200 응답의 본문만 전달되며, 재시도하면 start()가 다시 호출되므로 이전 상태를 버려야 합니다.
+    조각 처리 중 발생한 오류는 다운로드를 중단시키지 않도록 구현체가 직접 처리해야 합니다.
+    """
+
+    @abstractmethod
+    def start(self, encoding: Optional[str]) -> None:
+        """새 본문 수신을 시작합니다.
+
+        Args:
+            encoding (Optional[str]): Content-Type 헤더의 charset (없으면 None).
+        """
+        pass
+
+    @abstractmethod
+    def feed(self, chunk: bytes) -> None:
+        """본문 조각 하나를 받습니다.
+
+        Args:
+            chunk (bytes): 디코딩(gzip 해제)된 본문 조각.
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> None:
+        """본문을 끝까지 받았음을 알립니다."""
+        pass
+
+
+class CrawlBodyReader:
+    """stream=True로 받은 응답의 본문을 조각 단위로 읽으며 다운로드 제한을 적용하는 클래스."""
+
+    def __init__(
+        self, limits: CrawlDownloadLimits, sink: Optional[ICrawlChunkSink] = None
+    ):
+        """CrawlBodyReader 생성자.
+
+        Args:
+            limits (CrawlDownloadLimits): 다운로드 제한.
+            sink (Optional[ICrawlChunkSink]): 본문 조각을 함께 받을 대상.
+        """
+        self.__limits: CrawlDownloadLimits = limits
+        self.__sink: Optional[ICrawlChunkSink] = sink
+        self.__wire_bytes: int = 0
+
+    def __iter_chunks(self, resp: requests.Response) -> Iterator[bytes]:
+        """디코딩된 본문 조각을 순서대로 반환."""
+        chunk_size = self.__limits.chunk_size
+        read1 = getattr(resp.raw, "read1", None)
+        if read1 is None:  # urllib3 1.x
+            yield from resp.iter_content(chunk_size)
+            return
+        # read1은 한 번의 수신만 기다리므로 느리게 흘려보내는 응답도 조각마다 제한을 검사
+        while True:
+            chunk = read1(chunk_size, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+
+    def read(self, resp: requests.Response, started: float) -> bytes:
+        """본문을 끝까지 읽습니다.
+
+        다 읽은 본문은 resp.content로도 접근할 수 있도록 응답 객체에 설정하고
+        연결을 세션에 돌려줍니다. 제한을 넘으면 연결을 닫고 예외를 발생시킵니다.
+        압축 해제 전 전송 크기는 get_wire_bytes()로 확인할 수 있습니다.
+
+        Args:
+            resp (requests.Response): stream=True로 받은 응답.
+            started (float): 요청 시작 시각 (time.perf_counter() 기준, 전체 제한 시간의 기준).
+
+        Returns:
+            bytes: 디코딩된 응답 본문.
+
+        Raises:
+            CrawlBodyTooLargeError: 본문이 max_bytes를 넘는 경우.
+            CrawlDownloadTimeoutError: total_timeout을 넘은 경우.
+            Exception: 읽기 제한 시간 초과 등 네트워크 오류 (requests/urllib3 예외).
+        """
+        cls = self.__class__.__name__
+        limits, sink = self.__limits, self.__sink
+        max_bytes = limits.max_bytes
+        deadline = (
+            started + limits.total_timeout if limits.total_timeout is not None else None
+        )
+
+        chunks: List[bytes] = []
+        try:
+            length = resp.headers.get("Content-Length", "")
+            if max_bytes is not None and length.isdigit() and int(length) > max_bytes:
+                raise CrawlBodyTooLargeError(
+                    f"[{cls}] Content-Length {length} exceeds max_bytes {max_bytes}"
+                )
+
+            if sink is not None:
+                sink.start(
+                    CrawlResponse.parse_charset(resp.headers.get("Content-Type", ""))
+                )
+
+            size = 0
+            for chunk in self.__iter_chunks(resp):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise CrawlBodyTooLargeError(
+                        f"[{cls}] Body exceeds max_bytes {max_bytes}"
+                    )
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise CrawlDownloadTimeoutError(
+                        f"[{cls}] Download exceeded total_timeout "
+                        f"{limits.total_timeout}s"
+                    )
+                chunks.append(chunk)
+                if sink is not None:
+                    sink.feed(chunk)
+
+            if sink is not None:
+                sink.finish()
+        except BaseException:
+            resp.close()  # 다 읽지 못한 연결은 재사용할 수 없으므로 닫음
+            raise
+
+        # tell()은 압축 해제 전 (chunked 구분자를 제외한) 실제 전송 바이트 수
+        tell = getattr(resp.raw, "tell", None)
+        self.__wire_bytes = tell() if tell is not None else 0
+
+        # 이후 resp.content(캐시 저장, 기록 등)가 같은 본문을 반환하도록 설정하고 연결 반환
+        body = b"".join(chunks)
+        resp._content = body
+        resp._content_consumed = True
+        resp.close()
+        return body
+
+    def get_wire_bytes(self) -> int:
+        """마지막으로 읽은 본문의 압축 해제 전 전송 크기 반환.
+
+        Returns:
+            int: 전송 바이트 수 (본문을 읽지 않았으면 0).
+        """
+        return self.__wire_bytes
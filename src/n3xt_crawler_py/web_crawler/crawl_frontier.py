@@ -0,0 +1,148 @@
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from n3xt_crawler_py.web_crawler.crawl_seen_set import CrawlSeenSet
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+
+
+@dataclass(frozen=True)
+class CrawlFrontierEntry:
+    """프런티어에서 꺼낸 요청 대상.
+
+    Attributes:
+        url (str): 정규화된 URL.
+        depth (int): 시드로부터의 링크 깊이 (시드는 0).
+        priority (float): 우선순위 (작을수록 먼저).
+    """
+
+    url: str
+    depth: int
+    priority: float
+
+
+class CrawlFrontier:
+    """방문할 URL을 우선순위 순으로 내보내는 크롤링 프런티어.
+
+    - 같은 URL은 정규화 후 한 번만 추가됩니다 (CrawlSeenSet). URL은 요청 시점이 아니라
+      추가 시점에 집합에 기록되므로, 집합은 "방문함"이 아니라 "대기열에 넣은 적 있음"을 뜻합니다.
+    - max_depth를 넘는 링크와 허용되지 않은 호스트의 링크는 추가하지 않습니다.
+    - 기본 우선순위는 깊이이므로 너비 우선(BFS)으로 진행하며, 같은 우선순위는 추가 순서를 따릅니다.
+    """
+
+    def __init__(
+        self,
+        max_depth: int,
+        allowed_hosts: Optional[Iterable[str]] = None,
+        seen: Optional[CrawlSeenSet] = None,
+        priority: Optional[Callable[[str, int], float]] = None,
+    ):
+        """CrawlFrontier 생성자.
+
+        Args:
+            max_depth (int): 따라갈 최대 링크 깊이.
+            allowed_hosts (Optional[Iterable[str]]): 허용할 호스트 (하위 도메인 포함).
+                None이면 호스트를 제한하지 않습니다.
+            seen (Optional[CrawlSeenSet]): 방문 URL 집합. None이면 새로 만듭니다.
+            priority (Optional[Callable[[str, int], float]]): (URL, 깊이) -> 우선순위 함수.
+                None이면 깊이를 우선순위로 사용합니다.
+
+        Raises:
+            ValueError: max_depth가 음수인 경우.
+        """
+        if max_depth < 0:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] max_depth must not be negative: {max_depth}")
+
+        self.__max_depth: int = max_depth
+        self.__allowed_hosts: Optional[Set[str]] = (
+            {host.lower() for host in allowed_hosts} if allowed_hosts is not None else None
+        )
+        self.__seen: CrawlSeenSet = seen if seen is not None else CrawlSeenSet()
+        self.__priority: Callable[[str, int], float] = (
+            priority if priority is not None else lambda url, depth: float(depth)
+        )
+        self.__heap: List[Tuple[float, int, str, int]] = []
+        self.__order = count()
+
+    def is_allowed_host(self, host: str) -> bool:
+        """호스트가 허용 목록(또는 그 하위 도메인)에 있는지 확인합니다.
+
+        Args:
+            host (str): `host[:port]` 문자열.
+
+        Returns:
+            bool: 허용되면 True.
+        """
+        if self.__allowed_hosts is None:
+            return True
+        host = host.lower()
+        return host in self.__allowed_hosts or any(
+            host.endswith("." + allowed) for allowed in self.__allowed_hosts
+        )
+
+    def add(self, url: str, depth: int) -> bool:
+        """URL을 프런티어에 추가합니다.
+
+        Args:
+            url (str): 추가할 URL (내부에서 정규화).
+            depth (int): 링크 깊이.
+
+        Returns:
+            bool: 추가되었으면 True. 깊이/호스트 제한에 걸렸거나 이미 본 URL이거나
+                형식이 잘못된 URL이면 False.
+        """
+        if depth > self.__max_depth:
+            return False
+        try:
+            crawl_url = CrawlUrl(url)
+        except ValueError:
+            return False
+        if not self.is_allowed_host(crawl_url.get_host()):
+            return False
+
+        normalized = crawl_url.get_normalized()
+        if not self.__seen.add(normalized):
+            return False
+
+        priority = self.__priority(normalized, depth)
+        heapq.heappush(self.__heap, (priority, next(self.__order), normalized, depth))
+        return True
+
+    def restore(self, url: str, depth: int) -> None:
+        """체크포인트에서 복원한 URL을 제한 검사 없이 추가합니다.
+
+        Args:
+            url (str): 정규화된 URL.
+            depth (int): 링크 깊이.
+        """
+        self.__seen.add(url)
+        priority = self.__priority(url, depth)
+        heapq.heappush(self.__heap, (priority, next(self.__order), url, depth))
+
+    def mark_seen(self, url: str) -> None:
+        """이미 처리한 URL을 추가하지 않고 본 것으로만 표시합니다.
+
+        Args:
+            url (str): 정규화된 URL.
+        """
+        self.__seen.add(url)
+
+    def flush(self) -> None:
+        """URL 집합에서 기록 대기 중인 해시를 보조 저장소에 기록합니다."""
+        self.__seen.flush()
+
+    def pop(self) -> Optional[CrawlFrontierEntry]:
+        """우선순위가 가장 높은 URL을 꺼냅니다.
+
+        Returns:
+            Optional[CrawlFrontierEntry]: 다음 요청 대상. 비어 있으면 None.
+        """
+        if not self.__heap:
+            return None
+        priority, _, url, depth = heapq.heappop(self.__heap)
+        return CrawlFrontierEntry(url, depth, priority)
+
+    def __len__(self) -> int:
+        return len(self.__heap)
@@ -0,0 +1,133 @@
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+
+
+class CrawlHostScheduler:
+    """호스트별 대기열을 라운드 로빈으로 순회하며 요청 순서를 정하는 스케줄러.
+
+    속도 제한에 걸렸거나 진행 중인 요청이 많은 호스트는 건너뛰므로
+    느린 호스트가 빠른 호스트의 처리량을 막지 않습니다.
+    단일 스레드(또는 이벤트 루프)에서 사용하는 것을 전제로 합니다.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        max_per_host: Optional[int] = None,
+    ):
+        """CrawlHostScheduler 생성자.
+
+        Args:
+            rate_limiter (Optional[CrawlRateLimiter]): 호스트별 속도 제한기.
+                None이면 속도 제한 없이 라운드 로빈만 수행합니다.
+            max_per_host (Optional[int]): 호스트별 최대 동시 진행 요청 수.
+
+        Raises:
+            ValueError: max_per_host가 1보다 작은 경우.
+        """
+        if max_per_host is not None and max_per_host < 1:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] max_per_host must be >= 1: {max_per_host}")
+
+        self.__rate_limiter: Optional[CrawlRateLimiter] = rate_limiter
+        self.__max_per_host: Optional[int] = max_per_host
+        # 순서가 곧 라운드 로빈 순서 (앞쪽 호스트가 다음 차례)
+        self.__queues: "OrderedDict[str, Deque[CrawlUrl]]" = OrderedDict()
+        self.__in_flight: Dict[str, int] = {}
+        self.__pending: int = 0
+
+    def add(self, url: CrawlUrl) -> None:
+        """URL을 해당 호스트 대기열에 추가합니다.
+
+        Args:
+            url (CrawlUrl): 요청할 URL.
+        """
+        self.__queues.setdefault(url.get_host(), deque()).append(url)
+        self.__pending += 1
+
+    def add_all(self, urls: Iterable[CrawlUrl]) -> None:
+        """여러 URL을 대기열에 추가합니다.
+
+        Args:
+            urls (Iterable[CrawlUrl]): 요청할 URL 목록.
+        """
+        for url in urls:
+            self.add(url)
+
+    def next_ready(self) -> Tuple[Optional[CrawlUrl], float]:
+        """지금 요청해도 되는 다음 URL을 반환합니다.
+
+        반환된 URL의 요청이 끝나면 반드시 done()을 호출해야 합니다.
+
+        Returns:
+            Tuple[Optional[CrawlUrl], float]: (다음 URL, 0.0) 또는
+                준비된 URL이 없으면 (None, 가장 빠른 토큰까지 남은 시간).
+                속도 제한이 아닌 동시 요청 제한으로 막혔으면 대기 시간은 0.0.
+        """
+        min_wait = 0.0
+        for host in list(self.__queues):
+            if self.__is_host_busy(host):
+                continue
+
+            if self.__rate_limiter is not None:
+                wait = self.__rate_limiter.try_acquire(host)
+                if wait > 0.0:
+                    min_wait = wait if min_wait == 0.0 else min(min_wait, wait)
+                    continue
+
+            return self.__pop(host), 0.0
+
+        return None, min_wait
+
+    def __is_host_busy(self, host: str) -> bool:
+        """호스트의 진행 중 요청 수가 상한에 도달했는지 확인.
+
+        Args:
+            host (str): 호스트 이름.
+
+        Returns:
+            bool: 상한에 도달했으면 True.
+        """
+        if self.__max_per_host is None:
+            return False
+        return self.__in_flight.get(host, 0) >= self.__max_per_host
+
+    def __pop(self, host: str) -> CrawlUrl:
+        """호스트 대기열에서 URL을 꺼내고 호스트를 라운드 로빈 끝으로 이동.
+
+        Args:
+            host (str): 호스트 이름.
+
+        Returns:
+            CrawlUrl: 꺼낸 URL.
+        """
+        queue = self.__queues[host]
+        url = queue.popleft()
+        if queue:
+            self.__queues.move_to_end(host)
+        else:
+            del self.__queues[host]
+
+        self.__in_flight[host] = self.__in_flight.get(host, 0) + 1
+        self.__pending -= 1
+        return url
+
+    def done(self, url: CrawlUrl) -> None:
+        """next_ready()로 꺼낸 URL의 요청이 끝났음을 알립니다.
+
+        Args:
+            url (CrawlUrl): 요청이 끝난 URL.
+        """
+        host = url.get_host()
+        remaining = self.__in_flight.get(host, 0) - 1
+        if remaining > 0:
+            self.__in_flight[host] = remaining
+        else:
+            self.__in_flight.pop(host, None)
+
+    def __len__(self) -> int:
+        """아직 꺼내지 않은 URL 수."""
+        return self.__pending
@@ -0,0 +1,249 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_checkpoint import CrawlCheckpoint
+from n3xt_crawler_py.web_crawler.crawl_download import (
+    CrawlAcceptEncoding,
+    CrawlDownloadLimits,
+)
+from n3xt_crawler_py.web_crawler.crawl_frontier import CrawlFrontier, CrawlFrontierEntry
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import CrawlReplayArchive
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import ICrawlRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_seen_set import CrawlSeenSet
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import ICrawlTorProxyProvider
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+
+@dataclass(frozen=True)
+class CrawlPage:
+    """링크 크롤링에서 페이지 하나의 결과를 담는 불변 데이터 클래스.
+
+    Attributes:
+        url (str): 정규화된 페이지 URL.
+        depth (int): 시드로부터의 링크 깊이.
+        response (Optional[CrawlResponse]): 성공 시 응답.
+        links (List[str]): 페이지에서 찾은 정규화된 http(s) 링크 (프런티어 필터링 전).
+        error (Optional[Exception]): 요청 또는 링크 추출 실패 시 발생한 예외.
+    """
+
+    url: str
+    depth: int
+    response: Optional[CrawlResponse] = None
+    links: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    def is_success(self) -> bool:
+        """요청 성공 여부 반환.
+
+        Returns:
+            bool: 응답을 얻었으면 True.
+        """
+        return self.error is None and self.response is not None
+
+
+class CrawlLinkCrawler:
+    """시드 URL에서 시작해 링크를 따라가며 페이지를 수집하는 크롤러.
+
+    - 요청과 링크 추출은 스레드 풀에서 동시에 수행하고, 프런티어 관리는 호출 스레드에서만 합니다.
+    - URL은 정규화 후 CrawlSeenSet(블룸 필터 + 정확한 보조 저장소)으로 한 번만 요청합니다.
+    - max_depth, max_pages, 허용 호스트로 탐색 범위를 제한합니다.
+    """
+
+    def __init__(
+        self,
+        seeds: Iterable[str],
+        parse_mode: CrawlParseMode = CrawlParseMode.HTML,
+        link_xpath: str = "//a/@href",
+        max_depth: int = 2,
+        max_pages: Optional[int] = None,
+        allowed_hosts: Optional[Iterable[str]] = None,
+        concurrency: int = 4,
+        req_mode: CrawlRequestMode = CrawlRequestMode.DEFAULT,
+        seen: Optional[CrawlSeenSet] = None,
+        priority: Optional[Callable[[str, int], float]] = None,
+        session_pool: Optional[CrawlSessionPool] = None,
+        retry_policy: Optional[ICrawlRetryPolicy] = None,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        cache: Optional[CrawlResponseCache] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        tor_proxy: Optional[ICrawlTorProxyProvider] = None,
+        replay: Optional[CrawlReplayArchive] = None,
+        limits: Optional[CrawlDownloadLimits] = None,
+        accept_encoding: Optional[CrawlAcceptEncoding] = None,
+    ):
+        """CrawlLinkCrawler 생성자.
+
+        Args:
+            seeds (Iterable[str]): 시작 URL 목록 (깊이 0).
+            parse_mode (CrawlParseMode): 파싱 모드 (HTML 또는 XML).
+            link_xpath (str): 링크 문자열을 선택할 XPath.
+            max_depth (int): 따라갈 최대 링크 깊이.
+            max_pages (Optional[int]): 요청할 최대 페이지 수. None이면 제한 없음.
+            allowed_hosts (Optional[Iterable[str]]): 허용할 호스트 (하위 도메인 포함).
+                None이면 시드 URL의 호스트만 허용합니다.
+            concurrency (int): 동시에 진행할 최대 요청 수.
+            req_mode (CrawlRequestMode): 요청 방식 (DEFAULT 또는 TOR).
+            seen (Optional[CrawlSeenSet]): 한 번이라도 대기열에 넣은 URL 집합. 디스크 경로를 지정한
+                집합을 넘기면 메모리 사용량이 줄어듭니다. URL은 요청할 때가 아니라 대기열에 넣을 때
+                기록되므로, 같은 집합으로 다시 실행할 때는 대기 중이던 URL을 복원하는
+                checkpoint와 함께 사용해야 합니다 (없으면 이전 실행에서 요청하지 못한 URL을 건너뜀).
+                crawl()이 끝나면 기록 대기 중인 해시를 flush()합니다.
+            priority (Optional[Callable[[str, int], float]]): (URL, 깊이) -> 우선순위 함수
+                (작을수록 먼저). None이면 너비 우선.
+            session_pool (Optional[CrawlSessionPool]): 요청 간 공유할 세션 풀.
+            retry_policy (Optional[ICrawlRetryPolicy]): 요청 재시도 정책.
+            rate_limiter (Optional[CrawlRateLimiter]): 호스트별 속도 제한기.
+            cache (Optional[CrawlResponseCache]): 디스크 응답 캐시.
+            checkpoint (Optional[CrawlCheckpoint]): 진행 상태 저널. 기존 저널이면
+                대기 중이던 URL부터 이어서 크롤링하고 완료된 URL은 다시 요청하지 않습니다.
+            tor_proxy (Optional[ICrawlTorProxyProvider]): TOR 모드에서 사용할 프록시 제공자.
+            replay (Optional[CrawlReplayArchive]): 응답 기록/재생 아카이브.
+            limits (Optional[CrawlDownloadLimits]): 다운로드 제한 시간과 최대 본문 크기.
+            accept_encoding (Optional[CrawlAcceptEncoding]): 협상할 전송 압축 방식.
+                None이면 사용 가능한 모든 방식을 사용합니다.
+
+        Raises:
+            ValueError: 시드 URL 형식이 잘못되었거나, XPath 구문이 잘못되었거나,
+                max_depth/max_pages/concurrency 값이 범위를 벗어난 경우.
+        """
+        cls = self.__class__.__name__
+        if concurrency < 1:
+            raise ValueError(f"[{cls}] concurrency must be >= 1: {concurrency}")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError(f"[{cls}] max_pages must be >= 1: {max_pages}")
+
+        self.__seeds: List[CrawlUrl] = [CrawlUrl(urldefrag(url)[0]) for url in seeds]
+        if allowed_hosts is None:
+            allowed_hosts = [seed.get_host() for seed in self.__seeds]
+
+        self.__link_xpath: CrawlXpath = CrawlXpath(link_xpath)
+        self.__frontier: CrawlFrontier = CrawlFrontier(
+            max_depth, allowed_hosts, seen, priority
+        )
+        self.__parse_mode: CrawlParseMode = parse_mode
+        self.__max_pages: Optional[int] = max_pages
+        self.__concurrency: int = concurrency
+        self.__req_mode: CrawlRequestMode = req_mode
+        self.__session_pool: Optional[CrawlSessionPool] = session_pool
+        self.__retry_policy: Optional[ICrawlRetryPolicy] = retry_policy
+        self.__rate_limiter: Optional[CrawlRateLimiter] = rate_limiter
+        self.__cache: Optional[CrawlResponseCache] = cache
+        self.__checkpoint: Optional[CrawlCheckpoint] = checkpoint
+        self.__tor_proxy: Optional[ICrawlTorProxyProvider] = tor_proxy
+        self.__replay: Optional[CrawlReplayArchive] = replay
+        self.__limits: Optional[CrawlDownloadLimits] = limits
+        self.__accept_encoding: Optional[CrawlAcceptEncoding] = accept_encoding
+
+    @staticmethod
+    def normalize_link(base_url: str, href: str) -> Optional[str]:
+        """페이지 안의 링크를 절대 URL로 바꾸고 정규화합니다.
+
+        Args:
+            base_url (str): 링크가 있던 페이지 URL.
+            href (str): 링크 문자열 (상대 경로 가능).
+
+        Returns:
+            Optional[str]: 정규화된 http(s) URL. 다른 스킴이거나 형식이 잘못되었으면 None.
+        """
+        url = urldefrag(urljoin(base_url, href.strip()))[0]
+        if not url.lower().startswith(("http://", "https://")):
+            return None
+        try:
+            return CrawlUrl(url).get_normalized()
+        except ValueError:
+            return None
+
+    def __fetch(self, entry: CrawlFrontierEntry) -> Tuple[CrawlResponse, List[str]]:
+        """워커 스레드에서 실행되는 요청과 링크 추출."""
+        response = CrawlRequester(
+            CrawlUrl(entry.url),
+            self.__req_mode,
+            self.__session_pool,
+            self.__retry_policy,
+            self.__rate_limiter,
+            self.__cache,
+            self.__tor_proxy,
+            self.__replay,
+            self.__limits,
+            accept_encoding=self.__accept_encoding,
+        ).get_response()
+
+        parser = CrawlParser(
+            response.get_bytes(), self.__parse_mode, response.get_encoding()
+        )
+        links: List[str] = []
+        for href in parser.get_blocks(self.__link_xpath):
+            if not isinstance(href, str):
+                continue
+            link = self.normalize_link(entry.url, href)
+            if link is not None:
+                links.append(link)
+        return response, links
+
+    def __enqueue(self, url: str, depth: int) -> None:
+        """프런티어에 URL을 추가하고, 새 URL이면 체크포인트에도 기록."""
+        if self.__frontier.add(url, depth) and self.__checkpoint is not None:
+            self.__checkpoint.add(url, depth)
+
+    def crawl(self) -> Iterator[CrawlPage]:
+        """링크를 따라가며 페이지를 요청하고 완료되는 순서대로 반환합니다.
+
+        한 페이지의 실패가 크롤링 전체를 중단시키지 않도록
+        예외는 CrawlPage.error에 담겨 전달됩니다.
+        체크포인트가 있으면 성공한 페이지는 호출자가 처리를 마치고 다음 결과를 요청할 때
+        완료로 기록되며, 실패한 페이지는 대기 상태로 남아 다음 실행에서 다시 요청됩니다.
+
+        Yields:
+            CrawlPage: 페이지 하나의 결과.
+        """
+        if self.__checkpoint is not None:
+            for url in self.__checkpoint.get_done():
+                self.__frontier.mark_seen(url)
+            for url, depth in self.__checkpoint.get_pending():
+                self.__frontier.restore(url, depth)
+        for seed in self.__seeds:
+            self.__enqueue(seed.get_normalized(), 0)
+
+        executor = ThreadPoolExecutor(max_workers=self.__concurrency)
+        running: Dict[Future, CrawlFrontierEntry] = {}
+        submitted = 0
+        try:
+            while True:
+                while len(running) < self.__concurrency and (
+                    self.__max_pages is None or submitted < self.__max_pages
+                ):
+                    entry = self.__frontier.pop()
+                    if entry is None:
+                        break
+                    running[executor.submit(self.__fetch, entry)] = entry
+                    submitted += 1
+
+                if not running:
+                    return
+
+                done, _ = wait(set(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = running.pop(future)
+                    try:
+                        response, links = future.result()
+                    except Exception as e:
+                        yield CrawlPage(entry.url, entry.depth, error=e)
+                        continue
+
+                    for link in links:
+                        self.__enqueue(link, entry.depth + 1)
+                    yield CrawlPage(entry.url, entry.depth, response, links)
+                    if self.__checkpoint is not None:
+                        self.__checkpoint.mark_done(entry.url)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.__frontier.flush()
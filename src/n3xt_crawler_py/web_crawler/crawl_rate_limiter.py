@@ -0,0 +1,96 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class CrawlRateLimiter:
+    """호스트별 토큰 버킷 방식의 요청 속도 제한기.
+
+    각 호스트는 초당 `rate`개의 토큰을 채우고 최대 `burst`개까지 모아 둘 수 있습니다.
+    요청 한 번에 토큰 하나를 소비하므로 호스트별 평균 요청 속도가 `rate`를 넘지 않습니다.
+    여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        host_rates: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """CrawlRateLimiter 생성자.
+
+        Args:
+            rate (float): 호스트별 기본 초당 요청 수.
+            burst (int): 호스트별 최대 누적 토큰 수.
+            host_rates (Optional[Dict[str, float]]): 특정 호스트의 초당 요청 수 재정의.
+            clock (Callable[[], float]): 현재 시각 함수 (테스트용).
+            sleep (Callable[[float], None]): 대기 함수 (테스트용).
+
+        Raises:
+            ValueError: 속도 또는 burst 값이 양수가 아닌 경우.
+        """
+        rates = [rate, *(host_rates or {}).values()]
+        if burst < 1 or min(rates) <= 0:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Rates must be > 0 and burst must be >= 1.")
+
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__host_rates: Dict[str, float] = dict(host_rates or {})
+        self.__clock: Callable[[], float] = clock
+        self.__sleep: Callable[[float], None] = sleep
+        self.__lock = threading.Lock()
+        # host -> [남은 토큰 수, 마지막 갱신 시각]
+        self.__buckets: Dict[str, List[float]] = {}
+
+    def get_rate(self, host: str) -> float:
+        """호스트에 적용되는 초당 요청 수 반환.
+
+        Args:
+            host (str): 호스트 이름.
+
+        Returns:
+            float: 초당 요청 수.
+        """
+        return self.__host_rates.get(host, self.__rate)
+
+    def try_acquire(self, host: str) -> float:
+        """대기 없이 토큰 하나를 가져오려고 시도합니다.
+
+        Args:
+            host (str): 요청 대상 호스트.
+
+        Returns:
+            float: 토큰을 가져왔으면 0.0, 아니면 다음 토큰까지 남은 시간(초).
+        """
+        with self.__lock:
+            now = self.__clock()
+            rate = self.get_rate(host)
+            bucket = self.__buckets.setdefault(host, [float(self.__burst), now])
+
+            bucket[0] = min(self.__burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / rate
+
+    def acquire(self, host: str) -> float:
+        """토큰을 얻을 때까지 대기한 뒤 토큰 하나를 소비합니다.
+
+        Args:
+            host (str): 요청 대상 호스트.
+
+        Returns:
+            float: 대기한 총 시간(초).
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(host)
+            if wait == 0.0:
+                return waited
+            self.__sleep(wait)
+            waited += wait
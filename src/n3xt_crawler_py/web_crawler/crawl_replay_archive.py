@@ -0,0 +1,200 @@
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from enum import Enum, auto
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+
+
+class CrawlReplayMode(Enum):
+    """재생 아카이브 모드."""
+
+    RECORD = auto()
+    REPLAY = auto()
+
+
+class CrawlReplayArchive:
+    """실제 응답을 압축 아카이브 파일에 기록하고, 네트워크 없이 그대로 재생하는 저장소.
+
+    - RECORD: CrawlRequester가 받은 200 응답을 파일 끝에 덧붙입니다 (같은 URL은 마지막 기록이 우선).
+    - REPLAY: 기록된 응답만 반환하며, 기록되지 않은 URL은 요청하지 않고 실패합니다.
+    같은 아카이브를 재생하면 항상 같은 응답을 얻으므로 오프라인 테스트와 벤치마크에 사용합니다.
+
+    파일 형식:
+        매직 헤더(8바이트) 뒤에 항목이 이어집니다.
+        항목 = 4바이트 빅엔디언 메타데이터 길이 + 메타데이터 JSON + zlib 압축 본문
+
+    Attributes:
+        __MAGIC (bytes): 파일 시작 매직 바이트.
+        __LENGTH (struct.Struct): 메타데이터 길이 형식.
+    """
+
+    __MAGIC = b"N3XTRPL1"
+    __LENGTH = struct.Struct(">I")
+
+    def __init__(
+        self,
+        path: str,
+        mode: CrawlReplayMode = CrawlReplayMode.REPLAY,
+        compress_level: int = 6,
+    ):
+        """CrawlReplayArchive 생성자. 기존 아카이브가 있으면 색인을 만듭니다.
+
+        Args:
+            path (str): 아카이브 파일 경로.
+            mode (CrawlReplayMode): RECORD 또는 REPLAY.
+            compress_level (int): zlib 압축 수준 (0~9).
+
+        Raises:
+            FileNotFoundError: REPLAY 모드에서 파일이 없는 경우.
+            ValueError: 아카이브 형식이 아니거나 compress_level이 범위를 벗어난 경우.
+        """
+        cls = self.__class__.__name__
+        if not 0 <= compress_level <= 9:
+            raise ValueError(f"[{cls}] compress_level must be 0..9: {compress_level}")
+
+        self.__path: str = path
+        self.__mode: CrawlReplayMode = mode
+        self.__compress_level: int = compress_level
+        self.__lock = threading.Lock()
+        # url -> (본문 오프셋, 메타데이터)
+        self.__index: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+        if mode == CrawlReplayMode.RECORD:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                with open(path, "wb") as f:
+                    f.write(self.__MAGIC)
+
+        self.__file = open(path, "r+b" if mode == CrawlReplayMode.RECORD else "rb")
+        if self.__file.read(len(self.__MAGIC)) != self.__MAGIC:
+            self.__file.close()
+            raise ValueError(f"[{cls}] Not a replay archive: '{path}'")
+        self.__load_index()
+
+    def __load_index(self) -> None:
+        """항목 메타데이터만 읽어 색인을 만들고, 잘린 마지막 항목은 버림."""
+        f = self.__file
+        offset = len(self.__MAGIC)
+        size = os.fstat(f.fileno()).st_size
+        while offset + self.__LENGTH.size <= size:
+            f.seek(offset)
+            (meta_len,) = self.__LENGTH.unpack(f.read(self.__LENGTH.size))
+            try:
+                meta = json.loads(f.read(meta_len))
+            except ValueError:
+                break
+            body_offset = offset + self.__LENGTH.size + meta_len
+            if body_offset + meta["stored_size"] > size:
+                break
+            self.__index[meta["url"]] = (body_offset, meta)
+            offset = body_offset + meta["stored_size"]
+
+        if self.__mode == CrawlReplayMode.RECORD and offset != size:
+            f.truncate(offset)
+        self.__end: int = offset
+
+    def get_mode(self) -> CrawlReplayMode:
+        """아카이브 모드 반환.
+
+        Returns:
+            CrawlReplayMode: RECORD 또는 REPLAY.
+        """
+        return self.__mode
+
+    def record(self, url: str, resp: requests.Response) -> None:
+        """응답을 아카이브에 기록합니다. 200이 아닌 응답은 무시합니다.
+
+        Args:
+            url (str): 요청 URL.
+            resp (requests.Response): 기록할 응답.
+
+        Raises:
+            RuntimeError: REPLAY 모드로 연 아카이브인 경우.
+        """
+        if self.__mode != CrawlReplayMode.RECORD:
+            cls = self.__class__.__name__
+            raise RuntimeError(f"[{cls}] Archive is opened in REPLAY mode.")
+        if resp.status_code != 200:
+            return
+
+        body = resp.content
+        stored = zlib.compress(body, self.__compress_level)
+        meta = {
+            "url": url,
+            "status": resp.status_code,
+            "content_type": resp.headers.get("Content-Type", ""),
+            "encoding": resp.encoding,
+            "size": len(body),
+            "stored_size": len(stored),
+            "recorded_at": time.time(),
+        }
+        meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+        with self.__lock:
+            self.__file.seek(self.__end)
+            self.__file.write(self.__LENGTH.pack(len(meta_bytes)) + meta_bytes + stored)
+            self.__file.flush()
+            body_offset = self.__end + self.__LENGTH.size + len(meta_bytes)
+            self.__index[url] = (body_offset, meta)
+            self.__end = body_offset + len(stored)
+
+    def get(self, url: str) -> Optional[CrawlResponse]:
+        """기록된 응답을 반환합니다.
+
+        Args:
+            url (str): 요청 URL.
+
+        Returns:
+            Optional[CrawlResponse]: 기록된 응답. 없으면 None.
+        """
+        with self.__lock:
+            entry = self.__index.get(url)
+            if entry is None:
+                return None
+            body_offset, meta = entry
+            self.__file.seek(body_offset)
+            stored = self.__file.read(meta["stored_size"])
+
+        return CrawlResponse.from_bytes(
+            zlib.decompress(stored),
+            meta["status"],
+            meta["content_type"],
+            meta["encoding"],
+        )
+
+    def get_urls(self) -> List[str]:
+        """기록된 URL 목록 반환.
+
+        Returns:
+            List[str]: URL 목록 (처음 기록된 순서).
+        """
+        with self.__lock:
+            return list(self.__index)
+
+    def __contains__(self, url: str) -> bool:
+        with self.__lock:
+            return url in self.__index
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__index)
+
+    def close(self) -> None:
+        """아카이브 파일을 닫습니다."""
+        with self.__lock:
+            self.__file.close()
+
+    def __enter__(self) -> "CrawlReplayArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
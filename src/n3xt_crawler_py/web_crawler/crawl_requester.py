@@ -1,11 +1,36 @@
 from enum import Enum, auto
-import subprocess
 import requests
+import threading
 import time
-import copy
+from typing import Dict, Optional
 
+from n3xt_crawler_py.utils import crawl_metrics
+from n3xt_crawler_py.web_crawler.crawl_download import (
+    CrawlAcceptEncoding,
+    CrawlBodyReader,
+    CrawlBodyTooLargeError,
+    CrawlDownloadLimits,
+    CrawlDownloadTimeoutError,
+    ICrawlChunkSink,
+)
 from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import (
+    CrawlReplayArchive,
+    CrawlReplayMode,
+)
 from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import (
+    CrawlBackoffRetryPolicy,
+    CrawlRetryError,
+    ICrawlRetryPolicy,
+)
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import (
+    CrawlTorProxyPool,
+    ICrawlTorProxyProvider,
+)
 
 
 class CrawlRequestMode(Enum):
@@ -17,82 +42,339 @@ class CrawlRequester:
     __HEADER_FOR_ANTI_ANTI_CRAWLING = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
     }
-    __MAX_RETRIES = 5
     __TOR_PORT = 9050
+    __default_tor_proxy: Optional[CrawlTorProxyPool] = None
+    __default_tor_proxy_lock = threading.Lock()
+    __default_accept_encoding: Optional[CrawlAcceptEncoding] = None
 
     def __init__(
-        self, url: CrawlUrl, mode: CrawlRequestMode = CrawlRequestMode.DEFAULT
+        self,
+        url: CrawlUrl,
+        mode: CrawlRequestMode = CrawlRequestMode.DEFAULT,
+        session_pool: Optional[CrawlSessionPool] = None,
+        retry_policy: Optional[ICrawlRetryPolicy] = None,
+        rate_limiter: Optional[CrawlRateLimiter] = None,
+        cache: Optional[CrawlResponseCache] = None,
+        tor_proxy: Optional[ICrawlTorProxyProvider] = None,
+        replay: Optional[CrawlReplayArchive] = None,
+        limits: Optional[CrawlDownloadLimits] = None,
+        chunk_sink: Optional[ICrawlChunkSink] = None,
+        accept_encoding: Optional[CrawlAcceptEncoding] = None,
     ):
+        """CrawlRequester 생성자. 생성 시 즉시 요청을 수행합니다.
+
+        Args:
+            url (CrawlUrl): 요청할 URL.
+            mode (CrawlRequestMode): 요청 방식 (DEFAULT 또는 TOR).
+            session_pool (Optional[CrawlSessionPool]): 재사용할 세션 풀.
+                None이면 요청마다 세션을 새로 만들고 닫습니다.
+            retry_policy (Optional[ICrawlRetryPolicy]): 재시도 정책.
+                None이면 CrawlBackoffRetryPolicy 기본값을 사용합니다.
+            rate_limiter (Optional[CrawlRateLimiter]): 호스트별 요청 속도 제한기.
+                매 시도 전에 토큰을 얻을 때까지 대기합니다.
+            cache (Optional[CrawlResponseCache]): 디스크 응답 캐시.
+                TTL 이내면 요청을 생략하고, 지났으면 조건부 요청으로 재검증합니다.
+            tor_proxy (Optional[ICrawlTorProxyProvider]): TOR 모드에서 사용할 프록시 제공자.
+                None이면 127.0.0.1:9050을 검사하는 공용 CrawlTorProxyPool을 사용합니다.
+            replay (Optional[CrawlReplayArchive]): 응답 기록/재생 아카이브.
+                RECORD 모드면 받은 응답을 기록하고, REPLAY 모드면 네트워크 없이 기록된 응답을 반환합니다.
+            limits (Optional[CrawlDownloadLimits]): 연결/읽기/전체 제한 시간과 최대 본문 크기.
+                None이면 CrawlDownloadLimits 기본값을 사용합니다.
+            chunk_sink (Optional[ICrawlChunkSink]): 200 응답 본문을 다운로드 중에 조각 단위로 받을 대상
+                (예: 다운로드와 파싱을 겹치는 CrawlIncrementalParser).
+            accept_encoding (Optional[CrawlAcceptEncoding]): 협상할 전송 압축 방식.
+                None이면 이 환경에서 디코딩할 수 있는 모든 방식(zstd, br, gzip, deflate)을 사용합니다.
+
+        Raises:
+            RuntimeError: TOR 모드에서 사용할 수 있는 SOCKS 포트가 없거나,
+                REPLAY 모드에서 기록되지 않은 URL을 요청한 경우.
+            CrawlRetryError: 재시도 후에도 유효한 응답을 받지 못한 경우
+                (RuntimeError 하위 클래스). 마지막 시도가 연결 오류 등 예외로 끝났으면
+                그 예외가 __cause__로 연결됩니다.
+            CrawlBodyTooLargeError: 본문이 최대 크기를 넘은 경우 (재시도하지 않음,
+                RuntimeError 하위 클래스).
+        """
         self.__mode: CrawlRequestMode = mode
-        self.__resp_data: CrawlResponse = self.__request(url)
+        self.__session_pool: Optional[CrawlSessionPool] = session_pool
+        self.__retry_policy: ICrawlRetryPolicy = retry_policy or CrawlBackoffRetryPolicy()
+        self.__rate_limiter: Optional[CrawlRateLimiter] = rate_limiter
+        self.__cache: Optional[CrawlResponseCache] = cache
+        self.__replay: Optional[CrawlReplayArchive] = replay
+        self.__limits: CrawlDownloadLimits = limits or CrawlDownloadLimits()
+        self.__chunk_sink: Optional[ICrawlChunkSink] = chunk_sink
+        self.__accept_encoding: CrawlAcceptEncoding = (
+            accept_encoding or self.__get_default_accept_encoding()
+        )
+        self.__tor_proxy: Optional[ICrawlTorProxyProvider] = None
+        if mode == CrawlRequestMode.TOR:
+            self.__tor_proxy = tor_proxy or self.__get_default_tor_proxy()
+        self.__from_cache: bool = False
+        self.__from_replay: bool = False
+        self.__retry_count: int = 0
+        self.__sleep_time: float = 0.0
+        metrics = crawl_metrics.get_active()
+        if metrics is None:
+            self.__resp_data: CrawlResponse = self.__request(url)
+        else:
+            self.__resp_data = self.__request_with_metrics(url, metrics)
 
-    def __is_tor_port_listen(self) -> bool:
-        try:
-            result = subprocess.run(
-                ["netstat", "-na"], capture_output=True, text=True, check=True
-            )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"[{self.__class__.__name__}] Failed to run netstat: {e}"
+    @classmethod
+    def __get_default_tor_proxy(cls) -> CrawlTorProxyPool:
+        """기본 Tor 포트를 검사하는 공용 프록시 풀 (검사 결과 캐시를 요청 간에 공유)."""
+        with cls.__default_tor_proxy_lock:
+            if cls.__default_tor_proxy is None:
+                cls.__default_tor_proxy = CrawlTorProxyPool([cls.__TOR_PORT])
+            return cls.__default_tor_proxy
+
+    @classmethod
+    def __get_default_accept_encoding(cls) -> CrawlAcceptEncoding:
+        """사용 가능한 모든 압축 방식을 협상하는 공용 설정 (환경은 실행 중 바뀌지 않음)."""
+        if cls.__default_accept_encoding is None:
+            cls.__default_accept_encoding = CrawlAcceptEncoding()
+        return cls.__default_accept_encoding
+
+    @staticmethod
+    def __to_proxies(proxy_url: str) -> Dict[str, str]:
+        return {"http": proxy_url, "https": proxy_url}
+
+    def __create_session(self) -> requests.Session:
+        # TOR 모드의 프록시는 요청마다 지정하므로(__request_with_retries) 세션은 모드와 무관
+        return requests.session()
+
+    def __request(self, url: CrawlUrl) -> CrawlResponse:
+        replay = self.__replay
+        if replay is not None and replay.get_mode() == CrawlReplayMode.REPLAY:
+            replayed = replay.get(url.get_url())
+            if replayed is None:
+                cls = self.__class__.__name__
+                raise RuntimeError(
+                    f"[{cls}] URL not found in replay archive: '{url.get_url()}'"
+                )
+            self.__from_replay = True
+            return replayed
+
+        if self.__cache is not None:
+            cached = self.__cache.get_fresh(url.get_url())
+            if cached is not None:
+                self.__from_cache = True
+                return cached
+
+        if self.__session_pool is not None:
+            session = self.__session_pool.get_session(
+                self.__mode, url.get_host(), self.__create_session
             )
+        else:
+            session = self.__create_session()
 
-        for line in result.stdout.splitlines():
-            if f"{self.__TOR_PORT}" in line and "LISTEN" in line.upper():
-                return True
-        return False
+        try:
+            return self.__request_with_retries(session, url)
+        finally:
+            # 풀에서 빌린 세션은 풀이 수명을 관리
+            if self.__session_pool is None:
+                session.close()
 
-    def __set_tor_proxies(self, session: requests.Session) -> requests.Session:
-        if not self.__is_tor_port_listen():
-            raise RuntimeError(
-                f"[{self.__class__.__name__}] Tor mode is enabled but port {self.__TOR_PORT} is not listening."
+    def __request_with_metrics(
+        self, url: CrawlUrl, metrics: crawl_metrics.CrawlMetrics
+    ) -> CrawlResponse:
+        """요청 전체 시간, 결과, 재시도/대기, 다운로드 바이트를 기록하며 요청."""
+        mode = self.__mode.name
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            response = self.__request(url)
+            outcome = (
+                "replay"
+                if self.__from_replay
+                else "cache" if self.__from_cache else "ok"
+            )
+            metrics.increment(
+                "crawl_response_bytes_total", len(response.get_bytes()), mode=mode
+            )
+            return response
+        finally:
+            metrics.observe(
+                "crawl_request_seconds", time.perf_counter() - started, mode=mode
             )
+            metrics.increment("crawl_requests_total", mode=mode, outcome=outcome)
+            if self.__retry_count:
+                metrics.increment(
+                    "crawl_request_retries_total", self.__retry_count, mode=mode
+                )
+                metrics.increment(
+                    "crawl_retry_sleep_seconds_total", self.__sleep_time, mode=mode
+                )
 
-        proxy_url = f"socks5h://127.0.0.1:{self.__TOR_PORT}"
-        session.proxies = {
-            "http": proxy_url,
-            "https": proxy_url,
+    def __build_headers(self, url: CrawlUrl) -> Dict[str, str]:
+        headers = {
+            **self.__HEADER_FOR_ANTI_ANTI_CRAWLING,
+            "Accept-Encoding": self.__accept_encoding.get_header(),
         }
-        return session
+        if self.__cache is not None:
+            headers.update(self.__cache.get_conditional_headers(url.get_url()))
+        return headers
 
-    def __request(self, url: CrawlUrl) -> CrawlResponse:
-        session = requests.session()
+    def __request_with_retries(
+        self, session: requests.Session, url: CrawlUrl
+    ) -> CrawlResponse:
+        attempt = 0
+        while True:
+            status = None
+            headers = {}
+            last_error: Optional[Exception] = None
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire(url.get_host())
 
-        if self.__mode == CrawlRequestMode.TOR:
-            session = self.__set_tor_proxies(session)
+            proxy_url = None
+            if self.__tor_proxy is not None:
+                proxy_url = self.__tor_proxy.get_proxy_url()
 
-        retries = 0
-        while retries < self.__MAX_RETRIES:
+            proxy_ok = False
+            started = time.perf_counter()
             try:
                 raw_response = session.get(
-                    url.get_url(), headers=self.__HEADER_FOR_ANTI_ANTI_CRAWLING
+                    url.get_url(),
+                    headers=self.__build_headers(url),
+                    proxies=self.__to_proxies(proxy_url) if proxy_url else None,
+                    timeout=self.__limits.get_timeout(),
+                    stream=True,
                 )
+                headers = raw_response.headers
+                proxy_ok = True
+                status = raw_response.status_code
+
+                if raw_response.status_code == 304 and self.__cache is not None:
+                    cached = self.__cache.revalidate(url.get_url(), raw_response)
+                    if cached is not None:
+                        raw_response.close()
+                        self.__from_cache = True
+                        return cached
+
+                # 오류 페이지는 파싱 대상이 아니므로 200 응답만 조각을 전달
+                sink = self.__chunk_sink if status == 200 else None
+                reader = CrawlBodyReader(self.__limits, sink)
+                body = reader.read(raw_response, started)
+                self.__count_transfer(raw_response, reader.get_wire_bytes(), len(body))
                 response = CrawlResponse(raw_response)
-                if response.status() != 200:
-                    retries += 1
-                    time.sleep(3)
-                    continue
+                status = response.status()
 
-                if response.is_invalid_response():
-                    retries += 1
-                    time.sleep(3)
-                    continue
+                if status == 200 and response.is_invalid_response():
+                    # 프록시가 200으로 감싼 게이트웨이 오류는 일시 오류로 취급
+                    status = 502
+                    proxy_ok = False
 
-                session.close()
+            except CrawlBodyTooLargeError:
+                status = None
+                self.__count_aborted("size")
+                raise
+            except CrawlDownloadTimeoutError as e:
+                status = None
+                last_error = e
+                self.__count_aborted("timeout")
+            except Exception as e:
+                status = None
+                last_error = e
+            finally:
+                elapsed = time.perf_counter() - started
+                if proxy_url is not None:
+                    self.__tor_proxy.report(proxy_url, proxy_ok, elapsed)
+                metrics = crawl_metrics.get_active()
+                if metrics is not None:
+                    metrics.observe(
+                        "crawl_request_attempt_seconds",
+                        elapsed,
+                        status=status if status is not None else "error",
+                    )
+
+            if status == 200:
+                if self.__cache is not None:
+                    self.__cache.store(url.get_url(), raw_response)
+                if self.__replay is not None:
+                    self.__replay.record(url.get_url(), raw_response)
                 return response
 
-            except Exception:
-                retries += 1
-                time.sleep(3)
+            attempt += 1
+            delay = self.__retry_policy.get_delay(attempt, status, headers)
+            if delay is None:
+                # 응답 없이 예외로 끝났으면 원인을 메시지와 __cause__로 남김
+                error = (
+                    f", last error: {type(last_error).__name__}: {last_error}"
+                    if last_error is not None
+                    else ""
+                )
+                raise CrawlRetryError(
+                    f"[{self.__class__.__name__}] Failed to get valid response after "
+                    f"{self.__retry_count} retries (last status: {status}{error}, "
+                    f"slept {self.__sleep_time:.2f}s).",
+                    self.__retry_count,
+                    self.__sleep_time,
+                    status,
+                ) from last_error
 
-        session.close()
-        raise RuntimeError(
-            f"[{self.__class__.__name__}] Failed to get valid response after {self.__MAX_RETRIES} retries."
-        )
+            self.__retry_count += 1
+            self.__sleep_time += delay
+            time.sleep(delay)
+
+    def __count_transfer(
+        self, resp: requests.Response, wire_bytes: int, decoded_bytes: int
+    ) -> None:
+        """압축 방식별 전송 바이트와 압축 해제 후 바이트를 기록 (압축 효과 측정용)."""
+        metrics = crawl_metrics.get_active()
+        if metrics is not None:
+            labels = {
+                "mode": self.__mode.name,
+                "encoding": resp.headers.get("Content-Encoding", "identity").lower(),
+            }
+            metrics.increment("crawl_download_wire_bytes_total", wire_bytes, **labels)
+            metrics.increment(
+                "crawl_download_decoded_bytes_total", decoded_bytes, **labels
+            )
+
+    def __count_aborted(self, reason: str) -> None:
+        """다운로드 제한으로 중단된 요청 수를 기록."""
+        metrics = crawl_metrics.get_active()
+        if metrics is not None:
+            metrics.increment(
+                "crawl_download_aborted_total", mode=self.__mode.name, reason=reason
+            )
 
     def get_response(self) -> CrawlResponse:
         """요청 후 받은 응답 데이터 반환.
 
+        CrawlResponse는 불변 객체이므로 복사 없이 그대로 반환합니다.
+
         Returns:
             CrawlResponse: 요청 결과.
         """
-        return copy.deepcopy(self.__resp_data)
+        return self.__resp_data
+
+    def is_from_cache(self) -> bool:
+        """응답이 캐시에서 제공되었는지 여부 반환 (304 재검증 포함).
+
+        Returns:
+            bool: 캐시 응답이면 True.
+        """
+        return self.__from_cache
+
+    def is_from_replay(self) -> bool:
+        """응답이 재생 아카이브에서 제공되었는지 여부 반환.
+
+        Returns:
+            bool: 재생 응답이면 True.
+        """
+        return self.__from_replay
+
+    def get_retry_count(self) -> int:
+        """응답을 받기까지 수행한 재시도 횟수 반환.
+
+        Returns:
+            int: 재시도 횟수.
+        """
+        return self.__retry_count
+
+    def get_sleep_time(self) -> float:
+        """재시도 대기에 사용한 총 시간 반환.
+
+        Returns:
+            float: 대기 시간 합계(초).
+        """
+        return self.__sleep_time
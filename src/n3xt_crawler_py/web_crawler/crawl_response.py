@@ -1,19 +1,37 @@
+import time
+from typing import Optional
+
 import requests
 
+from n3xt_crawler_py.utils import crawl_metrics
+
 
 class CrawlResponse:
-    """requests.Response 객체를 감싸서 응답 내용을 디코딩하고 상태 정보를 제공하는 클래스.
+    """requests.Response 객체를 감싸서 응답 본문과 상태 정보를 제공하는 불변 값 클래스.
+
+    본문은 원본 바이트로 보관하며, 문자열 디코딩은 get_content()가 처음 호출될 때
+    한 번만 수행합니다. 파서는 get_bytes()와 get_encoding()으로 바이트를 직접 파싱할 수 있어
+    디코딩/재인코딩 복사와 문자셋 추정 비용을 피할 수 있습니다.
+
+    __slots__로 속성을 고정하고, 한 번 설정된 속성은 바꿀 수 없으므로
+    복사 없이 여러 곳(스레드, 캐시 등)에서 안전하게 공유할 수 있습니다.
+    copy.copy()/copy.deepcopy()는 같은 객체를 그대로 반환합니다.
 
     Attributes:
         __BASIC_ENCODING (str): 기본 문자 인코딩 (utf-8).
         __INVALID_RESPONSE_FILTER (list[str]): 응답 내용 내 비정상 메시지 필터 리스트.
-        __content (str): 디코딩된 응답 본문.
+        __body (bytes): 원본 응답 본문.
+        __encoding (Optional[str]): Content-Type 헤더에 명시된 charset (없으면 None).
+        __text_encoding (Optional[str]): 문자열 디코딩에 사용할 인코딩 (requests 추정값).
+        __content (str): 디코딩된 응답 본문 (처음 요청 시 한 번만 설정).
         __status (int): HTTP 상태 코드.
         __content_type (str): 응답 Content-Type 헤더 (소문자 변환).
     """
 
     __BASIC_ENCODING = "utf-8"
-    __INVALID_RESPONSE_FILTER = ["502 Bad Gateway"]
+    __INVALID_RESPONSE_FILTER = ("502 Bad Gateway",)
+
+    __slots__ = ("__body", "__encoding", "__text_encoding", "__content", "__status")
 
     def __init__(self, resp: requests.Response):
         """CrawlResponse 생성자.
@@ -21,37 +39,166 @@ class CrawlResponse:
         Args:
             resp (requests.Response): requests 라이브러리의 Response 객체.
         """
-        self.__content: str = self.__decode_response(resp)
-        self.__status: int = resp.status_code
-
-        # 아래 속성은 필요에 따라 활성화 가능
+        self.__assign(
+            resp.content,
+            resp.status_code,
+            resp.headers.get("Content-Type", ""),
+            resp.encoding,
+        )
+
+        # 아래 속성은 필요에 따라 활성화 가능 (활성화 시 __slots__에도 추가)
         # self.__content_type: str = resp.headers.get("Content-Type", "").lower()
 
-    def __decode_response(self, resp: requests.Response) -> str:
-        """응답 바이트 데이터를 적절한 인코딩으로 디코딩.
+    @classmethod
+    def from_bytes(
+        cls,
+        body: bytes,
+        status: int = 200,
+        content_type: str = "",
+        text_encoding: Optional[str] = None,
+    ) -> "CrawlResponse":
+        """requests.Response 없이 본문 바이트로 응답 객체를 생성합니다.
 
-        인코딩 정보가 없으면 apparent_encoding, 기본 utf-8 순서로 시도하며,
-        UnicodeDecodeError 발생 시 utf-8로 강제 디코딩하고 오류 문자 대체 처리함.
+        캐시나 기록된 응답을 되살릴 때 사용합니다.
 
         Args:
-            resp (requests.Response): 응답 객체.
+            body (bytes): 응답 본문.
+            status (int): HTTP 상태 코드.
+            content_type (str): Content-Type 헤더 값 (charset 추출에 사용).
+            text_encoding (Optional[str]): 문자열 디코딩에 사용할 인코딩.
+                None이면 Content-Type의 charset을 사용합니다.
+
+        Returns:
+            CrawlResponse: 생성된 응답 객체.
+        """
+        response = cls.__new__(cls)
+        response.__assign(body, status, content_type, text_encoding)
+        return response
+
+    def __assign(
+        self,
+        body: bytes,
+        status: int,
+        content_type: str,
+        text_encoding: Optional[str],
+    ) -> None:
+        """생성 시 한 번만 속성을 설정."""
+        self.__body: bytes = bytes(body)
+        self.__status: int = status
+        self.__encoding: Optional[str] = self.parse_charset(content_type)
+        self.__text_encoding: Optional[str] = text_encoding or self.__encoding
+
+    def __setattr__(self, name: str, value) -> None:
+        """아직 설정되지 않은 슬롯만 한 번 설정할 수 있도록 제한."""
+        if hasattr(self, name):
+            cls = self.__class__.__name__
+            raise AttributeError(f"[{cls}] Immutable attribute: '{name}'")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        cls = self.__class__.__name__
+        raise AttributeError(f"[{cls}] Immutable attribute: '{name}'")
+
+    def __copy__(self) -> "CrawlResponse":
+        return self
+
+    def __deepcopy__(self, memo) -> "CrawlResponse":
+        return self
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CrawlResponse):
+            return NotImplemented
+        return (self.__status, self.__encoding, self.__body) == (
+            other.__status,
+            other.__encoding,
+            other.__body,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__status, self.__encoding, self.__body))
+
+    def __repr__(self) -> str:
+        cls = self.__class__.__name__
+        return f"{cls}(status={self.__status}, bytes={len(self.__body)}, encoding={self.__encoding!r})"
+
+    @staticmethod
+    def parse_charset(content_type: str) -> Optional[str]:
+        """Content-Type 헤더에 명시된 charset 추출.
+
+        requests와 달리 text/* 기본값(ISO-8859-1)을 가정하지 않으므로,
+        charset이 없으면 파서가 문서 선언(XML 선언, meta 태그)을 따를 수 있습니다.
+
+        Args:
+            content_type (str): Content-Type 헤더 값.
+
+        Returns:
+            Optional[str]: charset 값. 없으면 None.
+        """
+        for param in content_type.split(";")[1:]:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "charset":
+                return value.strip().strip("'\"") or None
+        return None
+
+    def __decode_response(self) -> str:
+        """응답 바이트 데이터를 적절한 인코딩으로 디코딩.
+
+        인코딩 정보가 없으면 문자셋 추정(apparent encoding), 기본 utf-8 순서로 시도하며,
+        UnicodeDecodeError 발생 시 utf-8로 강제 디코딩하고 오류 문자 대체 처리함.
+        문자셋 추정은 본문 전체를 검사하므로 인코딩 정보가 없을 때만 수행합니다.
 
         Returns:
             str: 디코딩된 응답 문자열.
         """
-        encoding = resp.encoding or resp.apparent_encoding or self.__BASIC_ENCODING
+        metrics = crawl_metrics.get_active()
+        started = time.perf_counter() if metrics is not None else 0.0
+        encoding = (
+            self.__text_encoding
+            or requests.compat.chardet.detect(self.__body)["encoding"]
+            or self.__BASIC_ENCODING
+        )
         try:
-            return resp.content.decode(encoding)
-        except UnicodeDecodeError:
-            return resp.content.decode("utf-8", errors="replace")
+            content = self.__body.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            content = self.__body.decode("utf-8", errors="replace")
+        if metrics is not None:
+            metrics.observe("crawl_response_decode_seconds", time.perf_counter() - started)
+        return content
 
     def get_content(self) -> str:
-        """디코딩된 응답 본문 반환.
+        """디코딩된 응답 본문 반환. 처음 호출할 때 한 번만 디코딩합니다.
 
         Returns:
             str: 응답 본문.
         """
-        return self.__content
+        try:
+            return self.__content
+        except AttributeError:
+            # 여러 스레드가 동시에 디코딩해도 결과가 같으므로 먼저 설정된 값을 사용
+            content = self.__decode_response()
+            try:
+                self.__content = content
+            except AttributeError:
+                pass
+            return self.__content
+
+    def get_bytes(self) -> bytes:
+        """디코딩하지 않은 원본 응답 본문 반환.
+
+        Returns:
+            bytes: 응답 본문 바이트.
+        """
+        return self.__body
+
+    def get_encoding(self) -> Optional[str]:
+        """Content-Type 헤더에 명시된 charset 반환.
+
+        바이트를 직접 파싱할 때 인코딩 힌트로 사용합니다.
+
+        Returns:
+            Optional[str]: charset. 헤더에 없으면 None (문서 선언을 따름).
+        """
+        return self.__encoding
 
     def status(self) -> int:
         """HTTP 상태 코드 반환.
@@ -85,4 +232,7 @@ class CrawlResponse:
         Returns:
             bool: 비정상 메시지 포함 시 True.
         """
-        return any(msg in self.__content for msg in self.__INVALID_RESPONSE_FILTER)
+        # 필터 문구는 ASCII이므로 디코딩 없이 바이트에서 검색
+        return any(
+            msg.encode("ascii") in self.__body for msg in self.__INVALID_RESPONSE_FILTER
+        )
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+
+
+class CrawlResponseCache:
+    """URL 단위로 응답 본문과 검증 헤더(ETag, Last-Modified)를 디스크에 저장하는 캐시.
+
+    - TTL 이내의 항목은 네트워크 요청 없이 바로 반환합니다.
+    - TTL이 지난 항목은 If-None-Match / If-Modified-Since 조건부 요청으로 재검증하며,
+      서버가 304를 반환하면 캐시된 본문을 일반 CrawlResponse로 돌려줍니다.
+    - 본문 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+
+    디렉터리 구조:
+        <dir_path>/<sha256(url)>.json : 메타데이터 (URL, 검증 헤더, 저장 시각 등)
+        <dir_path>/<sha256(url)>.body : 응답 본문 바이트
+
+    Attributes:
+        __META_EXT (str): 메타데이터 파일 확장자.
+        __BODY_EXT (str): 본문 파일 확장자.
+    """
+
+    __META_EXT = ".json"
+    __BODY_EXT = ".body"
+
+    def __init__(
+        self,
+        dir_path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """CrawlResponseCache 생성자. 기존 캐시 디렉터리가 있으면 인덱스를 복원합니다.
+
+        Args:
+            dir_path (str): 캐시 디렉터리 경로.
+            max_bytes (int): 저장할 본문의 최대 총 크기(바이트).
+            ttl (float): 재검증 없이 캐시를 사용할 수 있는 시간(초).
+            clock (Callable[[], float]): 현재 시각(epoch 초) 함수 (테스트용).
+
+        Raises:
+            ValueError: max_bytes 또는 ttl이 음수인 경우.
+        """
+        if max_bytes < 0 or ttl < 0:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] max_bytes and ttl must not be negative.")
+
+        self.__dir_path: str = dir_path
+        self.__max_bytes: int = max_bytes
+        self.__ttl: float = ttl
+        self.__clock: Callable[[], float] = clock
+        self.__lock = threading.Lock()
+        # key -> 메타데이터, 순서가 곧 LRU 순서 (앞쪽이 가장 오래됨)
+        self.__index: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.__total_bytes: int = 0
+
+        os.makedirs(dir_path, exist_ok=True)
+        self.__load_index()
+
+    def __load_index(self) -> None:
+        """디스크의 메타데이터를 읽어 인덱스를 복원 (저장 시각 순)."""
+        entries = []
+        for name in os.listdir(self.__dir_path):
+            if not name.endswith(self.__META_EXT):
+                continue
+            key = name[: -len(self.__META_EXT)]
+            try:
+                with open(self.__path(key, self.__META_EXT), encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if os.path.exists(self.__path(key, self.__BODY_EXT)):
+                entries.append((key, meta))
+
+        for key, meta in sorted(entries, key=lambda item: item[1]["stored_at"]):
+            self.__index[key] = meta
+            self.__total_bytes += meta["size"]
+
+    @staticmethod
+    def __key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def __path(self, key: str, ext: str) -> str:
+        return os.path.join(self.__dir_path, key + ext)
+
+    def __write_atomic(self, path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 rename하여 중간 상태가 보이지 않도록 저장."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def __remove_locked(self, key: str) -> None:
+        """항목을 인덱스와 디스크에서 제거 (잠금을 보유한 상태에서 호출)."""
+        meta = self.__index.pop(key, None)
+        if meta is not None:
+            self.__total_bytes -= meta["size"]
+        for ext in (self.__META_EXT, self.__BODY_EXT):
+            try:
+                os.remove(self.__path(key, ext))
+            except FileNotFoundError:
+                pass
+
+    def __load_response_locked(self, key: str) -> Optional[CrawlResponse]:
+        """캐시된 본문으로 CrawlResponse를 생성 (잠금을 보유한 상태에서 호출).
+
+        Returns:
+            Optional[CrawlResponse]: 본문 파일이 없으면 None.
+        """
+        meta = self.__index[key]
+        try:
+            with open(self.__path(key, self.__BODY_EXT), "rb") as f:
+                body = f.read()
+        except OSError:
+            self.__remove_locked(key)
+            return None
+
+        self.__index.move_to_end(key)
+
+        return CrawlResponse.from_bytes(
+            body,
+            200,
+            meta["headers"].get("Content-Type", ""),
+            meta["encoding"],
+        )
+
+    def get_fresh(self, url: str) -> Optional[CrawlResponse]:
+        """TTL 이내의 캐시 항목이 있으면 반환합니다.
+
+        Args:
+            url (str): 요청 URL.
+
+        Returns:
+            Optional[CrawlResponse]: 신선한 캐시 응답. 없거나 만료되었으면 None.
+        """
+        key = self.__key(url)
+        with self.__lock:
+            meta = self.__index.get(key)
+            if meta is None or self.__clock() - meta["stored_at"] >= self.__ttl:
+                return None
+            return self.__load_response_locked(key)
+
+    def get_conditional_headers(self, url: str) -> Dict[str, str]:
+        """재검증용 조건부 요청 헤더를 반환합니다.
+
+        Args:
+            url (str): 요청 URL.
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since 헤더 (없으면 빈 딕셔너리).
+        """
+        with self.__lock:
+            meta = self.__index.get(self.__key(url))
+            if meta is None:
+                return {}
+
+            headers: Dict[str, str] = {}
+            if meta["headers"].get("ETag"):
+                headers["If-None-Match"] = meta["headers"]["ETag"]
+            if meta["headers"].get("Last-Modified"):
+                headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+            return headers
+
+    def revalidate(
+        self, url: str, not_modified: requests.Response
+    ) -> Optional[CrawlResponse]:
+        """304 응답을 받은 항목의 저장 시각을 갱신하고 캐시된 응답을 반환합니다.
+
+        Args:
+            url (str): 요청 URL.
+            not_modified (requests.Response): 서버의 304 응답.
+
+        Returns:
+            Optional[CrawlResponse]: 캐시된 응답. 항목이 없으면 None.
+        """
+        key = self.__key(url)
+        with self.__lock:
+            meta = self.__index.get(key)
+            if meta is None:
+                return None
+
+            # 304 응답에 새 검증 헤더가 있으면 반영
+            for name in ("ETag", "Last-Modified"):
+                if not_modified.headers.get(name):
+                    meta["headers"][name] = not_modified.headers[name]
+            meta["stored_at"] = self.__clock()
+            self.__write_atomic(
+                self.__path(key, self.__META_EXT), json.dumps(meta).encode("utf-8")
+            )
+            return self.__load_response_locked(key)
+
+    def store(self, url: str, resp: requests.Response) -> None:
+        """200 응답을 캐시에 저장합니다. 용량을 넘으면 오래된 항목부터 제거합니다.
+
+        Args:
+            url (str): 요청 URL.
+            resp (requests.Response): 저장할 응답.
+        """
+        body = resp.content
+        if resp.status_code != 200 or len(body) > self.__max_bytes:
+            return
+
+        key = self.__key(url)
+        meta = {
+            "url": url,
+            "stored_at": self.__clock(),
+            "size": len(body),
+            "encoding": resp.encoding,
+            "headers": {
+                name: resp.headers[name]
+                for name in ("Content-Type", "ETag", "Last-Modified")
+                if name in resp.headers
+            },
+        }
+
+        with self.__lock:
+            self.__remove_locked(key)
+            self.__write_atomic(self.__path(key, self.__BODY_EXT), body)
+            self.__write_atomic(
+                self.__path(key, self.__META_EXT), json.dumps(meta).encode("utf-8")
+            )
+            self.__index[key] = meta
+            self.__total_bytes += meta["size"]
+
+            while self.__total_bytes > self.__max_bytes:
+                self.__remove_locked(next(iter(self.__index)))
+
+    def get_total_bytes(self) -> int:
+        """캐시에 저장된 본문의 총 크기 반환.
+
+        Returns:
+            int: 바이트 수.
+        """
+        with self.__lock:
+            return self.__total_bytes
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__index)
+
+    def __contains__(self, url: str) -> bool:
+        with self.__lock:
+            return self.__key(url) in self.__index
@@ -0,0 +1,155 @@
+import random
+from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Mapping, Optional
+
+
+class CrawlRetryError(RuntimeError):
+    """재시도 후에도 유효한 응답을 받지 못했을 때 발생하는 예외.
+
+    Attributes:
+        retries (int): 수행한 재시도 횟수.
+        sleep_time (float): 재시도 대기에 사용한 총 시간(초).
+        last_status (Optional[int]): 마지막 응답의 HTTP 상태 코드 (예외로 끝났으면 None).
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retries: int,
+        sleep_time: float,
+        last_status: Optional[int],
+    ):
+        super().__init__(message)
+        self.retries: int = retries
+        self.sleep_time: float = sleep_time
+        self.last_status: Optional[int] = last_status
+
+
+class ICrawlRetryPolicy(ABC):
+    """요청 실패 시 재시도 여부와 대기 시간을 결정하는 인터페이스 클래스입니다."""
+
+    @abstractmethod
+    def get_delay(
+        self,
+        attempt: int,
+        status: Optional[int],
+        headers: Mapping[str, str],
+    ) -> Optional[float]:
+        """실패한 요청 이후 다음 시도까지 대기할 시간을 반환합니다.
+
+        Args:
+            attempt (int): 지금까지 실패한 시도 횟수 (1부터 시작).
+            status (Optional[int]): 실패한 응답의 HTTP 상태 코드.
+                연결 오류 등 응답이 없으면 None.
+            headers (Mapping[str, str]): 실패한 응답의 헤더 (응답이 없으면 빈 매핑).
+
+        Returns:
+            Optional[float]: 대기 시간(초). None이면 더 이상 재시도하지 않음.
+        """
+        pass
+
+
+class CrawlBackoffRetryPolicy(ICrawlRetryPolicy):
+    """지수 백오프와 지터를 사용하는 기본 재시도 정책.
+
+    - 404 같은 영구 오류는 재시도하지 않고 즉시 실패합니다.
+    - 연결 오류, 5xx, 408, 425, 429는 일시 오류로 보고 재시도합니다.
+    - Retry-After 헤더(초 또는 HTTP 날짜)가 있으면 그 시간 이상 대기합니다.
+
+    Attributes:
+        __TRANSIENT_STATUS (frozenset[int]): 5xx 외에 재시도할 상태 코드.
+    """
+
+    __TRANSIENT_STATUS = frozenset({408, 425, 429})
+
+    def __init__(
+        self,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        max_retry_after: float = 120.0,
+        rng: Callable[[], float] = random.random,
+    ):
+        """CrawlBackoffRetryPolicy 생성자.
+
+        Args:
+            max_retries (int): 최초 시도 이후 최대 재시도 횟수.
+            base_delay (float): 첫 재시도 대기 시간(초). 이후 2배씩 증가.
+            max_delay (float): 백오프 대기 시간 상한(초).
+            jitter (bool): True면 [0, 백오프] 범위에서 무작위 대기 (full jitter).
+            max_retry_after (float): 허용할 Retry-After 최대값(초).
+                더 긴 대기를 요구하면 재시도하지 않음.
+            rng (Callable[[], float]): [0, 1) 난수 함수 (테스트용).
+
+        Raises:
+            ValueError: 설정 값이 음수인 경우.
+        """
+        if max_retries < 0 or min(base_delay, max_delay, max_retry_after) < 0:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Retry settings must not be negative.")
+
+        self.__max_retries: int = max_retries
+        self.__base_delay: float = base_delay
+        self.__max_delay: float = max_delay
+        self.__jitter: bool = jitter
+        self.__max_retry_after: float = max_retry_after
+        self.__rng: Callable[[], float] = rng
+
+    def is_transient(self, status: Optional[int]) -> bool:
+        """재시도할 가치가 있는 실패인지 판단합니다.
+
+        Args:
+            status (Optional[int]): HTTP 상태 코드 (응답이 없으면 None).
+
+        Returns:
+            bool: 일시 오류이면 True.
+        """
+        return status is None or status >= 500 or status in self.__TRANSIENT_STATUS
+
+    def get_delay(
+        self,
+        attempt: int,
+        status: Optional[int],
+        headers: Mapping[str, str],
+    ) -> Optional[float]:
+        if attempt > self.__max_retries or not self.is_transient(status):
+            return None
+
+        backoff = min(self.__max_delay, self.__base_delay * (2 ** (attempt - 1)))
+        if self.__jitter:
+            backoff *= self.__rng()
+
+        retry_after = self.__parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            return backoff
+        if retry_after > self.__max_retry_after:
+            return None
+        return max(backoff, retry_after)
+
+    @staticmethod
+    def __parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더 값을 초 단위로 변환.
+
+        Args:
+            value (Optional[str]): 초(정수) 또는 HTTP 날짜 형식의 헤더 값.
+
+        Returns:
+            Optional[float]: 대기 시간(초). 값이 없거나 해석할 수 없으면 None.
+        """
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
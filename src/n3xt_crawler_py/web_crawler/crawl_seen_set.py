@@ -0,0 +1,144 @@
+import hashlib
+import sqlite3
+import threading
+from typing import Set
+
+from n3xt_crawler_py.web_crawler.crawl_bloom_filter import CrawlBloomFilter
+
+
+class CrawlSeenSet:
+    """블룸 필터와 정확한 보조 저장소를 결합한 방문 URL 집합.
+
+    대부분의 새 URL은 메모리의 블룸 필터만으로 "처음 봄"이 확정되고,
+    블룸 필터가 "있을 수도 있음"이라고 답한 경우에만 SQLite 보조 저장소에서 정확히 확인합니다.
+    보조 저장소는 URL 문자열 대신 16바이트 해시만 저장하며, 파일 경로를 지정하면
+    메모리 대신 디스크에 저장되어 수백만 URL에서도 메모리 사용량이 작게 유지됩니다.
+
+    새 URL의 해시는 메모리에 모았다가 commit_every개마다 한 트랜잭션으로 기록하므로,
+    URL마다 디스크 트랜잭션이 생기지 않습니다. 아직 기록하지 않은 해시는 flush() 또는
+    close()에서 기록되며, 그 전에 프로세스가 종료되면 최대 commit_every개가 유실됩니다.
+
+    Attributes:
+        __DIGEST_SIZE (int): 보조 저장소에 저장할 BLAKE2b 해시 길이(바이트).
+    """
+
+    __DIGEST_SIZE = 16
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        exact_path: str = ":memory:",
+        commit_every: int = 1000,
+    ):
+        """CrawlSeenSet 생성자.
+
+        Args:
+            capacity (int): 예상 URL 수 (블룸 필터 크기 결정).
+            error_rate (float): 블룸 필터 오탐률 (보조 저장소 조회 비율).
+            exact_path (str): 보조 저장소 SQLite 경로. 기본값은 메모리.
+            commit_every (int): 보조 저장소에 한 번에 기록할 새 해시 수.
+
+        Raises:
+            ValueError: 블룸 필터 파라미터가 잘못되었거나 commit_every가 1보다 작은 경우.
+        """
+        if commit_every < 1:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] commit_every must be >= 1: {commit_every}")
+        self.__bloom: CrawlBloomFilter = CrawlBloomFilter(capacity, error_rate)
+        self.__lock = threading.Lock()
+        self.__exact_lookups: int = 0
+        self.__commit_every: int = commit_every
+        self.__pending: Set[bytes] = set()
+        self.__conn = sqlite3.connect(exact_path, check_same_thread=False)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (hash BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+        # 기존 파일을 다시 연 경우 블룸 필터를 복원
+        self.__count: int = self.__conn.execute(
+            "SELECT COUNT(*) FROM seen"
+        ).fetchone()[0]
+        if self.__count:
+            self.__bloom = CrawlBloomFilter(max(capacity, self.__count), error_rate)
+            for (digest,) in self.__conn.execute("SELECT hash FROM seen"):
+                self.__bloom.add(digest.hex())
+
+    def __digest(self, url: str) -> bytes:
+        return hashlib.blake2b(
+            url.encode("utf-8"), digest_size=self.__DIGEST_SIZE
+        ).digest()
+
+    def add(self, url: str) -> bool:
+        """URL을 집합에 추가합니다.
+
+        Args:
+            url (str): 정규화된 URL.
+
+        Returns:
+            bool: 처음 본 URL이면 True.
+        """
+        digest = self.__digest(url)
+        with self.__lock:
+            if not self.__bloom.add(digest.hex()):
+                # 블룸 필터가 "있을 수도 있음"이라고 답한 경우에만 정확히 확인
+                if self.__contains_exact(digest):
+                    return False
+            self.__pending.add(digest)
+            self.__count += 1
+            if len(self.__pending) >= self.__commit_every:
+                self.__flush_pending()
+            return True
+
+    def __contains_exact(self, digest: bytes) -> bool:
+        """기록 대기 중인 해시와 보조 저장소에서 정확히 확인 (잠금을 잡은 상태에서 호출)."""
+        if digest in self.__pending:
+            return True
+        self.__exact_lookups += 1
+        row = self.__conn.execute(
+            "SELECT 1 FROM seen WHERE hash = ?", (digest,)
+        ).fetchone()
+        return row is not None
+
+    def __flush_pending(self) -> None:
+        """기록 대기 중인 해시를 한 트랜잭션으로 기록 (잠금을 잡은 상태에서 호출)."""
+        if not self.__pending:
+            return
+        self.__conn.executemany(
+            "INSERT OR IGNORE INTO seen (hash) VALUES (?)",
+            [(digest,) for digest in self.__pending],
+        )
+        self.__conn.commit()
+        self.__pending.clear()
+
+    def __contains__(self, url: str) -> bool:
+        digest = self.__digest(url)
+        with self.__lock:
+            if digest.hex() not in self.__bloom:
+                return False
+            return self.__contains_exact(digest)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__count
+
+    def get_exact_lookups(self) -> int:
+        """보조 저장소를 조회한 횟수 반환 (블룸 필터 효율 확인용).
+
+        Returns:
+            int: 조회 횟수.
+        """
+        with self.__lock:
+            return self.__exact_lookups
+
+    def flush(self) -> None:
+        """기록 대기 중인 해시를 보조 저장소에 기록합니다."""
+        with self.__lock:
+            self.__flush_pending()
+
+    def close(self) -> None:
+        """기록 대기 중인 해시를 기록하고 보조 저장소 연결을 닫습니다."""
+        with self.__lock:
+            self.__flush_pending()
+            self.__conn.close()
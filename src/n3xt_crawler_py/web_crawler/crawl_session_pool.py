@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CrawlSessionPool:
+    """(요청 모드, 호스트) 단위로 requests.Session을 재사용하는 세션 풀.
+
+    세션을 요청마다 새로 만들지 않고 keep-alive 연결을 유지하므로
+    같은 호스트에 대한 반복 요청은 TCP/TLS 핸드셰이크를 한 번만 수행합니다.
+    여러 스레드에서 공유해도 안전합니다.
+
+    유휴/최대 개수 초과로 제거된 세션은 다른 스레드가 아직 사용 중일 수 있으므로 닫지 않고
+    풀에서 참조만 제거합니다. 연결은 마지막 사용자가 세션을 놓으면 가비지 컬렉션 시 닫힙니다.
+
+    Attributes:
+        __pool_connections (int): 세션별로 캐시할 연결 풀(호스트) 개수.
+        __pool_maxsize (int): 연결 풀당 유지할 최대 연결 수.
+        __idle_timeout (float): 사용되지 않은 세션을 제거하기까지의 시간(초).
+        __max_sessions (int): 풀에 유지할 최대 세션 수.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: float = 60.0,
+        max_sessions: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CrawlSessionPool 생성자.
+
+        Args:
+            pool_connections (int): 세션별로 캐시할 연결 풀(호스트) 개수.
+            pool_maxsize (int): 연결 풀당 유지할 최대 연결 수.
+            idle_timeout (float): 유휴 세션 제거 기준 시간(초).
+            max_sessions (int): 풀에 유지할 최대 세션 수.
+            clock (Callable[[], float]): 현재 시각을 반환하는 함수 (테스트용).
+
+        Raises:
+            ValueError: 크기 또는 시간 설정이 유효하지 않은 경우.
+        """
+        if min(pool_connections, pool_maxsize, max_sessions) < 1 or idle_timeout <= 0:
+            cls = self.__class__.__name__
+            raise ValueError(f"[{cls}] Pool sizes must be >= 1 and idle_timeout > 0.")
+
+        self.__pool_connections: int = pool_connections
+        self.__pool_maxsize: int = pool_maxsize
+        self.__idle_timeout: float = idle_timeout
+        self.__max_sessions: int = max_sessions
+        self.__clock: Callable[[], float] = clock
+        self.__lock = threading.Lock()
+        self.__sessions: "OrderedDict[Tuple[Hashable, str], Tuple[requests.Session, float]]" = (
+            OrderedDict()
+        )
+
+    def get_session(
+        self,
+        mode: Hashable,
+        host: str,
+        factory: Callable[[], requests.Session],
+    ) -> requests.Session:
+        """(모드, 호스트)에 해당하는 세션을 반환합니다. 없으면 새로 생성합니다.
+
+        반환된 세션은 풀이 소유하므로 호출자가 close()하면 안 됩니다.
+
+        Args:
+            mode (Hashable): 요청 모드 (예: CrawlRequestMode.TOR).
+            host (str): 요청 대상 호스트.
+            factory (Callable[[], requests.Session]): 새 세션 생성 함수
+                (프록시 등 모드별 설정 포함).
+
+        Returns:
+            requests.Session: 재사용 가능한 세션.
+        """
+        key = (mode, host)
+        with self.__lock:
+            now = self.__clock()
+            self.__evict_idle_locked(now)
+
+            entry = self.__sessions.get(key)
+            if entry is not None:
+                session = entry[0]
+                self.__sessions[key] = (session, now)
+                self.__sessions.move_to_end(key)
+                return session
+
+            session = self.__mount_adapters(factory())
+            self.__sessions[key] = (session, now)
+            while len(self.__sessions) > self.__max_sessions:
+                # 진행 중인 요청이 있을 수 있으므로 닫지 않고 참조만 제거
+                self.__sessions.popitem(last=False)
+            return session
+
+    def __mount_adapters(self, session: requests.Session) -> requests.Session:
+        """세션에 풀 크기가 설정된 HTTPAdapter를 장착.
+
+        Args:
+            session (requests.Session): 대상 세션.
+
+        Returns:
+            requests.Session: 어댑터가 장착된 세션.
+        """
+        for prefix in ("http://", "https://"):
+            session.mount(
+                prefix,
+                HTTPAdapter(
+                    pool_connections=self.__pool_connections,
+                    pool_maxsize=self.__pool_maxsize,
+                ),
+            )
+        return session
+
+    def __evict_idle_locked(self, now: float) -> int:
+        """유휴 시간이 지난 세션을 풀에서 제거 (잠금을 보유한 상태에서 호출).
+
+        사용 중일 수 있으므로 닫지 않으며, 연결은 가비지 컬렉션 시 닫힙니다.
+
+        Args:
+            now (float): 현재 시각.
+
+        Returns:
+            int: 제거된 세션 수.
+        """
+        expired = [
+            key
+            for key, (_, last_used) in self.__sessions.items()
+            if now - last_used >= self.__idle_timeout
+        ]
+        for key in expired:
+            del self.__sessions[key]
+        return len(expired)
+
+    def evict_idle(self) -> int:
+        """유휴 시간이 지난 세션을 풀에서 제거합니다.
+
+        Returns:
+            int: 제거된 세션 수.
+        """
+        with self.__lock:
+            return self.__evict_idle_locked(self.__clock())
+
+    def close(self) -> None:
+        """풀에 있는 모든 세션을 닫습니다 (모든 요청이 끝난 뒤 호출)."""
+        with self.__lock:
+            for session, _ in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__sessions)
+
+    def __enter__(self) -> "CrawlSessionPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
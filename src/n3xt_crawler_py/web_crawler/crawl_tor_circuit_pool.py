@@ -0,0 +1,271 @@
+import random
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import (
+    CrawlTorProxyPool,
+    ICrawlTorProxyProvider,
+)
+
+
+@dataclass
+class _CircuitState:
+    """회로 하나의 가변 상태 (풀의 잠금 안에서만 변경)."""
+
+    port: int
+    username: str
+    requests: int = 0
+    errors: int = 0
+    inflight: int = 0
+    latency: Optional[float] = None
+    error_rate: float = 0.0
+
+
+@dataclass(frozen=True)
+class CrawlTorCircuitStats:
+    """회로 하나의 통계 스냅샷.
+
+    Attributes:
+        port (int): SOCKS 포트.
+        username (str): 스트림 격리용 SOCKS 사용자명 (회로 식별자).
+        requests (int): 현재 회로로 완료된 요청 수.
+        errors (int): 그중 프록시 수준에서 실패한 요청 수.
+        inflight (int): 진행 중인 요청 수.
+        latency (Optional[float]): 성공한 요청 시간의 지수 이동 평균(초). 아직 없으면 None.
+        error_rate (float): 실패율의 지수 이동 평균 (0~1).
+    """
+
+    port: int
+    username: str
+    requests: int
+    errors: int
+    inflight: int
+    latency: Optional[float]
+    error_rate: float
+
+
+class CrawlTorCircuitPool(ICrawlTorProxyProvider):
+    """SOCKS 인증 스트림 격리로 요청을 여러 Tor 회로에 분산하는 회로 풀.
+
+    Tor는 SOCKS 사용자명/비밀번호가 다른 연결을 서로 다른 회로로 보내므로(IsolateSOCKSAuth, 기본값)
+    회로마다 고유한 사용자명을 부여해 하나의 Tor 포트에서도 N개의 회로를 동시에 사용합니다.
+
+    - 회로 선택: 무작위 두 후보 중 (평균 지연 x (진행 중 요청 + 1))이 작은 회로 (power of two choices)
+    - 실패율이 max_error_rate를 넘거나 평균 지연이 max_latency를 넘은 회로는
+      사용자명을 바꿔 새 회로로 교체합니다.
+    - 제어 포트를 지정하면 new_identity()로 NEWNYM 신호를 보내 모든 회로를 새로 만듭니다.
+    여러 스레드에서 공유해도 안전합니다.
+
+    Attributes:
+        __EWMA_ALPHA (float): 지연/실패율 이동 평균의 가중치.
+        __MIN_SAMPLES (int): 교체 판단 전에 필요한 최소 요청 수.
+    """
+
+    __EWMA_ALPHA = 0.3
+    __MIN_SAMPLES = 5
+
+    def __init__(
+        self,
+        circuits: int = 4,
+        ports: Iterable[int] = (9050,),
+        host: str = "127.0.0.1",
+        max_error_rate: float = 0.5,
+        max_latency: Optional[float] = None,
+        control_port: Optional[int] = None,
+        control_password: str = "",
+        proxy_pool: Optional[CrawlTorProxyPool] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """CrawlTorCircuitPool 생성자.
+
+        Args:
+            circuits (int): 포트당 사용할 회로 수.
+            ports (Iterable[int]): Tor SOCKS 포트 목록.
+            host (str): Tor가 실행 중인 호스트.
+            max_error_rate (float): 회로를 교체할 실패율 기준 (0~1).
+            max_latency (Optional[float]): 회로를 교체할 평균 지연 기준(초). None이면 지연으로 교체하지 않음.
+            control_port (Optional[int]): Tor 제어 포트 (new_identity() 사용 시 필요).
+            control_password (str): 제어 포트 인증 비밀번호 (HashedControlPassword).
+            proxy_pool (Optional[CrawlTorProxyPool]): 포트 상태 검사용 풀.
+                None이면 ports와 host로 새로 만듭니다.
+            rng (Optional[random.Random]): 회로 선택용 난수 생성기 (테스트용).
+
+        Raises:
+            ValueError: circuits가 1보다 작거나 max_error_rate가 범위를 벗어난 경우.
+        """
+        ports = list(dict.fromkeys(ports))
+        if circuits < 1 or not 0.0 < max_error_rate <= 1.0:
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Invalid circuit pool settings: circuits={circuits}, "
+                f"max_error_rate={max_error_rate}"
+            )
+
+        self.__host: str = host
+        self.__max_error_rate: float = max_error_rate
+        self.__max_latency: Optional[float] = max_latency
+        self.__control_port: Optional[int] = control_port
+        self.__control_password: str = control_password
+        self.__proxy_pool: CrawlTorProxyPool = proxy_pool or CrawlTorProxyPool(
+            ports, host
+        )
+        self.__rng: random.Random = rng or random.Random()
+        self.__lock = threading.Lock()
+        self.__generation: int = 0
+        self.__circuits: Dict[str, _CircuitState] = {}
+        for port in ports:
+            for _ in range(circuits):
+                self.__add_circuit_locked(port)
+
+    def __add_circuit_locked(self, port: int) -> None:
+        """새 사용자명으로 회로를 추가 (사용자명이 바뀌면 Tor가 새 회로를 만듦)."""
+        self.__generation += 1
+        username = f"n3xt-{self.__generation}"
+        self.__circuits[self.__to_proxy_url(port, username)] = _CircuitState(
+            port, username
+        )
+
+    def __to_proxy_url(self, port: int, username: str) -> str:
+        return f"socks5h://{username}:x@{self.__host}:{port}"
+
+    def __score(self, circuit: _CircuitState) -> float:
+        # 아직 측정되지 않은 회로는 먼저 사용해 지연을 측정
+        latency = circuit.latency if circuit.latency is not None else 0.0
+        return latency * (circuit.inflight + 1) + circuit.inflight * 1e-6
+
+    def get_proxy_url(self) -> str:
+        """다음 요청에 사용할 회로의 프록시 URL을 반환합니다.
+
+        반환할 때마다 진행 중 요청 수가 늘어나므로, 요청이 끝나면 반드시 report()를 호출해야 합니다
+        (CrawlRequester는 자동으로 호출).
+
+        Returns:
+            str: `socks5h://<회로 사용자명>:x@host:port` 형식의 프록시 URL.
+
+        Raises:
+            RuntimeError: 정상인 SOCKS 포트가 없는 경우.
+        """
+        healthy_ports = set(self.__proxy_pool.get_healthy_ports())
+        with self.__lock:
+            candidates = [
+                url for url, c in self.__circuits.items() if c.port in healthy_ports
+            ]
+            if not candidates:
+                cls = self.__class__.__name__
+                raise RuntimeError(
+                    f"[{cls}] Tor mode is enabled but no SOCKS port is reachable "
+                    f"on {self.__host}."
+                )
+
+            if len(candidates) > 1:
+                candidates = self.__rng.sample(candidates, 2)
+            url = min(candidates, key=lambda u: self.__score(self.__circuits[u]))
+            self.__circuits[url].inflight += 1
+            return url
+
+    def report(self, proxy_url: str, success: bool, elapsed: float) -> None:
+        """요청 결과로 회로 통계를 갱신하고, 기준을 넘은 회로는 새 회로로 교체합니다.
+
+        Args:
+            proxy_url (str): get_proxy_url()로 받은 프록시 URL.
+            success (bool): 회로를 통해 응답을 받았으면 True.
+            elapsed (float): 요청에 걸린 시간(초).
+        """
+        alpha = self.__EWMA_ALPHA
+        with self.__lock:
+            circuit = self.__circuits.get(proxy_url)
+            if circuit is None:
+                # 교체되었거나 new_identity()로 초기화된 회로
+                return
+
+            circuit.inflight = max(0, circuit.inflight - 1)
+            circuit.requests += 1
+            circuit.error_rate = (1 - alpha) * circuit.error_rate + alpha * (not success)
+            if success:
+                circuit.latency = (
+                    elapsed
+                    if circuit.latency is None
+                    else (1 - alpha) * circuit.latency + alpha * elapsed
+                )
+            else:
+                circuit.errors += 1
+
+            if circuit.requests >= self.__MIN_SAMPLES and (
+                circuit.error_rate > self.__max_error_rate
+                or (
+                    self.__max_latency is not None
+                    and circuit.latency is not None
+                    and circuit.latency > self.__max_latency
+                )
+            ):
+                del self.__circuits[proxy_url]
+                self.__add_circuit_locked(circuit.port)
+
+        if not success:
+            self.__proxy_pool.report(
+                self.__proxy_pool.get_proxy_url_for(circuit.port), False, elapsed
+            )
+
+    def get_stats(self) -> List[CrawlTorCircuitStats]:
+        """회로별 통계 스냅샷 반환.
+
+        Returns:
+            List[CrawlTorCircuitStats]: 회로 통계 (생성 순서).
+        """
+        with self.__lock:
+            return [
+                CrawlTorCircuitStats(
+                    c.port,
+                    c.username,
+                    c.requests,
+                    c.errors,
+                    c.inflight,
+                    c.latency,
+                    c.error_rate,
+                )
+                for c in self.__circuits.values()
+            ]
+
+    def __send_control_commands(self, commands: List[str]) -> None:
+        """제어 포트에 명령을 보내고 모든 응답이 250인지 확인."""
+        cls = self.__class__.__name__
+        if self.__control_port is None:
+            raise RuntimeError(f"[{cls}] control_port is not configured.")
+
+        try:
+            with socket.create_connection(
+                (self.__host, self.__control_port), timeout=5.0
+            ) as sock:
+                reader = sock.makefile("rb")
+                for command in commands:
+                    sock.sendall(command.encode("utf-8") + b"\r\n")
+                    reply = reader.readline().decode("utf-8", "replace").strip()
+                    if not reply.startswith("250"):
+                        raise RuntimeError(
+                            f"[{cls}] Tor control command failed: "
+                            f"{command.split(' ', 1)[0]} -> {reply!r}"
+                        )
+                sock.sendall(b"QUIT\r\n")
+        except OSError as e:
+            raise RuntimeError(
+                f"[{cls}] Failed to talk to Tor control port {self.__control_port}: {e}"
+            ) from e
+
+    def new_identity(self) -> None:
+        """제어 포트로 NEWNYM 신호를 보내 새 회로를 요청하고 모든 회로 통계를 초기화합니다.
+
+        Tor는 NEWNYM을 약 10초에 한 번만 적용하므로 짧은 간격으로 반복 호출해도 효과가 없습니다.
+
+        Raises:
+            RuntimeError: 제어 포트가 설정되지 않았거나 인증/명령이 실패한 경우.
+        """
+        password = self.__control_password.replace("\\", "\\\\").replace('"', '\\"')
+        self.__send_control_commands([f'AUTHENTICATE "{password}"', "SIGNAL NEWNYM"])
+
+        with self.__lock:
+            ports = [c.port for c in self.__circuits.values()]
+            self.__circuits.clear()
+            for port in ports:
+                self.__add_circuit_locked(port)
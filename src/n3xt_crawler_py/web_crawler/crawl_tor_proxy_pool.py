@@ -0,0 +1,212 @@
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class ICrawlTorProxyProvider(ABC):
+    """TOR 모드 요청에 사용할 SOCKS 프록시 URL을 제공하는 인터페이스 클래스입니다."""
+
+    @abstractmethod
+    def get_proxy_url(self) -> str:
+        """다음 요청에 사용할 프록시 URL을 반환합니다.
+
+        Returns:
+            str: `socks5h://...` 형식의 프록시 URL.
+
+        Raises:
+            RuntimeError: 사용할 수 있는 프록시가 없는 경우.
+        """
+        pass
+
+    def report(self, proxy_url: str, success: bool, elapsed: float) -> None:
+        """프록시를 사용한 요청 결과를 알려줍니다. 기본 구현은 아무것도 하지 않습니다.
+
+        Args:
+            proxy_url (str): get_proxy_url()로 받은 프록시 URL.
+            success (bool): 프록시를 통해 응답을 받았으면 True (HTTP 상태와 무관).
+            elapsed (float): 요청에 걸린 시간(초).
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class CrawlTorProxyHealth:
+    """SOCKS 포트 하나의 마지막 검사 결과.
+
+    Attributes:
+        port (int): SOCKS 포트.
+        healthy (bool): SOCKS5 핸드셰이크에 성공했으면 True.
+        checked_at (float): 검사 시각 (풀의 clock 기준).
+        latency (Optional[float]): 핸드셰이크에 걸린 시간(초). 실패 시 None.
+        error (Optional[str]): 실패 사유.
+    """
+
+    port: int
+    healthy: bool
+    checked_at: float
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+
+class CrawlTorProxyPool(ICrawlTorProxyProvider):
+    """하나 이상의 로컬 Tor SOCKS 포트를 검사하고 라운드 로빈으로 분배하는 프록시 풀.
+
+    - 포트 상태는 프로세스 안에서 소켓 연결 + SOCKS5 인사 핸드셰이크로 검사하며,
+      결과는 ttl 동안 캐시되므로 요청마다 외부 명령을 실행하지 않습니다.
+    - 여러 Tor 인스턴스(포트)를 지정하면 정상 포트에 요청을 번갈아 분배합니다.
+    - 요청이 프록시 수준에서 실패하면(report) 해당 포트의 캐시를 무효화해 다음 사용 시 다시 검사합니다.
+    여러 스레드에서 공유해도 안전합니다.
+
+    Attributes:
+        __SOCKS5_GREETING (bytes): 버전 5, 인증 방식 2개(no-auth, 사용자명/비밀번호) 인사 메시지.
+        __SOCKS5_ACCEPTED (Tuple[bytes, ...]): 정상으로 볼 서버 응답.
+    """
+
+    __SOCKS5_GREETING = b"\x05\x02\x00\x02"
+    __SOCKS5_ACCEPTED = (b"\x05\x00", b"\x05\x02")
+
+    def __init__(
+        self,
+        ports: Iterable[int] = (9050,),
+        host: str = "127.0.0.1",
+        ttl: float = 10.0,
+        probe_timeout: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CrawlTorProxyPool 생성자.
+
+        Args:
+            ports (Iterable[int]): Tor SOCKS 포트 목록.
+            host (str): Tor가 실행 중인 호스트.
+            ttl (float): 검사 결과를 재사용할 시간(초).
+            probe_timeout (float): 검사 연결/응답 제한 시간(초).
+            clock (Callable[[], float]): 현재 시각을 반환하는 함수 (테스트용).
+
+        Raises:
+            ValueError: 포트 목록이 비었거나 ttl/probe_timeout이 유효하지 않은 경우.
+        """
+        self.__ports: List[int] = list(dict.fromkeys(ports))
+        if not self.__ports or ttl < 0 or probe_timeout <= 0:
+            cls = self.__class__.__name__
+            raise ValueError(
+                f"[{cls}] Invalid proxy pool settings: ports={self.__ports}, "
+                f"ttl={ttl}, probe_timeout={probe_timeout}"
+            )
+
+        self.__host: str = host
+        self.__ttl: float = ttl
+        self.__probe_timeout: float = probe_timeout
+        self.__clock: Callable[[], float] = clock
+        self.__lock = threading.Lock()
+        self.__health: Dict[int, CrawlTorProxyHealth] = {}
+        self.__next: int = 0
+
+    def get_proxy_url_for(self, port: int) -> str:
+        """포트의 프록시 URL 반환 (DNS도 Tor로 해석하도록 socks5h 사용).
+
+        Args:
+            port (int): SOCKS 포트.
+
+        Returns:
+            str: 프록시 URL.
+        """
+        return f"socks5h://{self.__host}:{port}"
+
+    def probe(self, port: int) -> CrawlTorProxyHealth:
+        """포트에 연결해 SOCKS5 핸드셰이크를 수행하고 결과를 캐시에 저장합니다.
+
+        Args:
+            port (int): 검사할 SOCKS 포트.
+
+        Returns:
+            CrawlTorProxyHealth: 검사 결과.
+        """
+        started = time.perf_counter()
+        try:
+            with socket.create_connection(
+                (self.__host, port), timeout=self.__probe_timeout
+            ) as sock:
+                sock.sendall(self.__SOCKS5_GREETING)
+                reply = sock.recv(2)
+            if reply not in self.__SOCKS5_ACCEPTED:
+                raise ConnectionError(f"unexpected SOCKS5 reply: {reply!r}")
+            health = CrawlTorProxyHealth(
+                port, True, self.__clock(), time.perf_counter() - started
+            )
+        except OSError as e:
+            health = CrawlTorProxyHealth(port, False, self.__clock(), error=str(e))
+
+        with self.__lock:
+            self.__health[port] = health
+        return health
+
+    def is_healthy(self, port: int) -> bool:
+        """포트가 정상인지 반환합니다 (캐시가 만료되었으면 다시 검사).
+
+        Args:
+            port (int): SOCKS 포트.
+
+        Returns:
+            bool: 정상이면 True.
+        """
+        with self.__lock:
+            health = self.__health.get(port)
+        if health is None or self.__clock() - health.checked_at >= self.__ttl:
+            health = self.probe(port)
+        return health.healthy
+
+    def get_healthy_ports(self) -> List[int]:
+        """정상인 포트 목록 반환.
+
+        Returns:
+            List[int]: 정상 포트 (등록 순서).
+        """
+        return [port for port in self.__ports if self.is_healthy(port)]
+
+    def get_health(self) -> Dict[int, CrawlTorProxyHealth]:
+        """포트별 마지막 검사 결과 반환 (아직 검사하지 않은 포트는 제외).
+
+        Returns:
+            Dict[int, CrawlTorProxyHealth]: 포트 -> 검사 결과.
+        """
+        with self.__lock:
+            return dict(self.__health)
+
+    def get_proxy_url(self) -> str:
+        """정상 포트를 라운드 로빈으로 골라 프록시 URL을 반환합니다.
+
+        Returns:
+            str: 프록시 URL.
+
+        Raises:
+            RuntimeError: 정상인 포트가 하나도 없는 경우.
+        """
+        for _ in range(len(self.__ports)):
+            with self.__lock:
+                port = self.__ports[self.__next % len(self.__ports)]
+                self.__next += 1
+            if self.is_healthy(port):
+                return self.get_proxy_url_for(port)
+
+        cls = self.__class__.__name__
+        raise RuntimeError(
+            f"[{cls}] Tor mode is enabled but no SOCKS port is reachable "
+            f"on {self.__host}: {self.__ports}"
+        )
+
+    def report(self, proxy_url: str, success: bool, elapsed: float) -> None:
+        """프록시 수준 실패가 보고되면 해당 포트를 다음 사용 시 다시 검사하도록 합니다.
+
+        Args:
+            proxy_url (str): get_proxy_url()로 받은 프록시 URL.
+            success (bool): 프록시를 통해 응답을 받았으면 True.
+            elapsed (float): 요청에 걸린 시간(초).
+        """
+        if success:
+            return
+        port = int(proxy_url.rsplit(":", 1)[-1])
+        with self.__lock:
+            self.__health.pop(port, None)
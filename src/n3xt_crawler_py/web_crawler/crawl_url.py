@@ -1,4 +1,5 @@
 import re
+from urllib.parse import urlsplit, urlunsplit
 
 
 class CrawlUrl:
@@ -7,10 +8,12 @@ class CrawlUrl:
     생성 시 URL 형식이 유효한지 정규식으로 검사합니다.
 
     Attributes:
+        __DEFAULT_PORTS (Dict[str, int]): 정규화 시 생략할 스킴별 기본 포트.
         __URL_RE (str): URL 형식을 검증하기 위한 정규식 패턴.
         __url (str): 검증된 URL 문자열.
     """
 
+    __DEFAULT_PORTS = {"http": 80, "https": 443}
     __URL_RE = r"(?:https?:\/\/)?(?:www\.)?([a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}|[a-zA-Z0-9-]+\.[a-zA-Z]{2,})(?=\/|$)"
 
     def __init__(self, url: str):
@@ -45,3 +48,46 @@ class CrawlUrl:
             str: 저장된 URL.
         """
         return self.__url
+
+    def get_host(self) -> str:
+        """URL의 호스트(포트 포함) 반환.
+
+        스킴이 생략된 URL(예: `example.com/path`)도 처리합니다.
+
+        Returns:
+            str: 소문자로 정규화된 `host[:port]` 문자열.
+        """
+        url = self.__url if "://" in self.__url else f"//{self.__url}"
+        netloc = urlsplit(url).netloc
+        return netloc.rsplit("@", 1)[-1].lower()
+
+    def get_normalized(self) -> str:
+        """중복 판단에 사용할 정규화된 URL 반환.
+
+        - 스킴이 없으면 http로 간주하고, 스킴과 호스트는 소문자로 변환
+        - 스킴별 기본 포트(http:80, https:443)와 프래그먼트(#...) 제거
+        - 빈 경로는 `/`로 통일 (쿼리 문자열은 순서를 유지)
+
+        Returns:
+            str: 정규화된 URL.
+        """
+        url = self.__url if "://" in self.__url else f"http://{self.__url}"
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"  # IPv6
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        if port is not None and port != self.__DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{port}"
+        if parts.username:
+            userinfo = parts.username
+            if parts.password:
+                userinfo += f":{parts.password}"
+            host = f"{userinfo}@{host}"
+
+        return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
@@ -1,35 +1,64 @@
+from functools import lru_cache
 from lxml import etree
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+@lru_cache(maxsize=4096)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """XPath 문자열을 컴파일하고 프로세스 전역으로 메모이즈.
+
+    같은 표현식은 한 번만 컴파일되며, 컴파일된 객체는 스레드 간에 공유해도 안전합니다.
+
+    Args:
+        xpath (str): 컴파일할 XPath 문자열.
+
+    Returns:
+        etree.XPath: 컴파일된 XPath 객체.
+
+    Raises:
+        etree.XPathSyntaxError: XPath 구문 오류가 있는 경우 (캐시되지 않음).
+    """
+    return etree.XPath(xpath)
 
 
 @dataclass(frozen=True)
 class CrawlXpath:
-    """XPath 문자열을 감싸는 불변 데이터 클래스.
+    """XPath 문자열과 컴파일된 XPath 객체를 함께 보관하는 불변 데이터 클래스.
 
-    생성 시 유효한 XPath인지 검증합.
+    생성 시 유효한 XPath인지 검증합니다. 컴파일 결과는 프로세스 전역 캐시에서
+    재사용되므로 같은 표현식으로 여러 번 생성해도 컴파일은 한 번만 일어납니다.
 
     Attributes:
         str (str): XPath 표현 문자열.
+        compiled (etree.XPath): 컴파일된 XPath 객체. 요소를 인자로 호출해 평가합니다.
     """
 
     str: str
+    compiled: etree.XPath = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """객체 생성 후 XPath 유효성 검사 수행."""
-        self.__validate_xpath(self.str)
+        """객체 생성 후 XPath 유효성 검사 및 컴파일 수행."""
+        object.__setattr__(self, "compiled", self.__compile_xpath(self.str))
 
-    def __validate_xpath(self, xpath: str) -> None:
-        """XPath 문자열의 문법을 검증.
+    def __compile_xpath(self, xpath: str) -> etree.XPath:
+        """XPath 문자열의 문법을 검증하고 컴파일된 객체를 반환.
 
         Args:
             xpath (str): 검사할 XPath 문자열.
 
+        Returns:
+            etree.XPath: 컴파일된 XPath 객체.
+
         Raises:
             ValueError: XPath 구문 오류가 있는 경우.
         """
         try:
-            etree.XPath(xpath)
+            return _compile_xpath(xpath)
         except etree.XPathSyntaxError as e:
             raise ValueError(
                 f"[{self.__class__.__name__}] Invalid XPath: '{xpath}' - {e}"
             ) from e
+
+    def __reduce__(self):
+        # 컴파일된 etree.XPath는 pickle할 수 없으므로 문자열로 전달하고 받는 쪽에서 다시 컴파일
+        return self.__class__, (self.str,)
@@ -0,0 +1,94 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Set, Tuple, Union
+
+
+@dataclass(frozen=True)
+class LocalRoute:
+    """로컬 테스트 서버가 반환할 고정 응답.
+
+    Attributes:
+        body (bytes): 응답 본문.
+        status (int): HTTP 상태 코드.
+        headers (Dict[str, str]): 추가 응답 헤더.
+        delay (float): 응답 전 대기 시간(초).
+    """
+
+    body: bytes = b""
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        pass  # 제한 시간 테스트에서 클라이언트가 먼저 연결을 닫는 경우
+
+
+# 요청 헤더를 받아 LocalRoute를 반환하는 동적 라우트도 허용
+RouteHandler = Union[LocalRoute, Callable[[Dict[str, str]], LocalRoute]]
+
+
+class LocalHttpServer:
+    """테스트용 로컬 HTTP 서버.
+
+    경로별 라우트를 등록해 두고 별도 스레드에서 요청을 처리합니다.
+    CrawlUrl 검증을 통과하도록 경로는 `/page.html` 처럼 확장자를 포함해야 합니다.
+    """
+
+    def __init__(self, routes: Dict[str, RouteHandler]):
+        self.routes: Dict[str, RouteHandler] = routes
+        self.hits: Dict[str, int] = {}
+        self.peers: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                with server._lock:
+                    server.hits[path] = server.hits.get(path, 0) + 1
+                    server.peers.add(self.client_address)
+
+                route = server.routes.get(path, LocalRoute(b"not found", 404))
+                if callable(route):
+                    route = route(dict(self.headers.items()))
+                if route.delay:
+                    time.sleep(route.delay)
+
+                self.send_response(route.status)
+                headers = {"Content-Type": "text/html; charset=utf-8", **route.headers}
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                self.wfile.write(route.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self) -> "LocalHttpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,130 @@
+import socket
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+
+class LocalSocksServer:
+    """테스트용 로컬 SOCKS5 프록시 서버.
+
+    CONNECT 명령만 지원하며, 요청받은 대상에 연결해 양방향으로 데이터를 중계합니다.
+    credentials를 지정하면 사용자명/비밀번호 인증(RFC 1929)을 요구하고,
+    받은 사용자명을 usernames에 기록합니다 (Tor 스트림 격리 테스트용).
+    """
+
+    def __init__(self, credentials: bool = False):
+        self.credentials: bool = credentials
+        self.connections: int = 0
+        self.usernames: List[str] = []
+        self._lock = threading.Lock()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(64)
+        self.port: int = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._closed = False
+
+    def _serve(self) -> None:
+        while not self._closed:
+            try:
+                client, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def _handshake(self, client: socket.socket) -> Optional[Tuple[str, int]]:
+        version, count = self._recv_exact(client, 2)
+        methods = self._recv_exact(client, count)
+        method = 0x02 if self.credentials else 0x00
+        if version != 5 or method not in methods:
+            client.sendall(b"\x05\xff")
+            return None
+        client.sendall(bytes([5, method]))
+
+        if method == 0x02:
+            _, ulen = self._recv_exact(client, 2)
+            username = self._recv_exact(client, ulen).decode()
+            (plen,) = self._recv_exact(client, 1)
+            self._recv_exact(client, plen)
+            with self._lock:
+                self.usernames.append(username)
+            client.sendall(b"\x01\x00")
+
+        _, cmd, _, atyp = self._recv_exact(client, 4)
+        if atyp == 0x01:
+            host = socket.inet_ntoa(self._recv_exact(client, 4))
+        elif atyp == 0x03:
+            (length,) = self._recv_exact(client, 1)
+            host = self._recv_exact(client, length).decode()
+        else:
+            host = socket.inet_ntop(socket.AF_INET6, self._recv_exact(client, 16))
+        (port,) = struct.unpack(">H", self._recv_exact(client, 2))
+        if cmd != 0x01:
+            client.sendall(b"\x05\x07\x00\x01" + b"\x00" * 6)
+            return None
+        return host, port
+
+    def _handle(self, client: socket.socket) -> None:
+        with self._lock:
+            self.connections += 1
+        try:
+            target = self._handshake(client)
+            if target is None:
+                return
+            upstream = socket.create_connection(target, timeout=5)
+        except (OSError, ValueError):
+            client.close()
+            return
+
+        client.sendall(b"\x05\x00\x00\x01" + b"\x00" * 6)
+        threading.Thread(
+            target=self._pipe, args=(upstream, client), daemon=True
+        ).start()
+        self._pipe(client, upstream)
+
+    @staticmethod
+    def _pipe(source: socket.socket, target: socket.socket) -> None:
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, target):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+
+    def __enter__(self) -> "LocalSocksServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._closed = True
+        try:
+            # 대기 중인 accept()를 깨우기 위해 close 전에 shutdown
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        if self._thread.is_alive():
+            self._thread.join()
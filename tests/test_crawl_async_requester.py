@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from n3xt_crawler_py.web_crawler.crawl_async_requester import AsyncCrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+PAGE_COUNT = 8
+PAGE_DELAY = 0.2
+
+
+def make_slow_server() -> LocalHttpServer:
+    routes = {
+        f"/page{i}.html": LocalRoute(f"<p>page {i}</p>".encode(), delay=PAGE_DELAY)
+        for i in range(PAGE_COUNT)
+    }
+    return LocalHttpServer(routes)
+
+
+async def collect(requester: AsyncCrawlRequester, urls):
+    return [result async for result in requester.fetch_all(urls)]
+
+
+def test_fetch_all_returns_every_response():
+    """배치의 모든 URL이 CrawlResponse로 반환되는지 테스트."""
+    with make_slow_server() as server:
+        urls = [CrawlUrl(server.url(f"/page{i}.html")) for i in range(PAGE_COUNT)]
+        results = asyncio.run(collect(AsyncCrawlRequester(concurrency=4), urls))
+
+    assert len(results) == PAGE_COUNT
+    assert all(r.is_success() for r in results)
+
+    contents = sorted(r.response.get_content() for r in results)
+    assert contents == sorted(f"<p>page {i}</p>" for i in range(PAGE_COUNT))
+
+
+def test_concurrent_fetch_is_faster_than_sequential():
+    """동시 요청이 순차 요청보다 빠른지 로컬 서버로 처리량을 비교하는 테스트."""
+    with make_slow_server() as server:
+        urls = [CrawlUrl(server.url(f"/page{i}.html")) for i in range(PAGE_COUNT)]
+
+        started = time.perf_counter()
+        for url in urls:
+            CrawlRequester(url).get_response()
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = asyncio.run(collect(AsyncCrawlRequester(concurrency=PAGE_COUNT), urls))
+        concurrent = time.perf_counter() - started
+
+    assert len(results) == PAGE_COUNT
+    # 순차 요청은 최소 PAGE_COUNT * PAGE_DELAY 가 걸리므로 충분한 차이가 나야 함
+    assert sequential >= PAGE_COUNT * PAGE_DELAY
+    assert concurrent < sequential / 3
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
+from n3xt_crawler_py.web_crawler.crawl_batch_client import CrawlBatchClient
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+PAGE_COUNT = 6
+BLOCK_XPATH = "//div[@class='item']"
+FIELDS_MAP = {"title": "./h2/text()", "link": "./a/@href"}
+
+
+def make_page(page: int) -> bytes:
+    items = "".join(
+        f"<div class='item'><h2>p{page}-{i}</h2><a href='/{page}/{i}'>more</a></div>"
+        for i in range(3)
+    )
+    return f"<html><body>{items}</body></html>".encode("utf-8")
+
+
+def make_server() -> LocalHttpServer:
+    routes = {f"/list{i}.html": LocalRoute(make_page(i)) for i in range(PAGE_COUNT)}
+    routes["/broken.html"] = LocalRoute(b"missing", status=404)
+    return LocalHttpServer(routes)
+
+
+def test_batch_results_match_single_client():
+    """프로세스 풀에서 추출한 결과가 CrawlClient의 결과와 같은지 테스트."""
+    with make_server() as server:
+        urls = [server.url(f"/list{i}.html") for i in range(PAGE_COUNT)]
+        expected = {
+            url: CrawlClient(
+                url, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML
+            ).extract_fields(BLOCK_XPATH, FIELDS_MAP)
+            for url in urls
+        }
+
+        batch = CrawlBatchClient(
+            urls, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML, parse_workers=2
+        )
+        results = list(batch.extract_fields(BLOCK_XPATH, FIELDS_MAP))
+
+    assert len(results) == PAGE_COUNT
+    assert all(r.is_success() for r in results)
+    assert {r.url: r.records for r in results} == expected
+
+
+def test_compiled_xpath_specs_are_sent_to_workers():
+    """CrawlXpath 추출기도 pickle되어 프로세스 풀에서 같은 결과를 내는지 테스트."""
+    fields_map = {"title": CrawlXpath(".//h2/text()"), "link": "./a/@href"}
+    with make_server() as server:
+        urls = [server.url(f"/list{i}.html") for i in range(2)]
+        batch = CrawlBatchClient(
+            urls, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML, parse_workers=1
+        )
+        results = list(batch.extract_fields(BLOCK_XPATH, fields_map))
+
+    assert all(r.is_success() for r in results)
+    assert sorted(r.records[0]["title"][0] for r in results) == ["p0-0", "p1-0"]
+
+
+def test_failed_url_does_not_stop_batch():
+    """요청에 실패한 URL은 error로 전달되고 나머지는 정상 처리되는지 테스트."""
+    with make_server() as server:
+        urls = [server.url("/list0.html"), server.url("/broken.html")]
+        batch = CrawlBatchClient(urls, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = {
+                r.url: r for r in batch.extract_fields(BLOCK_XPATH, FIELDS_MAP, executor)
+            }
+
+    assert results[urls[0]].is_success()
+    assert len(results[urls[0]].records) == 3
+    assert not results[urls[1]].is_success()
+    assert results[urls[1]].error is not None
+
+
+def test_invalid_xpath_raises_before_request():
+    """XPath 구문 오류는 요청 전에 ValueError로 발생하는지 테스트."""
+    batch = CrawlBatchClient(
+        ["https://example.com/a.html"], CrawlRequestMode.DEFAULT, CrawlParseMode.HTML
+    )
+
+    with pytest.raises(ValueError):
+        next(batch.extract_fields("//div[", FIELDS_MAP))
+
+
+def test_invalid_concurrency_raises():
+    """동시성 값이 1보다 작으면 ValueError를 발생시키는지 테스트."""
+    with pytest.raises(ValueError):
+        CrawlBatchClient([], CrawlRequestMode.DEFAULT, CrawlParseMode.HTML, 0)
@@ -0,0 +1,128 @@
+from itertools import islice
+
+from n3xt_crawler_py.web_crawler.crawl_checkpoint import CrawlCheckpoint
+from n3xt_crawler_py.web_crawler.crawl_link_crawler import CrawlLinkCrawler
+from n3xt_crawler_py.web_crawler.crawl_seen_set import CrawlSeenSet
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+# p0 -> p1, p2 -> p3
+SITE = {
+    "/p0.html": ["/p1.html", "/p2.html"],
+    "/p1.html": ["/p3.html"],
+    "/p2.html": ["/p3.html"],
+    "/p3.html": [],
+}
+
+
+def make_server() -> LocalHttpServer:
+    routes = {}
+    for path, links in SITE.items():
+        anchors = "".join(f"<a href='{link}'>link</a>" for link in links)
+        routes[path] = LocalRoute(f"<html><body>{anchors}</body></html>".encode())
+    return LocalHttpServer(routes)
+
+
+def test_journal_replay_and_torn_line(tmp_path):
+    """저널을 다시 열면 상태가 복원되고 잘린 마지막 줄은 버려지는지 테스트."""
+    path = str(tmp_path / "crawl.journal")
+    with CrawlCheckpoint(path) as checkpoint:
+        assert checkpoint.add("http://a.com/1.html", 0)
+        assert checkpoint.add("http://a.com/2.html", 1)
+        assert not checkpoint.add("http://a.com/1.html", 0)
+        checkpoint.mark_done("http://a.com/1.html")
+
+    # 기록 도중 종료되어 마지막 줄이 잘린 상황
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "url": "http://a.c')
+
+    with CrawlCheckpoint(path) as checkpoint:
+        assert checkpoint.get_pending() == [("http://a.com/2.html", 1)]
+        assert checkpoint.is_done("http://a.com/1.html")
+        assert not checkpoint.add("http://a.com/1.html", 0)
+        checkpoint.add("http://a.com/3.html", 2)
+
+    with CrawlCheckpoint(path) as checkpoint:
+        assert checkpoint.get_pending() == [
+            ("http://a.com/2.html", 1),
+            ("http://a.com/3.html", 2),
+        ]
+
+
+def test_manual_commit_and_compact(tmp_path):
+    """auto_commit=False이면 commit() 전의 완료 표시가 기록되지 않고, compact가 상태를 유지하는지 테스트."""
+    path = str(tmp_path / "crawl.journal")
+    checkpoint = CrawlCheckpoint(path, auto_commit=False)
+    for i in range(10):
+        checkpoint.add(f"http://a.com/{i}.html", 0)
+    for i in range(5):
+        checkpoint.mark_done(f"http://a.com/{i}.html")
+    checkpoint.commit()
+    checkpoint.mark_done("http://a.com/5.html")  # 커밋하지 않음
+    checkpoint.close()
+
+    checkpoint = CrawlCheckpoint(path)
+    assert [url for url, _ in checkpoint.get_pending()] == [
+        f"http://a.com/{i}.html" for i in range(5, 10)
+    ]
+    checkpoint.mark_done("http://a.com/5.html")
+    checkpoint.compact()
+    with open(path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 10
+    checkpoint.close()
+
+    with CrawlCheckpoint(path) as checkpoint:
+        assert len(checkpoint) == 4
+        assert len(checkpoint.get_done()) == 6
+
+
+def test_crawler_resumes_without_refetching_completed_pages(tmp_path):
+    """중단된 크롤링을 다시 실행하면 완료된 페이지는 요청하지 않고 나머지만 이어서 수집하는지 테스트."""
+    path = str(tmp_path / "crawl.journal")
+    with make_server() as server:
+        seed = server.url("/p0.html")
+
+        with CrawlCheckpoint(path) as checkpoint:
+            crawler = CrawlLinkCrawler([seed], concurrency=1, checkpoint=checkpoint)
+            first = [page.url for page in islice(crawler.crawl(), 2)]
+        # 두 번째 페이지는 호출자가 처리를 마치기 전에 중단되었으므로 완료가 아님
+        assert first == [server.url("/p0.html"), server.url("/p1.html")]
+
+        with CrawlCheckpoint(path) as checkpoint:
+            crawler = CrawlLinkCrawler([seed], concurrency=1, checkpoint=checkpoint)
+            second = {page.url for page in crawler.crawl()}
+            assert len(checkpoint) == 0
+
+        assert second == {server.url(f"/p{i}.html") for i in (1, 2, 3)}
+        assert server.hits == {"/p0.html": 1, "/p1.html": 2, "/p2.html": 1, "/p3.html": 1}
+
+        # 모두 완료된 뒤 다시 실행하면 요청하지 않음
+        with CrawlCheckpoint(path) as checkpoint:
+            crawler = CrawlLinkCrawler([seed], checkpoint=checkpoint)
+            assert list(crawler.crawl()) == []
+
+
+def test_disk_seen_set_resumes_with_checkpoint(tmp_path):
+    """디스크 방문 집합을 체크포인트와 함께 쓰면 대기열에만 있던 URL도 다음 실행에서 요청하는지 테스트."""
+    journal = str(tmp_path / "crawl.journal")
+    seen_path = str(tmp_path / "seen.sqlite3")
+    with make_server() as server:
+        seed = server.url("/p0.html")
+
+        seen = CrawlSeenSet(capacity=100, exact_path=seen_path)
+        with CrawlCheckpoint(journal) as checkpoint:
+            crawler = CrawlLinkCrawler([seed], max_pages=1, seen=seen, checkpoint=checkpoint)
+            assert [page.url for page in crawler.crawl()] == [seed]
+        # crawl()이 끝나면 기록 대기 중인 해시도 기록됨
+        stored = CrawlSeenSet(capacity=100, exact_path=seen_path)
+        assert len(stored) == 3
+        stored.close()
+        seen.close()
+
+        seen = CrawlSeenSet(capacity=100, exact_path=seen_path)
+        with CrawlCheckpoint(journal) as checkpoint:
+            crawler = CrawlLinkCrawler([seed], seen=seen, checkpoint=checkpoint)
+            second = {page.url for page in crawler.crawl()}
+        seen.close()
+
+        assert second == {server.url(f"/p{i}.html") for i in (1, 2, 3)}
+        assert server.hits == {"/p0.html": 1, "/p1.html": 1, "/p2.html": 1, "/p3.html": 1}
@@ -0,0 +1,113 @@
+from array import array
+
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_field_column import CrawlFieldColumn
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+HTML = """
+<html><body>
+  <div class="item"><h2>one</h2><a href="/1">x</a>tail<ul><li>a</li><li>b</li></ul></div>
+  <div class="item"><h2>two</h2></div>
+  <div class="item"><a href="/3">y</a><ul><li>c</li></ul></div>
+</body></html>
+"""
+
+FIELDS = {
+    "title": CrawlXpath("./h2/text()"),
+    "link": CrawlXpath("./a/@href"),
+    "text": CrawlXpath("./text()"),
+    "tags": CrawlXpath(".//li/text()"),
+    "first_tag": CrawlXpath(".//li[1]"),
+    "links": CrawlXpath("count(./a)"),
+    "outside": CrawlXpath("../div/h2/text()"),
+}
+
+
+def per_block(parser: CrawlParser, block_xpath: CrawlXpath, fields):
+    blocks = parser.get_blocks(block_xpath)
+    return {
+        tag: [parser.extract_field(b, x) for b in blocks] for tag, x in fields.items()
+    }
+
+
+def test_columns_match_per_block_extraction():
+    """열 단위 추출이 블록별 추출과 같은 결과를 내는지 테스트."""
+    parser = CrawlParser(HTML, CrawlParseMode.HTML)
+    block_xpath = CrawlXpath("//div[@class='item']")
+
+    columns = parser.extract_columns(block_xpath, FIELDS)
+
+    assert columns == per_block(parser, block_xpath, FIELDS)
+    assert columns["title"] == [["one"], ["two"], []]
+    assert columns["tags"] == [["a", "b"], [], ["c"]]
+
+
+def test_nested_blocks():
+    """중첩 블록에서도 블록마다 독립된 결과를 내는지 테스트."""
+    parser = CrawlParser("<div><p>a<div><p>b</p></div></div>", CrawlParseMode.HTML)
+    block_xpath = CrawlXpath("//div")
+    fields = {"text": CrawlXpath(".//p/text()")}
+
+    columns = parser.extract_columns(block_xpath, fields)
+
+    assert columns == per_block(parser, block_xpath, fields)
+    assert columns["text"] == [["a", "b"], ["b"]]
+
+
+def test_invalid_field_xpath_raises():
+    """평가에 실패하는 필드 XPath는 ValueError를 발생시키는지 테스트."""
+    parser = CrawlParser(HTML, CrawlParseMode.HTML)
+
+    with pytest.raises(ValueError):
+        parser.extract_columns(CrawlXpath("//div"), {"x": CrawlXpath("$undefined")})
+
+
+def test_field_column_array_backed():
+    """CrawlFieldColumn이 오프셋 배열로 블록별 값을 복원하는지 테스트."""
+    column = CrawlFieldColumn.from_lists([["a", "b"], [], ["c"]])
+
+    assert len(column) == 3
+    assert column.get_values() == ["a", "b", "c"]
+    assert column.get_offsets() == array("q", [0, 2, 2, 3])
+    assert column[1] == [] and column[-1] == ["c"]
+    assert column.to_lists() == [["a", "b"], [], ["c"]]
+
+    with pytest.raises(ValueError):
+        CrawlFieldColumn(["a"], array("q", [0, 2]))
+
+
+def test_field_column_scalar_results():
+    """count(), string() 같은 스칼라 결과를 값 하나짜리 리스트로 보관하는지 테스트."""
+    column = CrawlFieldColumn.from_lists(["hello", ""])
+    assert column.to_lists() == [["hello"], [""]]
+
+    with LocalHttpServer({"/list.html": LocalRoute(HTML.encode("utf-8"))}) as server:
+        client = CrawlClient(
+            server.url("/list.html"), CrawlRequestMode.DEFAULT, CrawlParseMode.HTML
+        )
+        fields_map = {"links": "count(./a)", "title": "string(./h2)"}
+        arrays = client.extract_columns("//div[@class='item']", fields_map, True)
+
+    assert arrays["links"].to_lists() == [[1.0], [0.0], [1.0]]
+    assert arrays["title"].to_lists() == [["one"], ["two"], [""]]
+
+
+def test_client_extract_columns():
+    """CrawlClient.extract_columns가 extract_fields와 같은 데이터를 열 형태로 반환하는지 테스트."""
+    with LocalHttpServer({"/list.html": LocalRoute(HTML.encode("utf-8"))}) as server:
+        client = CrawlClient(
+            server.url("/list.html"), CrawlRequestMode.DEFAULT, CrawlParseMode.HTML
+        )
+        fields_map = {"title": "./h2/text()", "link": "./a/@href"}
+
+        rows = client.extract_fields("//div[@class='item']", fields_map)
+        columns = client.extract_columns("//div[@class='item']", fields_map)
+        arrays = client.extract_columns("//div[@class='item']", fields_map, True)
+
+    assert columns == {tag: [row[tag] for row in rows] for tag in fields_map}
+    assert arrays["link"].to_lists() == columns["link"]
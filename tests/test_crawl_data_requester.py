@@ -1,6 +1,7 @@
 from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
 from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequester
 from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
 
 
 def test_real_request():
@@ -18,3 +19,11 @@ def test_real_request():
 
     assert isinstance(content, str)
     assert "Example Domain" in content
+
+
+def test_get_response_returns_shared_instance():
+    """get_response()가 복사 없이 같은 응답 객체를 반환하는지 테스트."""
+    with LocalHttpServer({"/page.html": LocalRoute(b"<p>ok</p>")}) as server:
+        requester = CrawlRequester(CrawlUrl(server.url("/page.html")))
+
+    assert requester.get_response() is requester.get_response()
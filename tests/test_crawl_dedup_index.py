@@ -0,0 +1,61 @@
+import pytest
+
+from n3xt_crawler_py.data_processor.crawl_dedup_index import CrawlDedupIndex
+
+
+def make_records(start: int, stop: int):
+    return [{"title": [f"t{i}"], "link": [f"http://a.com/{i}"]} for i in range(start, stop)]
+
+
+def test_filter_new_persists_across_instances(tmp_path):
+    """다시 연 색인에서도 이미 본 레코드는 걸러지는지 테스트."""
+    db_path = str(tmp_path / "seen.db")
+
+    with CrawlDedupIndex(db_path) as index:
+        first = list(index.filter_new(make_records(0, 50), batch_size=7))
+
+    with CrawlDedupIndex(db_path) as index:
+        second = list(index.filter_new(make_records(25, 75), batch_size=7))
+        assert len(index) == 75
+
+    assert first == make_records(0, 50)
+    assert second == make_records(50, 75)
+
+
+def test_normalization_and_key_fields():
+    """키 순서와 무관하게 같은 레코드로 보고, key_fields만으로 중복을 판단하는지 테스트."""
+    with CrawlDedupIndex(":memory:") as index:
+        assert index.add({"a": 1, "b": [2]})
+        assert not index.add({"b": [2], "a": 1})
+        assert {"a": 1, "b": [2]} in index
+
+    with CrawlDedupIndex(":memory:", key_fields=["link"]) as index:
+        records = [
+            {"title": "old", "link": "/1"},
+            {"title": "new", "link": "/1"},
+            {"title": "other", "link": "/2"},
+        ]
+        assert [r["title"] for r in index.filter_new(records)] == ["old", "other"]
+
+
+def test_stopping_early_keeps_unconsumed_records_new():
+    """소비 도중 중단하면 받지 못한 레코드는 다음에 다시 반환되는지 테스트."""
+    with CrawlDedupIndex(":memory:") as index:
+        stream = index.filter_new(make_records(0, 10), batch_size=10)
+        taken = [next(stream), next(stream)]
+        stream.close()
+
+        rest = list(index.filter_new(make_records(0, 10)))
+
+    assert taken == make_records(0, 2)
+    assert rest == make_records(2, 10)
+
+
+def test_invalid_arguments():
+    """잘못된 인자에 ValueError를 발생시키는지 테스트."""
+    with pytest.raises(ValueError):
+        CrawlDedupIndex(":memory:", key_fields=[])
+
+    with CrawlDedupIndex(":memory:") as index:
+        with pytest.raises(ValueError):
+            list(index.filter_new([], batch_size=0))
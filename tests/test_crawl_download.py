@@ -0,0 +1,226 @@
+import gzip
+import itertools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_incremental_parser import CrawlIncrementalParser
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.utils import crawl_metrics
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_download import (
+    CrawlAcceptEncoding,
+    CrawlBodyTooLargeError,
+    CrawlDownloadLimits,
+)
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import (
+    CrawlBackoffRetryPolicy,
+    CrawlRetryError,
+)
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+ITEMS = "".join(
+    f"<div class='item'><h2>title {i}</h2><a href='/{i}'>x</a></div>" for i in range(500)
+)
+HTML = f"<html><body>{ITEMS}</body></html>"
+
+NO_RETRY = CrawlBackoffRetryPolicy(max_retries=0)
+
+
+@pytest.fixture
+def metrics():
+    metrics = crawl_metrics.enable()
+    yield metrics
+    crawl_metrics.disable()
+
+
+class StreamingServer:
+    """Content-Length 없이 chunked로 본문을 계속 흘려보내는 테스트 서버.
+
+    /endless.html은 끝나지 않는 본문을, /slow.html은 interval마다 한 바이트씩 보냅니다.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.hits = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.hits += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                chunk = b"x" * 8192 if self.path == "/endless.html" else b"x"
+                try:
+                    for _ in itertools.count():
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                        self.wfile.flush()
+                        if self.path == "/slow.html":
+                            time.sleep(interval)
+                except OSError:
+                    pass  # 클라이언트가 연결을 닫음
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> CrawlUrl:
+        host, port = self._server.server_address[:2]
+        return CrawlUrl(f"http://{host}:{port}{path}")
+
+    def __enter__(self) -> "StreamingServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_content_length_over_limit_is_not_retried():
+    """Content-Length가 최대 크기를 넘으면 본문을 받지 않고 재시도 없이 실패하는지 테스트."""
+    routes = {"/big.html": LocalRoute(b"x" * 10_000)}
+    with LocalHttpServer(routes) as server:
+        with pytest.raises(CrawlBodyTooLargeError):
+            CrawlRequester(
+                CrawlUrl(server.url("/big.html")),
+                limits=CrawlDownloadLimits(max_bytes=1000),
+            )
+        assert server.hits["/big.html"] == 1
+
+        response = CrawlRequester(
+            CrawlUrl(server.url("/big.html")),
+            limits=CrawlDownloadLimits(max_bytes=10_000),
+        ).get_response()
+        assert len(response.get_bytes()) == 10_000
+
+
+def test_endless_body_is_cut_at_max_bytes(metrics):
+    """끝나지 않는 응답도 최대 크기에서 다운로드를 중단하는지 테스트."""
+    with StreamingServer() as server:
+        with pytest.raises(CrawlBodyTooLargeError):
+            CrawlRequester(
+                server.url("/endless.html"),
+                limits=CrawlDownloadLimits(max_bytes=256 * 1024),
+            )
+        assert server.hits == 1
+        counters = metrics.snapshot()["counters"]
+        assert counters['crawl_download_aborted_total{mode="DEFAULT",reason="size"}'] == 1
+
+
+def test_slow_body_hits_total_timeout():
+    """데이터가 조금씩 계속 오더라도 전체 제한 시간에서 중단하고 재시도 정책을 따르는지 테스트."""
+    limits = CrawlDownloadLimits(read_timeout=1.0, total_timeout=0.3)
+    with StreamingServer(interval=0.05) as server:
+        started = time.perf_counter()
+        with pytest.raises(CrawlRetryError):
+            CrawlRequester(server.url("/slow.html"), retry_policy=NO_RETRY, limits=limits)
+        assert time.perf_counter() - started < 1.0
+
+
+def test_read_timeout():
+    """응답이 읽기 제한 시간보다 늦으면 시도가 실패하는지 테스트."""
+    routes = {"/late.html": LocalRoute(b"late", delay=0.5)}
+    with LocalHttpServer(routes) as server:
+        with pytest.raises(CrawlRetryError):
+            CrawlRequester(
+                CrawlUrl(server.url("/late.html")),
+                retry_policy=NO_RETRY,
+                limits=CrawlDownloadLimits(read_timeout=0.1),
+            )
+
+
+def test_incremental_parser_matches_full_parse():
+    """조각 단위로 넣어 만든 트리가 전체 파싱 결과와 같은지 테스트."""
+    body = HTML.encode("utf-8")
+    sink = CrawlIncrementalParser(CrawlParseMode.HTML)
+
+    # 재시도 시 이전 조각은 버려져야 함
+    sink.start(None)
+    sink.feed(b"<html><body><div class='item'><h2>stale")
+    sink.start("utf-8")
+    for i in range(0, len(body), 100):
+        sink.feed(body[i : i + 100])
+    sink.finish()
+
+    xpath = CrawlXpath("//div[@class='item']/h2/text()")
+    expected = CrawlParser(body, CrawlParseMode.HTML).get_blocks(xpath)
+    assert sink.get_parser().get_blocks(xpath) == expected
+
+    broken = CrawlIncrementalParser(CrawlParseMode.XML)
+    broken.start(None)
+    broken.feed(b"<rss><item></rss>")
+    broken.finish()
+    assert broken.get_parser() is None
+    assert broken.get_error() is not None
+
+
+def test_client_incremental_parse():
+    """incremental_parse 클라이언트가 다운로드 중 만든 트리로 같은 결과를 추출하는지 테스트."""
+    fields = {"title": "./h2/text()", "link": "./a/@href"}
+    with LocalHttpServer({"/list.html": LocalRoute(HTML.encode("utf-8"))}) as server:
+        url = server.url("/list.html")
+        limits = CrawlDownloadLimits(chunk_size=1024)
+        incremental = CrawlClient(
+            url,
+            CrawlRequestMode.DEFAULT,
+            CrawlParseMode.HTML,
+            limits=limits,
+            incremental_parse=True,
+        )
+        regular = CrawlClient(url, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML)
+
+        records = incremental.extract_fields("//div[@class='item']", fields)
+        assert len(records) == 500
+        assert records == regular.extract_fields("//div[@class='item']", fields)
+
+
+def test_accept_encoding():
+    """사용 가능한 압축 방식만 협상하고, 지원하지 않는 방식은 거부하는지 테스트."""
+    supported = CrawlAcceptEncoding.get_supported()
+    assert {"gzip", "deflate"} <= set(supported)
+    assert set(CrawlAcceptEncoding().get_encodings()) == set(supported)
+
+    assert CrawlAcceptEncoding(["GZIP", "gzip"]).get_header() == "gzip"
+    assert CrawlAcceptEncoding([]).get_header() == "identity"
+    with pytest.raises(ValueError):
+        CrawlAcceptEncoding(["compress"])
+    if "br" not in supported:
+        with pytest.raises(ValueError):
+            CrawlAcceptEncoding(["br"])
+
+
+def test_compressed_transfer_bytes(metrics):
+    """협상한 압축으로 받은 본문을 풀고, 전송 바이트와 해제 후 바이트를 따로 기록하는지 테스트."""
+    body = HTML.encode("utf-8")
+    compressed = gzip.compress(body)
+
+    def negotiate(headers):
+        if "gzip" in headers.get("Accept-Encoding", ""):
+            return LocalRoute(compressed, headers={"Content-Encoding": "gzip"})
+        return LocalRoute(body)
+
+    with LocalHttpServer({"/list.html": negotiate}) as server:
+        url = CrawlUrl(server.url("/list.html"))
+        gzipped = CrawlRequester(url).get_response()
+        plain = CrawlRequester(url, accept_encoding=CrawlAcceptEncoding([])).get_response()
+
+    assert gzipped.get_bytes() == plain.get_bytes() == body
+    counters = metrics.snapshot()["counters"]
+    gzip_labels = '{encoding="gzip",mode="DEFAULT"}'
+    identity_labels = '{encoding="identity",mode="DEFAULT"}'
+    assert counters["crawl_download_wire_bytes_total" + gzip_labels] == len(compressed)
+    assert counters["crawl_download_decoded_bytes_total" + gzip_labels] == len(body)
+    assert counters["crawl_download_wire_bytes_total" + identity_labels] == len(body)
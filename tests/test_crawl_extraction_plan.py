@@ -0,0 +1,75 @@
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_extraction_plan import CrawlExtractionPlan
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+HTML = """
+<html><head><title>shop</title><meta name="page" content="2"></head><body>
+  <div class="item"><h2>one</h2><a href="/1">x</a><span class="price">10</span></div>
+  <div class="item"><h2>two</h2><span class="price">20</span></div>
+  <nav><a href="/page/1">1</a><a href="/page/3">3</a></nav>
+</body></html>
+"""
+
+ITEMS = {"title": "./h2/text()", "link": "./a/@href"}
+PRICES = {"title": "./h2/text()", "price": ".//span[@class='price']/text()"}
+PAGES = {"href": "./@href"}
+
+
+def make_plan() -> CrawlExtractionPlan:
+    return (
+        CrawlExtractionPlan()
+        .add("items", "//div[@class='item']", ITEMS)
+        .add("prices", "//div[@class='item']", PRICES)
+        .add("pages", "//nav/a", PAGES)
+        .add("meta", "/html/head", {"title": "./title/text()", "links": "count(//a)"})
+    )
+
+
+def test_plan_matches_separate_extraction():
+    """계획 실행 결과가 항목별 extract_fields() 결과와 같은지 테스트."""
+    with LocalHttpServer({"/shop.html": LocalRoute(HTML.encode("utf-8"))}) as server:
+        client = CrawlClient(
+            server.url("/shop.html"), CrawlRequestMode.DEFAULT, CrawlParseMode.HTML
+        )
+        results = client.extract_plan(make_plan())
+
+        assert list(results) == ["items", "prices", "pages", "meta"]
+        assert results["items"] == client.extract_fields("//div[@class='item']", ITEMS)
+        assert results["prices"] == client.extract_fields(
+            "//div[@class='item']", PRICES
+        )
+        assert results["pages"] == [{"href": ["/page/1"]}, {"href": ["/page/3"]}]
+        assert results["meta"] == [{"title": ["shop"], "links": 3.0}]
+        assert server.hits["/shop.html"] == 1
+
+
+def test_shared_expressions_evaluated_once():
+    """같은 블록/필드 XPath는 한 번만 평가하고, 결과 리스트는 서로 독립인지 테스트."""
+    plan = make_plan()
+    assert len(plan) == 4
+    # 블록: item, nav/a, head / 필드: title, link, price, href, title, count
+    assert plan.get_evaluation_count() == (3, 6)
+
+    results = plan.run(CrawlParser(HTML, CrawlParseMode.HTML))
+    results["items"][0]["title"].append("changed")
+    assert results["prices"][0]["title"] == ["one"]
+
+
+def test_invalid_plan():
+    """이름 중복이나 잘못된 XPath는 ValueError를 발생시키는지 테스트."""
+    plan = CrawlExtractionPlan().add("items", "//div", ITEMS)
+
+    with pytest.raises(ValueError):
+        plan.add("items", "//p", ITEMS)
+    with pytest.raises(ValueError):
+        plan.add("bad", "//div[", ITEMS)
+    with pytest.raises(ValueError):
+        plan.add("bad", "//div", {"x": "./a[@"})
+
+    plan.add("unbound", "//div", {"x": "$undefined"})
+    with pytest.raises(ValueError):
+        plan.run(CrawlParser(HTML, CrawlParseMode.HTML))
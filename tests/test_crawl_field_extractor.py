@@ -0,0 +1,119 @@
+import pickle
+import re
+
+import pytest
+
+from n3xt_crawler_py.data_parser import crawl_field_extractor
+from n3xt_crawler_py.data_parser.crawl_extraction_plan import CrawlExtractionPlan
+from n3xt_crawler_py.data_parser.crawl_field_extractor import (
+    CrawlCssSelector,
+    CrawlFastField,
+    CrawlRegexField,
+    to_field_extractor,
+)
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+HTML = """
+<html><body>
+  <div class="item" id="a">head<h2>one<b>bold</b>tail<!-- c -->end</h2>mid<h2 lang="en"/>
+    <a href="/1" class="more">x</a><a>no href</a><span class="price">USD 12.50</span></div>
+  <div class="item"><span class="price">free</span></div>
+</body></html>
+"""
+
+FAST_XPATHS = [
+    "./text()",
+    "text()",
+    "./h2/text()",
+    "h2/text()",
+    "./@id",
+    "@missing",
+    "./a/@href",
+    "./h2/@lang",
+]
+
+
+@pytest.fixture
+def parser() -> CrawlParser:
+    return CrawlParser(HTML, CrawlParseMode.HTML)
+
+
+@pytest.mark.parametrize("xpath", FAST_XPATHS)
+def test_fast_path_matches_xpath(parser, xpath):
+    """빠른 경로 추출기가 같은 XPath와 동일한 결과를 내는지 테스트."""
+    fast = to_field_extractor(xpath)
+    assert isinstance(fast, CrawlFastField)
+
+    for block in parser.get_blocks(CrawlXpath("//div")):
+        assert fast.compiled(block) == CrawlXpath(xpath).compiled(block)
+
+
+def test_complex_xpath_is_not_fast_path():
+    """단순하지 않은 XPath는 일반 XPath 추출기로 남는지 테스트."""
+    for xpath in (".//h2/text()", "./h2[1]/text()", "./dc:title/text()", "count(./a)"):
+        assert isinstance(to_field_extractor(xpath), CrawlXpath)
+
+
+def test_regex_extractor(parser):
+    """정규식 추출기가 텍스트 노드에서 일치한 그룹만 반환하는지 테스트."""
+    price = CrawlRegexField(r"(?P<amount>\d+\.\d{2})", group="amount")
+    currency = CrawlRegexField(r"[A-Z]{3}", source="./span/text()")
+    blocks = parser.get_blocks(CrawlXpath("//div"))
+
+    assert [price.compiled(b) for b in blocks] == [["12.50"], []]
+    assert [currency.compiled(b) for b in blocks] == [["USD"], []]
+    assert pickle.loads(pickle.dumps(price)).compiled(blocks[0]) == ["12.50"]
+
+    with pytest.raises(ValueError):
+        CrawlRegexField(r"(\d+", group=1)
+    with pytest.raises(ValueError):
+        CrawlRegexField(r"\d+", group=1)
+    with pytest.raises(ValueError):
+        CrawlRegexField(r"\d+", flags=re.I, source="./[")
+
+
+def test_mixed_fields_map(parser):
+    """XPath, 빠른 경로, 정규식을 한 필드 맵에 섞어 쓸 수 있는지 테스트."""
+    plan = CrawlExtractionPlan().add(
+        "items",
+        "//div[@class='item']",
+        {
+            "title": "./h2/text()",
+            "link": "./a/@href",
+            "price": CrawlRegexField(r"\d+\.\d{2}"),
+            "spans": ".//span/text()",
+        },
+    )
+
+    assert plan.run(parser)["items"] == [
+        {
+            "title": ["one", "tail", "end"],
+            "link": ["/1"],
+            "price": ["12.50"],
+            "spans": ["USD 12.50"],
+        },
+        {"title": [], "link": [], "price": [], "spans": ["free"]},
+    ]
+
+
+def test_css_selector(parser):
+    """CSS 선택자가 한 번 변환된 XPath와 같은 결과를 내는지 테스트."""
+    pytest.importorskip("cssselect")
+    blocks = parser.get_blocks(CrawlXpath("//div"))
+
+    link = CrawlCssSelector("a.more", attr="href")
+    price = CrawlCssSelector("span.price, h2 b")
+
+    assert [link.compiled(b) for b in blocks] == [["/1"], []]
+    assert [price.compiled(b) for b in blocks] == [["bold", "USD 12.50"], ["free"]]
+    assert pickle.loads(pickle.dumps(link)).str == link.str
+    with pytest.raises(ValueError):
+        CrawlCssSelector("a[")
+
+
+def test_css_selector_without_cssselect(monkeypatch):
+    """cssselect가 없으면 설치 안내와 함께 ImportError를 발생시키는지 테스트."""
+    monkeypatch.setattr(crawl_field_extractor, "GenericTranslator", None)
+    with pytest.raises(ImportError, match="cssselect"):
+        CrawlCssSelector(".title")
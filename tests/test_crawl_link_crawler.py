@@ -0,0 +1,146 @@
+import sqlite3
+
+import pytest
+
+from n3xt_crawler_py.web_crawler.crawl_bloom_filter import CrawlBloomFilter
+from n3xt_crawler_py.web_crawler.crawl_link_crawler import CrawlLinkCrawler
+from n3xt_crawler_py.web_crawler.crawl_seen_set import CrawlSeenSet
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+# 페이지별 링크: p0 -> p1, p2 -> p3 -> p4 -> p5 (깊이 0~4)
+SITE = {
+    "/p0.html": [
+        "/p1.html",
+        "p2.html",
+        "/p1.html#top",  # 프래그먼트만 다른 중복 링크
+        "/p0.html",  # 자기 자신
+        "http://example.com/out.html",  # 허용되지 않은 호스트
+        "mailto:someone@example.com",
+    ],
+    "/p1.html": ["/p3.html"],
+    "/p2.html": ["/p3.html", "/p1.html"],
+    "/p3.html": ["/p4.html"],
+    "/p4.html": ["/p5.html"],
+    "/p5.html": [],
+}
+
+
+def make_server() -> LocalHttpServer:
+    routes = {}
+    for path, links in SITE.items():
+        anchors = "".join(f"<a href='{link}'>link</a>" for link in links)
+        routes[path] = LocalRoute(f"<html><body>{anchors}</body></html>".encode())
+    return LocalHttpServer(routes)
+
+
+def test_crawl_follows_links_with_depth_limit_and_dedup():
+    """깊이 제한 안의 페이지를 한 번씩만 요청하고 외부 호스트는 따라가지 않는지 테스트."""
+    with make_server() as server:
+        crawler = CrawlLinkCrawler([server.url("/p0.html")], max_depth=2)
+        pages = {page.url: page for page in crawler.crawl()}
+
+    expected = {server.url(f"/p{i}.html"): depth for i, depth in enumerate([0, 1, 1, 2])}
+    assert {url: page.depth for url, page in pages.items()} == expected
+    assert all(page.is_success() for page in pages.values())
+    # 중복 링크가 여러 번 나와도 각 페이지는 한 번만 요청
+    assert server.hits == {f"/p{i}.html": 1 for i in range(4)}
+    # 링크는 정규화되어 반환 (프래그먼트 제거, 다른 스킴 제외)
+    assert pages[server.url("/p0.html")].links == [
+        server.url("/p1.html"),
+        server.url("/p2.html"),
+        server.url("/p1.html"),
+        server.url("/p0.html"),
+        "http://example.com/out.html",
+    ]
+
+
+def test_crawl_max_pages_and_errors():
+    """max_pages 제한과 실패한 페이지 처리를 테스트."""
+    with make_server() as server:
+        crawler = CrawlLinkCrawler([server.url("/p0.html")], max_depth=5, max_pages=3)
+        assert len(list(crawler.crawl())) == 3
+        assert sum(server.hits.values()) == 3
+
+        server.routes["/p1.html"] = LocalRoute(b"gone", status=404)
+        crawler = CrawlLinkCrawler(
+            [server.url("/p0.html")], max_depth=1, allowed_hosts=["example.com"]
+        )
+        # 시드 호스트도 허용 목록에 없으면 요청하지 않음
+        assert list(crawler.crawl()) == []
+
+    with pytest.raises(ValueError):
+        CrawlLinkCrawler(["http://example.com/a.html"], concurrency=0)
+
+
+def test_seen_set_persists_and_counts_exact_lookups(tmp_path):
+    """방문 집합이 디스크에 유지되고 블룸 필터가 대부분의 정확한 조회를 생략하는지 테스트."""
+    path = str(tmp_path / "seen.sqlite3")
+    seen = CrawlSeenSet(capacity=1000, exact_path=path)
+    urls = [f"http://example.com/{i}.html" for i in range(1000)]
+
+    assert all(seen.add(url) for url in urls)
+    assert not any(seen.add(url) for url in urls)
+    assert len(seen) == 1000
+    # 새 URL 1000개 중 블룸 필터 오탐으로 인한 조회는 소수
+    assert seen.get_exact_lookups() < 1000 + 20
+    seen.close()
+
+    reopened = CrawlSeenSet(capacity=1000, exact_path=path)
+    assert urls[0] in reopened
+    assert "http://example.com/new.html" not in reopened
+    assert not reopened.add(urls[-1])
+    reopened.close()
+
+
+def test_seen_set_commits_in_batches(tmp_path):
+    """새 URL마다 커밋하지 않고 commit_every개마다, 그리고 flush()/close()에서 기록하는지 테스트."""
+    path = str(tmp_path / "seen.sqlite3")
+    seen = CrawlSeenSet(capacity=1000, exact_path=path, commit_every=100)
+
+    def stored() -> int:
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    assert all(seen.add(f"http://example.com/{i}.html") for i in range(250))
+    assert stored() == 200
+    # 기록 대기 중인 URL도 중복으로 판단
+    assert not seen.add("http://example.com/249.html")
+    assert "http://example.com/249.html" in seen
+    assert len(seen) == 250
+
+    seen.flush()
+    assert stored() == 250
+    seen.add("http://example.com/new.html")
+    seen.close()
+    assert stored() == 251
+
+    with pytest.raises(ValueError):
+        CrawlSeenSet(commit_every=0)
+
+
+def test_bloom_filter_and_url_normalization():
+    """블룸 필터에 거짓 음성이 없고 URL 정규화가 동작하는지 테스트."""
+    bloom = CrawlBloomFilter(capacity=500, error_rate=0.01)
+    for i in range(500):
+        bloom.add(f"item{i}")
+    assert all(f"item{i}" in bloom for i in range(500))
+    false_positives = sum(f"other{i}" in bloom for i in range(2000))
+    assert false_positives < 100
+
+    with pytest.raises(ValueError):
+        CrawlBloomFilter(capacity=0)
+
+    assert (
+        CrawlUrl("HTTP://Example.COM:80/a/b.html").get_normalized()
+        == "http://example.com/a/b.html"
+    )
+    assert CrawlUrl("example.com").get_normalized() == "http://example.com/"
+    assert (
+        CrawlUrl("http://Example.COM/a?b=1").get_normalized()
+        == "http://example.com/a?b=1"
+    )
+    assert (
+        CrawlUrl("https://example.com:8443/x.html").get_normalized()
+        == "https://example.com:8443/x.html"
+    )
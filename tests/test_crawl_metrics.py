@@ -0,0 +1,110 @@
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
+from n3xt_crawler_py.data_processor.crawl_data_process_manager import (
+    CrawlDataProcessManager,
+    ICrawlDataProcessor,
+)
+from n3xt_crawler_py.utils import crawl_metrics
+from n3xt_crawler_py.utils.crawl_metrics import CrawlMetrics
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import CrawlBackoffRetryPolicy
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+PAGE = (
+    b"<html><body><div class='item'><h2>a</h2></div>"
+    b"<div class='item'><h2>b</h2></div></body></html>"
+)
+
+
+class TitleProcessor(ICrawlDataProcessor):
+    def run(self, data):
+        return "title", data["title"][0].upper()
+
+    def get_unique_id(self):
+        return "title"
+
+
+@pytest.fixture
+def metrics():
+    metrics = crawl_metrics.enable()
+    yield metrics
+    crawl_metrics.disable()
+
+
+def test_pipeline_stages_are_recorded(metrics):
+    """요청, 재시도, 디코딩, 파싱, XPath, 프로세서 단계가 기록되는지 테스트."""
+    events = []
+    metrics.add_hook(events.append)
+    flaky = iter([LocalRoute(b"busy", status=503), LocalRoute(PAGE)])
+    routes = {"/list.html": lambda headers: next(flaky)}
+
+    with LocalHttpServer(routes) as server:
+        client = CrawlClient(
+            server.url("/list.html"),
+            CrawlRequestMode.DEFAULT,
+            CrawlParseMode.HTML,
+            retry_policy=CrawlBackoffRetryPolicy(base_delay=0.01, jitter=False),
+        )
+        records = client.extract_fields(
+            "//div[@class='item']", {"title": "./h2/text()"}
+        )
+
+    CrawlResponse.from_bytes(PAGE, text_encoding="utf-8").get_content()
+
+    manager = CrawlDataProcessManager()
+    manager.add(TitleProcessor())
+    assert [manager.run_all(r) for r in records] == [{"title": "A"}, {"title": "B"}]
+
+    snapshot = metrics.snapshot()
+    counters, timers = snapshot["counters"], snapshot["timers"]
+    assert counters['crawl_requests_total{mode="DEFAULT",outcome="ok"}'] == 1
+    assert counters['crawl_request_retries_total{mode="DEFAULT"}'] == 1
+    assert counters['crawl_retry_sleep_seconds_total{mode="DEFAULT"}'] == pytest.approx(0.01)
+    assert counters['crawl_response_bytes_total{mode="DEFAULT"}'] == len(PAGE)
+    assert timers['crawl_request_attempt_seconds{status="503"}']["count"] == 1
+    assert timers['crawl_request_attempt_seconds{status="200"}']["count"] == 1
+    assert timers["crawl_response_decode_seconds"]["count"] == 1
+    assert timers['crawl_parse_seconds{mode="HTML"}']["count"] == 1
+    assert timers['crawl_xpath_seconds{kind="block"}']["count"] == 1
+    assert timers['crawl_xpath_seconds{kind="field"}']["count"] == 2
+    assert timers['crawl_processor_seconds{processor="title"}']["count"] == 2
+    assert counters['crawl_processor_records_total{processor="title"}'] == 2
+
+    # 훅은 측정마다 호출됨
+    assert any(e.name == "crawl_parse_seconds" and e.kind == "timer" for e in events)
+
+
+def test_prometheus_format_and_reset():
+    """Prometheus 텍스트 형식 출력과 초기화를 테스트."""
+    metrics = CrawlMetrics()
+    metrics.increment("jobs_total", 2, queue='a"b')
+    with metrics.timer("step_seconds", stage="parse"):
+        pass
+    metrics.observe("step_seconds", 2.5, stage="parse")
+
+    text = metrics.to_prometheus()
+    assert "# TYPE jobs_total counter\n" in text
+    assert 'jobs_total{queue="a\\"b"} 2\n' in text
+    assert "# TYPE step_seconds summary\n" in text
+    assert 'step_seconds_count{stage="parse"} 2\n' in text
+    assert 'step_seconds_max{stage="parse"} 2.5\n' in text
+
+    metrics.reset()
+    assert metrics.snapshot() == {"counters": {}, "timers": {}}
+    assert metrics.to_prometheus() == ""
+
+
+def test_disabled_metrics_record_nothing():
+    """비활성 상태에서는 아무것도 기록되지 않는지 테스트."""
+    metrics = CrawlMetrics()
+    crawl_metrics.enable(metrics)
+    crawl_metrics.disable()
+    assert crawl_metrics.get_active() is None
+
+    manager = CrawlDataProcessManager()
+    manager.add(TitleProcessor())
+    manager.run_all({"title": ["x"]})
+    assert metrics.snapshot() == {"counters": {}, "timers": {}}
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 from n3xt_crawler_py.data_processor.crawl_data_process_manager import (
     CrawlDataProcessManager,
@@ -83,3 +85,171 @@ def test_run_all_with_duplicate_key_should_raise():
         manager.run_all({})
 
     assert "Duplicate key" in str(e.value)
+
+
+class UpperProcessor(ICrawlDataProcessor):
+    """run_many로 묶음을 한 번에 처리하는 프로세서 (프로세스 풀용으로 모듈 수준 정의)."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def run(self, data: dict):
+        return "upper", data["name"].upper()
+
+    def run_many(self, data_list):
+        self.batch_sizes.append(len(data_list))
+        return [("upper", d["name"].upper()) for d in data_list]
+
+    def get_unique_id(self):
+        return "upper"
+
+
+class LengthProcessor(ICrawlDataProcessor):
+    def run(self, data: dict):
+        return "length", len(data["name"])
+
+    def get_unique_id(self):
+        return "length"
+
+
+def make_records(count: int):
+    return ({"name": f"name{i}"} for i in range(count))
+
+
+def expected_results(count: int):
+    return [{"upper": f"NAME{i}", "length": len(f"name{i}")} for i in range(count)]
+
+
+def test_run_batch_streams_results_in_order():
+    """run_batch가 제너레이터 입력을 묶음으로 처리하고 입력 순서대로 반환하는지 테스트."""
+    manager = CrawlDataProcessManager()
+    upper = UpperProcessor()
+    manager.add(upper)
+    manager.add(LengthProcessor())
+
+    results = list(manager.run_batch(make_records(25), chunk_size=10))
+
+    assert results == expected_results(25)
+    # run_many가 묶음 단위로 호출되어야 함
+    assert upper.batch_sizes == [10, 10, 5]
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_run_batch_with_executor(executor_cls):
+    """스레드/프로세스 풀에서 실행해도 결과와 순서가 같은지 테스트."""
+    manager = CrawlDataProcessManager()
+    manager.add(UpperProcessor())
+    manager.add(LengthProcessor())
+
+    with executor_cls(max_workers=2) as executor:
+        results = list(manager.run_batch(make_records(500), executor, chunk_size=7))
+
+    assert results == expected_results(500)
+
+
+def test_run_batch_duplicate_key_and_validation():
+    """run_batch에서도 중복 키 검사와 입력 검증이 동작하는지 테스트."""
+    manager = CrawlDataProcessManager()
+
+    with pytest.raises(RuntimeError):
+        manager.run_batch([{}])
+
+    manager.add(UpperProcessor())
+    with pytest.raises(ValueError):
+        manager.run_batch([{}], chunk_size=0)
+
+    class SameKeyProcessor(LengthProcessor):
+        def run(self, data):
+            return "upper", None
+
+    manager.add(SameKeyProcessor())
+    with pytest.raises(KeyError) as e:
+        list(manager.run_batch(make_records(3)))
+
+    assert "Duplicate key" in str(e.value)
+
+
+class GraphProcessor(ICrawlDataProcessor):
+    """입력 결과 키를 선언하고 실행 횟수를 기록하는 의존성 그래프용 프로세서."""
+
+    def __init__(self, key, inputs=(), func=None):
+        self.__key = key
+        self.__inputs = list(inputs)
+        self.__func = func
+        self.calls = 0
+
+    def run(self, data):
+        return self.run_with_inputs(data, {})
+
+    def run_with_inputs(self, data, inputs):
+        self.calls += 1
+        return self.__key, self.__func(data, inputs)
+
+    def get_unique_id(self):
+        return self.__key
+
+    def get_input_keys(self):
+        return self.__inputs
+
+
+def make_graph_manager():
+    manager = CrawlDataProcessManager()
+    nodes = {
+        "clean": GraphProcessor("clean", func=lambda d, i: d["title"].strip().lower()),
+        "words": GraphProcessor("words", ["clean"], lambda d, i: i["clean"].split()),
+        "slug": GraphProcessor("slug", ["words"], lambda d, i: "-".join(i["words"])),
+        "count": GraphProcessor("count", ["words"], lambda d, i: len(i["words"])),
+        "unused": GraphProcessor("unused", func=lambda d, i: 1 / 0),
+    }
+    for node in nodes.values():
+        manager.add(node)
+    return manager, nodes
+
+
+def test_run_for_runs_only_needed_processors_once():
+    """요청한 키에 필요한 프로세서만 실행되고 공유 중간 결과는 한 번만 계산되는지 테스트."""
+    manager, nodes = make_graph_manager()
+
+    result = manager.run_for({"title": "  Hello Big World "}, ["slug", "count"])
+
+    assert result == {"slug": "hello-big-world", "count": 3}
+    assert nodes["clean"].calls == 1
+    assert nodes["words"].calls == 1
+    assert nodes["unused"].calls == 0
+
+
+def test_run_for_with_executor_runs_independent_branches():
+    """실행기를 지정해도 같은 결과를 내는지 테스트."""
+    manager, _ = make_graph_manager()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = [
+            manager.run_for({"title": f"a b {i}"}, ["count", "slug"], executor)
+            for i in range(20)
+        ]
+
+    assert results == [{"count": 3, "slug": f"a-b-{i}"} for i in range(20)]
+
+
+def test_run_for_graph_errors():
+    """순환 의존성, 없는 키, 선언과 다른 반환 키를 검출하는지 테스트."""
+    manager = CrawlDataProcessManager()
+    manager.add(GraphProcessor("a", ["b"], lambda d, i: 0))
+    manager.add(GraphProcessor("b", ["a"], lambda d, i: 0))
+
+    with pytest.raises(ValueError) as e:
+        manager.run_for({}, ["a"])
+    assert "cycle" in str(e.value)
+
+    with pytest.raises(KeyError):
+        manager.run_for({}, ["missing"])
+
+    class WrongKeyProcessor(GraphProcessor):
+        def run_with_inputs(self, data, inputs):
+            return "other", None
+
+    manager = CrawlDataProcessManager()
+    manager.add(WrongKeyProcessor("c"))
+    with pytest.raises(KeyError) as e:
+        manager.run_for({}, ["c"])
+    assert "declared" in str(e.value)
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from n3xt_crawler_py.web_crawler.crawl_async_requester import AsyncCrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_host_scheduler import CrawlHostScheduler
+from n3xt_crawler_py.web_crawler.crawl_rate_limiter import CrawlRateLimiter
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+
+class FakeClock:
+    """sleep() 호출만큼 시간이 흐르는 가짜 시계."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """burst만큼 즉시 허용한 뒤 속도에 맞춰 대기 시간을 반환하는지 테스트."""
+    clock = FakeClock()
+    limiter = CrawlRateLimiter(rate=2.0, burst=2, clock=clock)
+
+    assert limiter.try_acquire("a.com") == 0.0
+    assert limiter.try_acquire("a.com") == 0.0
+    assert limiter.try_acquire("a.com") == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert limiter.try_acquire("a.com") == 0.0
+
+    # 다른 호스트는 독립된 버킷을 가짐
+    assert limiter.try_acquire("b.com") == 0.0
+
+
+def test_acquire_sleeps_until_token_available():
+    """acquire()가 토큰이 찰 때까지 대기하는지 테스트."""
+    clock = FakeClock()
+    limiter = CrawlRateLimiter(rate=1.0, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("a.com") == 0.0
+    assert limiter.acquire("a.com") == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_scheduler_interleaves_hosts():
+    """스케줄러가 호스트를 번갈아 가며 URL을 내보내는지 테스트."""
+    scheduler = CrawlHostScheduler()
+    scheduler.add_all(CrawlUrl(f"http://a.com/{i}") for i in range(3))
+    scheduler.add_all(CrawlUrl(f"http://b.com/{i}") for i in range(2))
+
+    hosts = []
+    while len(scheduler):
+        url, _ = scheduler.next_ready()
+        hosts.append(url.get_host())
+        scheduler.done(url)
+
+    assert hosts == ["a.com", "b.com", "a.com", "b.com", "a.com"]
+
+
+def test_rate_limited_host_does_not_starve_others():
+    """느린(속도 제한된) 호스트가 있어도 다른 호스트 URL이 먼저 나가는지 테스트."""
+    clock = FakeClock()
+    limiter = CrawlRateLimiter(
+        rate=100.0, burst=1, host_rates={"slow.com": 0.5}, clock=clock
+    )
+    scheduler = CrawlHostScheduler(limiter)
+    scheduler.add_all(CrawlUrl(f"http://slow.com/{i}") for i in range(2))
+    scheduler.add_all(CrawlUrl(f"http://fast.com/{i}") for i in range(2))
+
+    first, _ = scheduler.next_ready()
+    assert first.get_host() == "slow.com"
+
+    # slow.com은 2초 뒤에야 토큰이 생기므로 fast.com이 먼저 나감
+    second, _ = scheduler.next_ready()
+    assert second.get_host() == "fast.com"
+
+    clock.now = 0.01
+    third, _ = scheduler.next_ready()
+    assert third.get_host() == "fast.com"
+
+    url, wait = scheduler.next_ready()
+    assert url is None
+    assert wait == pytest.approx(1.99)
+
+
+def test_scheduler_respects_max_per_host():
+    """호스트별 동시 요청 수 상한을 지키는지 테스트."""
+    scheduler = CrawlHostScheduler(max_per_host=1)
+    scheduler.add_all(CrawlUrl(f"http://a.com/{i}") for i in range(2))
+
+    first, _ = scheduler.next_ready()
+    assert scheduler.next_ready() == (None, 0.0)
+
+    scheduler.done(first)
+    second, _ = scheduler.next_ready()
+    assert second.get_url() == "http://a.com/1"
+
+
+def test_async_requester_applies_rate_limit():
+    """AsyncCrawlRequester가 호스트별 속도 제한을 적용해 모든 URL을 처리하는지 테스트."""
+    routes = {f"/p{i}.html": LocalRoute(b"<p>ok</p>") for i in range(4)}
+    with LocalHttpServer(routes) as server:
+        urls = [CrawlUrl(server.url(f"/p{i}.html")) for i in range(4)]
+        requester = AsyncCrawlRequester(
+            concurrency=4, rate_limiter=CrawlRateLimiter(rate=50.0), max_per_host=2
+        )
+
+        async def collect():
+            return [r async for r in requester.fetch_all(urls)]
+
+        results = asyncio.run(collect())
+
+    assert sorted(r.url.get_url() for r in results) == sorted(u.get_url() for u in urls)
+    assert all(r.is_success() for r in results)
@@ -0,0 +1,88 @@
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_replay_archive import (
+    CrawlReplayArchive,
+    CrawlReplayMode,
+)
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+PAGE = "<html><body>" + "".join(
+    f"<div class='item'><h2>제목 {i}</h2></div>" for i in range(50)
+) + "</body></html>"
+BLOCK_XPATH = "//div[@class='item']"
+FIELDS_MAP = {"title": "./h2/text()"}
+
+
+def make_server() -> LocalHttpServer:
+    return LocalHttpServer(
+        {
+            "/list.html": LocalRoute(
+                PAGE.encode("euc-kr"),
+                headers={"Content-Type": "text/html; charset=euc-kr"},
+            ),
+            "/other.html": LocalRoute(b"<html><body>other</body></html>"),
+        }
+    )
+
+
+def test_record_then_replay_without_network(tmp_path):
+    """기록한 응답을 서버 없이 같은 결과로 재생하는지 테스트."""
+    path = str(tmp_path / "pages.rpl")
+    with make_server() as server:
+        url = server.url("/list.html")
+        with CrawlReplayArchive(path, CrawlReplayMode.RECORD) as archive:
+            live = CrawlClient(
+                url, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML, replay=archive
+            ).extract_fields(BLOCK_XPATH, FIELDS_MAP)
+            CrawlRequester(CrawlUrl(server.url("/other.html")), replay=archive)
+            assert len(archive) == 2
+
+    # 서버가 종료된 뒤에도 재생 가능
+    with CrawlReplayArchive(path) as archive:
+        requester = CrawlRequester(CrawlUrl(url), replay=archive)
+        assert requester.is_from_replay()
+        assert requester.get_response().get_content() == PAGE
+        assert requester.get_response().get_encoding() == "euc-kr"
+
+        replayed = CrawlClient(
+            url, CrawlRequestMode.DEFAULT, CrawlParseMode.HTML, replay=archive
+        ).extract_fields(BLOCK_XPATH, FIELDS_MAP)
+        assert replayed == live
+
+        with pytest.raises(RuntimeError) as e:
+            CrawlRequester(CrawlUrl("http://example.com/missing.html"), replay=archive)
+        assert "not found in replay archive" in str(e.value)
+
+        with pytest.raises(RuntimeError):
+            archive.record(url, None)
+
+
+def test_archive_recovers_from_truncated_tail(tmp_path):
+    """기록 도중 잘린 마지막 항목을 버리고 이어서 기록할 수 있는지 테스트."""
+    path = str(tmp_path / "pages.rpl")
+    with make_server() as server:
+        with CrawlReplayArchive(path, CrawlReplayMode.RECORD) as archive:
+            CrawlRequester(CrawlUrl(server.url("/list.html")), replay=archive)
+            CrawlRequester(CrawlUrl(server.url("/other.html")), replay=archive)
+
+        with open(path, "r+b") as f:
+            f.truncate(f.seek(0, 2) - 5)
+
+        with CrawlReplayArchive(path, CrawlReplayMode.RECORD) as archive:
+            assert archive.get_urls() == [server.url("/list.html")]
+            CrawlRequester(CrawlUrl(server.url("/other.html")), replay=archive)
+
+    with CrawlReplayArchive(path) as archive:
+        assert len(archive) == 2
+        assert b"other" in archive.get(server.url("/other.html")).get_bytes()
+
+    not_archive = tmp_path / "plain.txt"
+    not_archive.write_bytes(b"hello world")
+    with pytest.raises(ValueError):
+        CrawlReplayArchive(str(not_archive))
+    with pytest.raises(FileNotFoundError):
+        CrawlReplayArchive(str(tmp_path / "missing.rpl"))
@@ -1,7 +1,14 @@
+import copy
+import pickle
+
+import pytest
+import requests
 from requests import Response
 from requests.models import PreparedRequest
 from io import BytesIO
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
 from n3xt_crawler_py.web_crawler.crawl_response import CrawlResponse
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
 
 
 def make_fake_response(content: str, content_type: str = "application/xml") -> Response:
@@ -54,3 +61,81 @@ def test_non_utf8_fallback():
     crawl_resp = CrawlResponse(response)
 
     assert "café" in crawl_resp.get_content()
+
+
+def test_raw_bytes_and_declared_charset():
+    """원본 바이트와 Content-Type에 명시된 charset을 그대로 제공하는지 테스트."""
+    content = "<p>한글</p>"
+    response = make_fake_response(content, "text/html; charset=EUC-KR")
+    response._content = content.encode("euc-kr")
+    crawl_resp = CrawlResponse(response)
+
+    assert crawl_resp.get_bytes() == content.encode("euc-kr")
+    assert crawl_resp.get_encoding() == "EUC-KR"
+
+    # charset이 없으면 None (파서가 문서 선언을 따르도록)
+    plain = CrawlResponse(make_fake_response(content, "text/html"))
+    assert plain.get_encoding() is None
+
+
+def test_content_is_decoded_lazily_without_sniffing(monkeypatch):
+    """인코딩이 주어지면 문자셋 추정 없이 처음 요청할 때 한 번만 디코딩하는지 테스트."""
+    def fail_detect(_):
+        raise AssertionError("charset sniffing should not run")
+
+    monkeypatch.setattr(requests.compat.chardet, "detect", fail_detect)
+    crawl_resp = CrawlResponse(make_fake_response("<p>ok</p>", "text/html"))
+
+    assert crawl_resp.get_content() is crawl_resp.get_content()
+
+
+def test_parser_reads_bytes_with_encoding_hint():
+    """파서가 바이트와 인코딩 힌트(또는 XML 선언)로 직접 파싱하는지 테스트."""
+    html = "<html><body><p>한글</p></body></html>".encode("euc-kr")
+    parser = CrawlParser(html, CrawlParseMode.HTML, "euc-kr")
+    assert parser.get_blocks(CrawlXpath("//p/text()")) == ["한글"]
+
+    xml = '<?xml version="1.0" encoding="ISO-8859-1"?><a><b>café</b></a>'
+    parser = CrawlParser(xml.encode("iso-8859-1"), CrawlParseMode.XML)
+    assert parser.get_blocks(CrawlXpath("//b/text()")) == ["café"]
+
+    # 인코딩 선언이 있는 XML 문자열도 파싱 가능
+    parser = CrawlParser(xml, CrawlParseMode.XML)
+    assert parser.get_blocks(CrawlXpath("//b/text()")) == ["café"]
+
+
+def test_response_is_immutable_and_shared_without_copy():
+    """CrawlResponse가 불변이며 복사 없이 공유되는지 테스트."""
+    crawl_resp = CrawlResponse(make_fake_response("<p>ok</p>", "text/html"))
+
+    # 슬롯 기반이라 임의 속성을 추가할 수 없음
+    assert not hasattr(crawl_resp, "__dict__")
+    with pytest.raises(AttributeError):
+        crawl_resp.extra = 1
+
+    # 설정된 내부 속성도 바꾸거나 지울 수 없음 (지연 디코딩 결과 포함)
+    crawl_resp.get_content()
+    for name in ("_CrawlResponse__body", "_CrawlResponse__content"):
+        with pytest.raises(AttributeError):
+            setattr(crawl_resp, name, b"changed")
+        with pytest.raises(AttributeError):
+            delattr(crawl_resp, name)
+
+    assert copy.copy(crawl_resp) is crawl_resp
+    assert copy.deepcopy(crawl_resp) is crawl_resp
+    assert crawl_resp.get_content() == "<p>ok</p>"
+
+    # 프로세스 간 전달(pickle) 후에도 같은 값
+    restored = pickle.loads(pickle.dumps(crawl_resp))
+    assert restored == crawl_resp
+    assert restored.get_content() == "<p>ok</p>"
+
+
+def test_from_bytes_builds_equivalent_response():
+    """from_bytes()로 만든 응답이 requests.Response 기반 응답과 같은지 테스트."""
+    content = "<p>café</p>"
+    response = make_fake_response(content, "text/html; charset=utf-8")
+
+    assert CrawlResponse.from_bytes(
+        content.encode("utf-8"), 200, "text/html; charset=utf-8"
+    ) == CrawlResponse(response)
@@ -0,0 +1,101 @@
+import requests
+
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_response_cache import CrawlResponseCache
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+FEED = b"<rss><channel><item><title>a</title></item></channel></rss>"
+
+
+def etag_route(headers):
+    if headers.get("If-None-Match") == '"v1"':
+        return LocalRoute(b"", 304, {"ETag": '"v1"'})
+    return LocalRoute(FEED, 200, {"ETag": '"v1"', "Content-Type": "application/xml"})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_response(body: bytes, etag: str = None) -> requests.Response:
+    resp = requests.Response()
+    resp._content = body
+    resp.status_code = 200
+    resp.encoding = "utf-8"
+    if etag:
+        resp.headers["ETag"] = etag
+    return resp
+
+
+def test_fresh_entry_skips_network(tmp_path):
+    """TTL 이내의 캐시 항목은 네트워크 요청 없이 반환되는지 테스트."""
+    cache = CrawlResponseCache(str(tmp_path), ttl=60)
+    with LocalHttpServer({"/feed.xml": etag_route}) as server:
+        url = CrawlUrl(server.url("/feed.xml"))
+        first = CrawlRequester(url, cache=cache)
+        second = CrawlRequester(url, cache=cache)
+
+        assert server.hits["/feed.xml"] == 1
+
+    assert not first.is_from_cache()
+    assert second.is_from_cache()
+    assert second.get_response().get_content() == FEED.decode()
+
+
+def test_stale_entry_is_revalidated_with_304(tmp_path):
+    """TTL이 지난 항목은 If-None-Match로 재검증하고 304면 캐시 본문을 반환하는지 테스트."""
+    cache = CrawlResponseCache(str(tmp_path), ttl=0)
+    seen_headers = []
+
+    def route(headers):
+        seen_headers.append(headers.get("If-None-Match"))
+        return etag_route(headers)
+
+    with LocalHttpServer({"/feed.xml": route}) as server:
+        url = CrawlUrl(server.url("/feed.xml"))
+        CrawlRequester(url, cache=cache)
+        revalidated = CrawlRequester(url, cache=cache)
+
+    assert seen_headers == [None, '"v1"']
+    assert revalidated.is_from_cache()
+    assert revalidated.get_response().status() == 200
+    assert revalidated.get_response().get_content() == FEED.decode()
+
+
+def test_lru_eviction_by_size(tmp_path):
+    """총 크기를 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트."""
+    clock = FakeClock()
+    cache = CrawlResponseCache(str(tmp_path), max_bytes=10, ttl=60, clock=clock)
+
+    cache.store("http://a.com/1", make_response(b"aaaa"))
+    cache.store("http://a.com/2", make_response(b"bbbb"))
+    # 1번을 사용하면 2번이 가장 오래된 항목이 됨
+    assert cache.get_fresh("http://a.com/1") is not None
+    cache.store("http://a.com/3", make_response(b"cccc"))
+
+    assert "http://a.com/1" in cache
+    assert "http://a.com/2" not in cache
+    assert "http://a.com/3" in cache
+    assert cache.get_total_bytes() == 8
+
+
+def test_index_is_restored_from_disk(tmp_path):
+    """새 캐시 인스턴스가 디스크의 항목과 검증 헤더를 복원하는지 테스트."""
+    clock = FakeClock()
+    CrawlResponseCache(str(tmp_path), clock=clock).store(
+        "http://a.com/feed.xml", make_response(FEED, etag='"v1"')
+    )
+
+    reopened = CrawlResponseCache(str(tmp_path), ttl=60, clock=clock)
+
+    assert len(reopened) == 1
+    assert reopened.get_conditional_headers("http://a.com/feed.xml") == {
+        "If-None-Match": '"v1"'
+    }
+    clock.now += 61
+    assert reopened.get_fresh("http://a.com/feed.xml") is None
@@ -0,0 +1,100 @@
+import socket
+import time
+
+import pytest
+import requests
+
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import (
+    CrawlBackoffRetryPolicy,
+    CrawlRetryError,
+)
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+
+def test_permanent_errors_are_not_retried():
+    """404 같은 영구 오류는 재시도하지 않는지 테스트."""
+    policy = CrawlBackoffRetryPolicy()
+
+    assert policy.get_delay(1, 404, {}) is None
+    assert policy.get_delay(1, 403, {}) is None
+
+
+def test_exponential_backoff_without_jitter():
+    """일시 오류에 대해 대기 시간이 2배씩 늘고 상한에서 멈추는지 테스트."""
+    policy = CrawlBackoffRetryPolicy(
+        max_retries=5, base_delay=1.0, max_delay=5.0, jitter=False
+    )
+
+    delays = [policy.get_delay(attempt, 503, {}) for attempt in range(1, 7)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0, None]
+
+
+def test_jitter_scales_backoff():
+    """지터가 백오프 범위 안에서 난수로 대기 시간을 줄이는지 테스트."""
+    policy = CrawlBackoffRetryPolicy(base_delay=2.0, rng=lambda: 0.25)
+
+    assert policy.get_delay(2, None, {}) == pytest.approx(1.0)
+
+
+def test_retry_after_is_honoured_and_capped():
+    """Retry-After 값 이상 대기하고, 상한을 넘으면 포기하는지 테스트."""
+    policy = CrawlBackoffRetryPolicy(base_delay=0.1, jitter=False, max_retry_after=60)
+
+    assert policy.get_delay(1, 429, {"Retry-After": "7"}) == 7.0
+    assert policy.get_delay(1, 503, {"Retry-After": "3600"}) is None
+    # 해석할 수 없는 값은 무시하고 백오프 사용
+    assert policy.get_delay(1, 503, {"Retry-After": "soon"}) == pytest.approx(0.1)
+
+
+def test_requester_fails_fast_on_404():
+    """죽은 URL(404)에 대해 대기 없이 즉시 실패하는지 테스트."""
+    with LocalHttpServer({}) as server:
+        started = time.perf_counter()
+        with pytest.raises(CrawlRetryError) as e:
+            CrawlRequester(CrawlUrl(server.url("/missing.html")))
+        elapsed = time.perf_counter() - started
+
+    assert e.value.retries == 0
+    assert e.value.last_status == 404
+    assert e.value.__cause__ is None
+    assert elapsed < 1.0
+
+
+def test_retry_error_keeps_last_exception():
+    """연결 오류로 끝나면 마지막 예외를 메시지와 __cause__로 전달하는지 테스트."""
+    # 바로 닫은 포트로 연결을 거부하게 함
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    with pytest.raises(CrawlRetryError) as e:
+        CrawlRequester(
+            CrawlUrl(f"http://127.0.0.1:{port}/page.html"),
+            retry_policy=CrawlBackoffRetryPolicy(max_retries=0),
+        )
+
+    assert e.value.last_status is None
+    assert isinstance(e.value.__cause__, requests.ConnectionError)
+    assert "ConnectionError" in str(e.value)
+
+
+def test_requester_reports_retries_and_sleep_time():
+    """일시 오류 후 성공하면 재시도 횟수와 대기 시간이 노출되는지 테스트."""
+    statuses = iter([503, 503])
+
+    def flaky(headers):
+        status = next(statuses, 200)
+        return LocalRoute(b"<p>ok</p>", status, {"Retry-After": "0"})
+
+    with LocalHttpServer({"/flaky.html": flaky}) as server:
+        requester = CrawlRequester(
+            CrawlUrl(server.url("/flaky.html")),
+            retry_policy=CrawlBackoffRetryPolicy(base_delay=0.01, jitter=False),
+        )
+
+    assert requester.get_response().get_content() == "<p>ok</p>"
+    assert requester.get_retry_count() == 2
+    assert requester.get_sleep_time() == pytest.approx(0.03)
@@ -0,0 +1,84 @@
+import requests
+
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_session_pool import CrawlSessionPool
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_same_mode_and_host_share_session():
+    """같은 (모드, 호스트)는 같은 세션을, 다른 호스트는 다른 세션을 받는지 테스트."""
+    with CrawlSessionPool() as pool:
+        s1 = pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+        s2 = pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+        s3 = pool.get_session(CrawlRequestMode.DEFAULT, "b.com", requests.session)
+        s4 = pool.get_session(CrawlRequestMode.TOR, "a.com", requests.session)
+
+        assert s1 is s2
+        assert s1 is not s3
+        assert s1 is not s4
+        assert len(pool) == 3
+
+
+def test_idle_sessions_are_evicted():
+    """유휴 시간이 지난 세션이 제거되고 새 세션이 만들어지는지 테스트."""
+    clock = FakeClock()
+    pool = CrawlSessionPool(idle_timeout=10.0, clock=clock)
+
+    first = pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+    clock.now = 5.0
+    assert pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session) is first
+
+    # 마지막 사용(5초) 이후 10초가 지나면 제거
+    clock.now = 15.0
+    assert pool.evict_idle() == 1
+    assert len(pool) == 0
+    assert pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session) is not first
+
+
+def test_max_sessions_evicts_least_recently_used():
+    """최대 세션 수를 넘으면 가장 오래 사용하지 않은 세션이 제거되는지 테스트."""
+    pool = CrawlSessionPool(max_sessions=2)
+    a = pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+    pool.get_session(CrawlRequestMode.DEFAULT, "b.com", requests.session)
+    pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+    pool.get_session(CrawlRequestMode.DEFAULT, "c.com", requests.session)
+
+    assert len(pool) == 2
+    assert pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session) is a
+
+
+def test_evicted_session_is_not_closed_under_its_user():
+    """최대 개수 초과로 제거된 세션을 사용 중인 쪽의 연결이 끊기지 않는지 테스트."""
+    routes = {"/a.html": LocalRoute(b"a"), "/b.html": LocalRoute(b"b")}
+    with LocalHttpServer(routes) as server, CrawlSessionPool(max_sessions=1) as pool:
+        in_use = pool.get_session(CrawlRequestMode.DEFAULT, "a.com", requests.session)
+        assert in_use.get(server.url("/a.html")).content == b"a"
+
+        pool.get_session(CrawlRequestMode.DEFAULT, "b.com", requests.session)
+        assert len(pool) == 1
+
+        # 제거된 세션도 같은 keep-alive 연결로 계속 요청 가능
+        assert in_use.get(server.url("/b.html")).content == b"b"
+        assert len(server.peers) == 1
+        in_use.close()
+
+
+def test_requesters_reuse_one_connection_through_pool():
+    """풀을 공유하는 여러 CrawlRequester가 하나의 TCP 연결을 재사용하는지 테스트."""
+    routes = {f"/page{i}.html": LocalRoute(b"<p>ok</p>") for i in range(5)}
+    with LocalHttpServer(routes) as server, CrawlSessionPool() as pool:
+        for i in range(5):
+            url = CrawlUrl(server.url(f"/page{i}.html"))
+            CrawlRequester(url, session_pool=pool).get_response()
+
+        assert sum(server.hits.values()) == 5
+        assert len(server.peers) == 1
@@ -0,0 +1,82 @@
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.data_parser.crawl_stream_parser import CrawlStreamParser
+from n3xt_crawler_py.web_crawler.crawl_client import CrawlClient
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+from tests.local_http_server import LocalHttpServer, LocalRoute
+
+
+def make_rss(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>t{i}</title><link>http://a.com/{i}</link></item>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<rss><channel><title>feed</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def chunked(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+FIELDS = {"title": CrawlXpath("./title/text()"), "link": CrawlXpath("./link/text()")}
+
+
+def test_stream_results_match_tree_parser():
+    """스트리밍 결과가 전체 트리 파싱 결과와 같은지 테스트."""
+    doc = make_rss(50)
+    tree = CrawlParser(doc, CrawlParseMode.XML)
+    expected = [
+        {tag: tree.extract_field(block, x) for tag, x in FIELDS.items()}
+        for block in tree.get_blocks(CrawlXpath("//item"))
+    ]
+
+    stream = CrawlStreamParser("/rss/channel/item", CrawlParseMode.XML)
+    assert list(stream.iter_fields(chunked(doc, 37), FIELDS)) == expected
+
+
+def test_processed_elements_are_released():
+    """처리한 블록이 트리에서 제거되어 메모리가 일정하게 유지되는지 테스트."""
+    stream = CrawlStreamParser("//item", CrawlParseMode.XML)
+
+    max_preceding = 0
+    for block in stream.iter_blocks(chunked(make_rss(2000), 512)):
+        max_preceding = max(max_preceding, block.getparent().index(block))
+
+    # 앞서 처리한 블록은 제거되고 직전 요소 정도만 남아 있어야 함
+    assert max_preceding <= 2
+
+
+def test_nested_blocks_and_html_mode():
+    """중첩 블록과 HTML 모드(자동 html/body 삽입)를 처리하는지 테스트."""
+    html = b"<div><p>a<div><p>b</p></div></p></div><p>c</p>"
+    stream = CrawlStreamParser("//p", CrawlParseMode.HTML)
+
+    texts = [block.xpath("string(.)") for block in stream.iter_blocks([html])]
+
+    assert sorted(texts) == ["a", "b", "c"]
+
+
+def test_non_streamable_block_xpath_raises():
+    """술어나 함수가 포함된 블록 경로는 ValueError를 발생시키는지 테스트."""
+    with pytest.raises(ValueError) as e:
+        CrawlStreamParser("//item[1]", CrawlParseMode.XML)
+
+    assert "not streamable" in str(e.value)
+
+
+def test_client_iter_extract_fields():
+    """CrawlClient의 제너레이터 추출이 extract_fields와 같은 결과를 내는지 테스트."""
+    with LocalHttpServer({"/rss.xml": LocalRoute(make_rss(20))}) as server:
+        client = CrawlClient(
+            server.url("/rss.xml"), CrawlRequestMode.DEFAULT, CrawlParseMode.XML
+        )
+        fields_map = {"title": "./title/text()"}
+
+        streamed = list(client.iter_extract_fields("//item", fields_map))
+
+    assert streamed == [{"title": [f"t{i}"]} for i in range(20)]
@@ -0,0 +1,125 @@
+import random
+import socket
+import threading
+
+import pytest
+
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import CrawlBackoffRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_tor_circuit_pool import CrawlTorCircuitPool
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+from tests.local_socks_server import LocalSocksServer
+
+
+class FakeControlServer:
+    """AUTHENTICATE/SIGNAL 명령에 응답하는 가짜 Tor 제어 포트."""
+
+    def __init__(self, password: str):
+        self.password = password
+        self.commands = []
+        self._sock = socket.socket()
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(4)
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn, conn.makefile("rb") as reader:
+                authed = False
+                for raw in reader:
+                    line = raw.decode().strip()
+                    self.commands.append(line)
+                    if line.startswith("AUTHENTICATE"):
+                        authed = line == f'AUTHENTICATE "{self.password}"'
+                        conn.sendall(b"250 OK\r\n" if authed else b"515 Bad auth\r\n")
+                    elif line == "QUIT":
+                        conn.sendall(b"250 closing connection\r\n")
+                        break
+                    else:
+                        conn.sendall(b"250 OK\r\n" if authed else b"514 Auth required\r\n")
+
+    def close(self):
+        self._sock.shutdown(socket.SHUT_RDWR)
+        self._sock.close()
+
+
+def test_requests_use_isolated_circuits():
+    """요청마다 회로별 SOCKS 사용자명으로 접속해 여러 회로에 분산되는지 테스트."""
+    routes = {"/page.html": LocalRoute(b"<html><body>ok</body></html>")}
+    with LocalHttpServer(routes) as server, LocalSocksServer(credentials=True) as socks:
+        pool = CrawlTorCircuitPool(circuits=4, ports=[socks.port], rng=random.Random(0))
+        for _ in range(12):
+            CrawlRequester(
+                CrawlUrl(server.url("/page.html")),
+                CrawlRequestMode.TOR,
+                retry_policy=CrawlBackoffRetryPolicy(max_retries=0),
+                tor_proxy=pool,
+            )
+
+    stats = pool.get_stats()
+    assert server.hits["/page.html"] == 12
+    assert len(set(socks.usernames)) > 1
+    assert set(socks.usernames) <= {s.username for s in stats}
+    assert sum(s.requests for s in stats) == 12
+    assert all(s.inflight == 0 and s.latency is not None for s in stats if s.requests)
+
+
+def test_routes_away_from_slow_and_failing_circuits():
+    """느린 회로를 피하고, 실패가 잦은 회로는 새 사용자명의 회로로 교체하는지 테스트."""
+    with LocalSocksServer() as socks:
+        pool = CrawlTorCircuitPool(circuits=2, ports=[socks.port], rng=random.Random(0))
+        slow, fast = pool.get_proxy_url(), pool.get_proxy_url()
+        pool.report(slow, True, 5.0)
+        pool.report(fast, True, 0.1)
+        assert slow != fast
+
+        # 두 회로 중 지연이 작은 회로가 선택됨
+        assert all(pool.get_proxy_url() == fast for _ in range(3))
+        for _ in range(3):
+            pool.report(fast, True, 0.1)
+
+        before = {s.username for s in pool.get_stats()}
+        for _ in range(5):
+            url = pool.get_proxy_url()
+            pool.report(slow, False, 1.0)
+            pool.report(url, True, 0.1)
+        after = {s.username for s in pool.get_stats()}
+
+    assert len(after) == 2
+    assert slow.split("//")[1].split(":")[0] not in after
+    assert after != before
+
+
+def test_new_identity_via_control_port():
+    """제어 포트로 인증 후 NEWNYM을 보내고, 인증 실패 시 RuntimeError가 발생하는지 테스트."""
+    control = FakeControlServer("secret")
+    try:
+        with LocalSocksServer() as socks:
+            pool = CrawlTorCircuitPool(
+                circuits=2,
+                ports=[socks.port],
+                control_port=control.port,
+                control_password="secret",
+            )
+            before = {s.username for s in pool.get_stats()}
+            pool.new_identity()
+            assert control.commands[:2] == ['AUTHENTICATE "secret"', "SIGNAL NEWNYM"]
+            assert {s.username for s in pool.get_stats()}.isdisjoint(before)
+
+            wrong = CrawlTorCircuitPool(
+                ports=[socks.port], control_port=control.port, control_password="x"
+            )
+            with pytest.raises(RuntimeError) as e:
+                wrong.new_identity()
+            assert "AUTHENTICATE" in str(e.value)
+
+            with pytest.raises(RuntimeError):
+                CrawlTorCircuitPool(ports=[socks.port]).new_identity()
+    finally:
+        control.close()
@@ -0,0 +1,90 @@
+import socket
+
+import pytest
+
+from n3xt_crawler_py.web_crawler.crawl_requester import CrawlRequestMode, CrawlRequester
+from n3xt_crawler_py.web_crawler.crawl_retry_policy import CrawlBackoffRetryPolicy
+from n3xt_crawler_py.web_crawler.crawl_tor_proxy_pool import CrawlTorProxyPool
+from n3xt_crawler_py.web_crawler.crawl_url import CrawlUrl
+from tests.local_http_server import LocalHttpServer, LocalRoute
+from tests.local_socks_server import LocalSocksServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_probe_result_is_cached_until_ttl():
+    """SOCKS5 핸드셰이크 검사 결과가 TTL 동안 재사용되는지 테스트."""
+    clock = FakeClock()
+    dead = closed_port()
+    with LocalSocksServer() as socks:
+        pool = CrawlTorProxyPool([socks.port, dead], ttl=5.0, clock=clock)
+
+        assert pool.get_healthy_ports() == [socks.port]
+        assert pool.get_healthy_ports() == [socks.port]
+        # 두 번째 조회는 캐시를 사용하므로 검사 연결은 한 번뿐
+        assert socks.connections == 1
+
+        health = pool.get_health()
+        assert health[socks.port].healthy and health[socks.port].latency is not None
+        assert not health[dead].healthy and health[dead].error
+
+    # 서버가 종료되어도 TTL 이내에는 캐시된 상태를 사용
+    assert pool.is_healthy(socks.port)
+    clock.now = 5.0
+    assert not pool.is_healthy(socks.port)
+
+
+def test_round_robin_skips_unhealthy_ports():
+    """정상 포트를 번갈아 반환하고, 정상 포트가 없으면 RuntimeError가 발생하는지 테스트."""
+    dead = closed_port()
+    with LocalSocksServer() as a, LocalSocksServer() as b:
+        pool = CrawlTorProxyPool([a.port, dead, b.port])
+        urls = [pool.get_proxy_url() for _ in range(4)]
+
+    assert urls == [
+        f"socks5h://127.0.0.1:{a.port}",
+        f"socks5h://127.0.0.1:{b.port}",
+        f"socks5h://127.0.0.1:{a.port}",
+        f"socks5h://127.0.0.1:{b.port}",
+    ]
+
+    with pytest.raises(RuntimeError) as e:
+        CrawlTorProxyPool([dead]).get_proxy_url()
+    assert "no SOCKS port is reachable" in str(e.value)
+
+    with pytest.raises(ValueError):
+        CrawlTorProxyPool([])
+
+
+def test_tor_requests_are_distributed_over_socks_ports():
+    """TOR 모드 요청이 여러 SOCKS 프록시에 분배되어 대상 서버에 도달하는지 테스트."""
+    routes = {"/page.html": LocalRoute(b"<html><body>ok</body></html>")}
+    with LocalHttpServer(routes) as server, LocalSocksServer() as a, LocalSocksServer() as b:
+        pool = CrawlTorProxyPool([a.port, b.port])
+        pool.get_healthy_ports()
+        probes = (a.connections, b.connections)
+
+        for _ in range(4):
+            response = CrawlRequester(
+                CrawlUrl(server.url("/page.html")),
+                CrawlRequestMode.TOR,
+                retry_policy=CrawlBackoffRetryPolicy(max_retries=0),
+                tor_proxy=pool,
+            ).get_response()
+            assert "ok" in response.get_content()
+
+        assert server.hits["/page.html"] == 4
+        assert a.connections - probes[0] >= 2
+        assert b.connections - probes[1] >= 2
@@ -0,0 +1,168 @@
+import os
+
+import pytest
+
+from n3xt_crawler_py.utils.crawl_save import save_dict_list_as_file
+from n3xt_crawler_py.utils.crawl_writer import (
+    CrawlBinaryEncoder,
+    CrawlCompression,
+    CrawlCsvEncoder,
+    CrawlJsonlEncoder,
+    CrawlRecordWriter,
+    iter_records,
+)
+
+RECORDS = [
+    {"title": [f"제목 {i}"], "link": [f"http://a.com/{i}"], "note": "line\nbreak"}
+    for i in range(100)
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("encoder", [CrawlJsonlEncoder(), CrawlBinaryEncoder()])
+def test_round_trip(tmp_path, encoder):
+    """기록한 레코드를 같은 형식으로 다시 읽을 수 있는지 테스트."""
+    with CrawlRecordWriter(str(tmp_path), encoder, buffer_bytes=512) as writer:
+        assert writer.write_many(iter(RECORDS)) == len(RECORDS)
+
+    (path,) = writer.get_paths()
+    assert path.endswith(encoder.get_extension())
+    assert list(iter_records(path, encoder)) == RECORDS
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [CrawlJsonlEncoder(), CrawlCsvEncoder(["title", "note"]), CrawlBinaryEncoder()],
+)
+@pytest.mark.parametrize("compression", [CrawlCompression.GZIP, CrawlCompression.ZSTD])
+def test_compressed_round_trip(tmp_path, encoder, compression):
+    """압축해 기록한 파일을 iter_records()가 자동으로 풀어 읽고, 교체 시 파일마다 완결되는지 테스트."""
+    if compression == CrawlCompression.ZSTD:
+        pytest.importorskip("zstandard")
+
+    records = [{"title": record["title"][0], "note": record["note"]} for record in RECORDS]
+    plain = CrawlRecordWriter(str(tmp_path / "plain"), encoder)
+    with plain:
+        plain.write_many(records)
+    with CrawlRecordWriter(
+        str(tmp_path / "packed"), encoder, compression=compression, buffer_bytes=256
+    ) as writer:
+        writer.write_many(records[:50])
+        writer.flush()
+        writer.write_many(records[50:])
+
+    (plain_path,) = plain.get_paths()
+    (path,) = writer.get_paths()
+    assert path.endswith(encoder.get_extension() + compression.value)
+    assert os.path.getsize(path) < os.path.getsize(plain_path)
+    assert list(iter_records(path, encoder)) == list(iter_records(plain_path, encoder))
+
+    rotating = CrawlRecordWriter(
+        str(tmp_path / "rotated"), encoder, max_bytes=1000, compression=compression
+    )
+    with rotating:
+        rotating.write_many(records)
+    paths = rotating.get_paths()
+    assert len(paths) > 1
+    read = [record for path in paths for record in iter_records(path, encoder)]
+    assert read == list(iter_records(plain_path, encoder))
+
+
+def test_gzip_header_has_final_name(tmp_path):
+    """gzip 헤더의 원본 파일 이름이 `.part` 임시 이름이 아닌 최종 이름인지 테스트."""
+    encoder = CrawlJsonlEncoder()
+    with CrawlRecordWriter(
+        str(tmp_path), encoder, compression=CrawlCompression.GZIP
+    ) as writer:
+        writer.write(RECORDS[0])
+
+    (path,) = writer.get_paths()
+    with open(path, "rb") as f:
+        header = f.read(512)
+    assert header[3] & 0x08  # FNAME 플래그
+    stored_name = header[10 : header.index(b"\0", 10)].decode()
+    assert stored_name == os.path.basename(path)[: -len(".gz")]
+
+
+def test_csv_round_trip_as_strings(tmp_path):
+    """CSV는 헤더를 쓰고 문자열이 아닌 값을 JSON 문자열로 읽어오는지 테스트."""
+    encoder = CrawlCsvEncoder(["title", "note"])
+    with CrawlRecordWriter(str(tmp_path), encoder) as writer:
+        writer.write({"title": ["a", "b"], "note": "x,y\nz"})
+
+    (path,) = writer.get_paths()
+    assert list(iter_records(path, encoder)) == [{"title": '["a", "b"]', "note": "x,y\nz"}]
+
+    with pytest.raises(ValueError):
+        with CrawlRecordWriter(str(tmp_path), encoder) as writer:
+            writer.write({"unknown": "x"})
+
+
+def test_size_rotation_and_part_files(tmp_path):
+    """크기 제한을 넘으면 파일을 교체하고, 쓰는 중인 파일만 .part로 남는지 테스트."""
+    encoder = CrawlJsonlEncoder()
+    writer = CrawlRecordWriter(str(tmp_path), encoder, max_bytes=1000, buffer_bytes=0)
+    writer.write_many(RECORDS)
+
+    # 아직 닫지 않았으므로 마지막 파일은 .part 상태
+    assert sum(name.endswith(".part") for name in os.listdir(tmp_path)) == 1
+
+    paths = writer.close()
+    assert len(paths) > 1
+    assert not any(name.endswith(".part") for name in os.listdir(tmp_path))
+    assert all(os.path.getsize(p) < 1000 + 200 for p in paths)
+
+    restored = [r for p in paths for r in iter_records(p, encoder)]
+    assert restored == RECORDS
+
+
+def test_time_rotation(tmp_path):
+    """시간 제한이 지나면 새 파일로 교체되는지 테스트."""
+    clock = FakeClock()
+    with CrawlRecordWriter(
+        str(tmp_path), CrawlJsonlEncoder(), max_seconds=60, clock=clock
+    ) as writer:
+        writer.write(RECORDS[0])
+        clock.now += 30
+        writer.write(RECORDS[1])
+        clock.now += 31
+        writer.write(RECORDS[2])
+
+    assert len(writer.get_paths()) == 2
+
+
+def test_unique_names_and_empty_writer(tmp_path):
+    """같은 시각에 만든 기록기도 이름이 겹치지 않고, 빈 기록기는 파일을 만들지 않는지 테스트."""
+    clock = FakeClock()
+    paths = []
+    for i in range(3):
+        with CrawlRecordWriter(str(tmp_path), CrawlJsonlEncoder(), clock=clock) as writer:
+            writer.write({"i": i})
+        paths += writer.get_paths()
+
+    assert len(set(paths)) == 3
+
+    with CrawlRecordWriter(str(tmp_path / "empty"), CrawlJsonlEncoder()) as writer:
+        pass
+    assert writer.get_paths() == []
+    assert os.listdir(tmp_path / "empty") == []
+
+    with pytest.raises(RuntimeError):
+        writer.write({"i": 0})
+
+
+def test_save_dict_list_as_file_does_not_overwrite(tmp_path):
+    """같은 초에 여러 번 저장해도 파일이 덮어써지지 않는지 테스트."""
+    with pytest.warns(DeprecationWarning):
+        first = save_dict_list_as_file([{"a": 1}], str(tmp_path))
+        second = save_dict_list_as_file([{"a": 2}], str(tmp_path))
+
+    assert first != second
+    assert len(os.listdir(tmp_path)) == 2
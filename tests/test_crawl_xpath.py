@@ -0,0 +1,51 @@
+import pytest
+
+from n3xt_crawler_py.data_parser.crawl_parser import CrawlParseMode, CrawlParser
+from n3xt_crawler_py.web_crawler.crawl_xpath import CrawlXpath
+
+HTML = """
+<html><body>
+  <div class="item"><a href="/1">one</a></div>
+  <div class="item"><a href="/2">two</a></div>
+</body></html>
+"""
+
+
+def test_same_expression_shares_compiled_xpath():
+    """같은 XPath 문자열은 프로세스 전역 캐시의 컴파일 객체를 공유하는지 테스트."""
+    x1 = CrawlXpath(".//a/@href")
+    x2 = CrawlXpath(".//a/@href")
+
+    assert x1 == x2
+    assert hash(x1) == hash(x2)
+    assert x1.compiled is x2.compiled
+
+
+def test_invalid_xpath_raises_value_error():
+    """구문 오류가 있는 XPath는 ValueError를 발생시키는지 테스트."""
+    with pytest.raises(ValueError) as e:
+        CrawlXpath("//div[")
+
+    assert "Invalid XPath" in str(e.value)
+
+
+def test_parser_evaluates_compiled_xpath():
+    """파서가 컴파일된 XPath로 블록과 필드를 추출하는지 테스트."""
+    parser = CrawlParser(HTML, CrawlParseMode.HTML)
+
+    blocks = parser.get_blocks(CrawlXpath("//div[@class='item']"))
+    hrefs = [parser.extract_field(b, CrawlXpath("./a/@href")) for b in blocks]
+    texts = [parser.extract_field(b, CrawlXpath("./a/text()")) for b in blocks]
+
+    assert hrefs == [["/1"], ["/2"]]
+    assert texts == [["one"], ["two"]]
+
+
+def test_parser_wraps_evaluation_errors():
+    """평가 단계 오류(정의되지 않은 변수 등)를 ValueError로 감싸는지 테스트."""
+    parser = CrawlParser(HTML, CrawlParseMode.HTML)
+
+    with pytest.raises(ValueError) as e:
+        parser.get_blocks(CrawlXpath("//div[@id=$missing]"))
+
+    assert "Invalid block XPath" in str(e.value)